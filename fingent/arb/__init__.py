@@ -8,14 +8,25 @@ Components:
 - risk: Risk filtering (volume, spread, depth)
 - engine: Main arbitrage engine
 - snapshot: Market snapshot storage
+- book: Columnar per-market price arrays
 """
 
 from fingent.arb.strategy import TermStructureStrategy
 from fingent.arb.risk import RiskManager
+from fingent.arb.book import MarketBook
 from fingent.arb.engine import ArbEngine
+from fingent.arb.snapshot import (
+    SnapshotStore,
+    InMemorySnapshotStore,
+    RedisSnapshotStore,
+)
 
 __all__ = [
     "TermStructureStrategy",
     "RiskManager",
+    "MarketBook",
     "ArbEngine",
+    "SnapshotStore",
+    "InMemorySnapshotStore",
+    "RedisSnapshotStore",
 ]
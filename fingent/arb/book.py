@@ -0,0 +1,136 @@
+"""
+Columnar market book for arbitrage detection.
+
+Per-market floats (baseline and latest quote) are kept in parallel
+float32 arrays indexed by market_id, so deltas for a whole event are a
+single vectorized subtraction instead of per-object attribute reads.
+"""
+
+import threading
+from typing import Iterable
+
+import numpy as np
+
+from fingent.domain.models import ArbSnapshot, PolymarketQuote
+
+
+class MarketBook:
+    """
+    Struct-of-arrays view of tracked markets.
+
+    Rows are assigned when a market's snapshot is first recorded and
+    recycled when the snapshot expires and the market is removed.
+    float32 is plenty for probabilities in [0, 1]; callers that need
+    exact values (thresholds, reporting) should read the quote and
+    snapshot objects.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        Initialize market book.
+
+        Args:
+            capacity: Initial number of rows (grows by doubling)
+        """
+        self.market_ids: list[str] = []
+        self.idx: dict[str, int] = {}
+        self.p0 = np.full(capacity, np.nan, dtype=np.float32)
+        self.volume0 = np.zeros(capacity, dtype=np.float32)
+        self.mid = np.full(capacity, np.nan, dtype=np.float32)
+        self.volume_24h = np.zeros(capacity, dtype=np.float32)
+        self.spread_bps = np.zeros(capacity, dtype=np.float32)
+        self._free: list[int] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.idx)
+
+    def __contains__(self, market_id: str) -> bool:
+        return market_id in self.idx
+
+    def _grow(self) -> None:
+        size = len(self.p0) * 2
+        for name, fill in (
+            ("p0", np.nan), ("volume0", 0), ("mid", np.nan),
+            ("volume_24h", 0), ("spread_bps", 0),
+        ):
+            old = getattr(self, name)
+            new = np.full(size, fill, dtype=np.float32)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _row(self, market_id: str) -> int:
+        row = self.idx.get(market_id)
+        if row is not None:
+            return row
+
+        if self._free:
+            row = self._free.pop()
+            self.market_ids[row] = market_id
+        else:
+            row = len(self.market_ids)
+            if row >= len(self.p0):
+                self._grow()
+            self.market_ids.append(market_id)
+        self.idx[market_id] = row
+        return row
+
+    def update(
+        self,
+        snapshots: dict[str, ArbSnapshot],
+        quotes: dict[str, PolymarketQuote],
+    ) -> None:
+        """
+        Record baselines and latest quotes for markets.
+
+        Only markets with a snapshot get a row; quotes for other markets
+        are ignored, so every row is freed when its snapshot expires.
+
+        Args:
+            snapshots: Baseline snapshots by market_id
+            quotes: Current quotes by market_id
+        """
+        with self._lock:
+            for market_id, snapshot in snapshots.items():
+                row = self._row(market_id)
+                self.p0[row] = snapshot.p0
+                self.volume0[row] = snapshot.volume0 or 0
+
+            for market_id, quote in quotes.items():
+                row = self.idx.get(market_id)
+                if row is None:
+                    continue
+                self.mid[row] = quote.mid
+                self.volume_24h[row] = quote.volume_24h or 0
+                self.spread_bps[row] = quote.spread_bps
+
+    def deltas(self, market_ids: list[str]) -> np.ndarray:
+        """
+        Get current_mid - p0 for markets.
+
+        Args:
+            market_ids: Markets to read
+
+        Returns:
+            float32 array aligned with market_ids (NaN where unquoted or
+            not in the book, e.g. removed by a concurrent clear_snapshots)
+        """
+        with self._lock:
+            rows = np.fromiter((self.idx.get(m, -1) for m in market_ids), np.intp, len(market_ids))
+            deltas = self.mid[rows] - self.p0[rows]
+            deltas[rows < 0] = np.nan
+            return deltas
+
+    def remove(self, market_ids: Iterable[str]) -> None:
+        """Drop markets and free their rows for reuse."""
+        with self._lock:
+            for market_id in market_ids:
+                row = self.idx.pop(market_id, None)
+                if row is None:
+                    continue
+                self.p0[row] = np.nan
+                self.mid[row] = np.nan
+                self.volume0[row] = 0
+                self.volume_24h[row] = 0
+                self.spread_bps[row] = 0
+                self._free.append(row)
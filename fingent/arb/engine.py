@@ -14,7 +14,12 @@ Flow:
 8. Store: Save to persistence layer
 """
 
+import hashlib
 import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Any, Optional
 
@@ -31,6 +36,18 @@ from fingent.providers.polymarket import PolymarketProvider
 from fingent.providers.finnhub import FinnhubProvider
 from fingent.arb.strategy import TermStructureStrategy
 from fingent.arb.risk import RiskManager
+from fingent.arb.snapshot import SnapshotStore, create_snapshot_store
+from fingent.arb.book import MarketBook
+
+
+# Characters that make a trigger pattern more than a literal alternation
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+# Joins news texts for batch trigger scans (ASCII record separator)
+_NEWS_SEP = "\x1e"
+
+# Constructs that behave differently once texts are joined together
+_BATCH_UNSAFE_TOKENS = ("^", "$", "\\A", "\\Z", "(?<")
 
 
 class ArbEngine(LoggerMixin):
@@ -40,10 +57,14 @@ class ArbEngine(LoggerMixin):
     Coordinates the full arbitrage detection pipeline.
     """
 
+    # Recently processed news items remembered for deduplication
+    MAX_SEEN_NEWS = 2048
+
     def __init__(
         self,
         provider: Optional[PolymarketProvider] = None,
         config: Optional[dict] = None,
+        snapshot_store: Optional[SnapshotStore] = None,
     ):
         """
         Initialize arbitrage engine.
@@ -51,6 +72,7 @@ class ArbEngine(LoggerMixin):
         Args:
             provider: Polymarket provider instance
             config: Configuration dict (or load from yaml)
+            snapshot_store: Snapshot store (built from config if not provided)
         """
         self.settings = get_settings()
 
@@ -65,7 +87,7 @@ class ArbEngine(LoggerMixin):
         if not self.enabled:
             self.logger.warning("Arbitrage engine is disabled in config")
 
-        # Compile keyword patterns
+        # Compile keyword patterns (individual patterns kept for diagnostics)
         self.keyword_patterns = []
         for pattern in config.get("trigger_keywords", []):
             try:
@@ -73,22 +95,84 @@ class ArbEngine(LoggerMixin):
             except re.error as e:
                 self.logger.warning(f"Invalid regex pattern '{pattern}': {e}")
 
+        # Single alternation so headlines without any trigger are rejected
+        # in one pass. Each pattern gets a named group (k0, k1, ...).
+        self._combined_pattern: Optional[re.Pattern] = None
+        if self.keyword_patterns:
+            try:
+                self._combined_pattern = re.compile(
+                    "|".join(
+                        f"(?P<k{i}>{p.pattern})" for i, p in enumerate(self.keyword_patterns)
+                    ),
+                    re.IGNORECASE,
+                )
+            except re.error as e:
+                # e.g. inline flags or duplicate group names across patterns
+                self.logger.warning(f"Cannot combine trigger patterns, scanning individually: {e}")
+
+        # Anchors and lookbehinds would see neighbouring items in a joined scan
+        self._batch_trigger_safe = self._combined_pattern is not None and not any(
+            token in p.pattern for p in self.keyword_patterns for token in _BATCH_UNSAFE_TOKENS
+        )
+
+        # Aho-Corasick automaton when every pattern is a literal alternation
+        self._keyword_automaton = self._build_keyword_automaton()
+
+        # Fallback search keywords derived from the trigger patterns.
+        # Simple extraction: use pattern string as keyword
+        # (in production, maintain a separate keyword list)
+        self._default_keywords = self._dedupe_keywords(
+            word
+            for pattern in self.keyword_patterns
+            for word in pattern.pattern.replace("(", "").replace(")", "").replace("|", " ").split()
+        )
+
         # Load synonym map for keyword expansion
         self.synonym_map = config.get("synonym_map", {})
 
         # Initialize provider
         self.provider = provider or PolymarketProvider()
 
+        # Finnhub provider, created on first use and reused across scans
+        self._finnhub: Optional[FinnhubProvider] = None
+
         # Initialize strategy and risk manager
         self.strategy = TermStructureStrategy(config)
         self.risk_manager = RiskManager(config.get("risk", {}))
 
-        # In-memory snapshot store (can be moved to Redis/SQLite later)
-        self._snapshots: dict[str, ArbSnapshot] = {}
+        # Snapshot store (in-memory by default, Redis if configured)
+        self._snapshots = snapshot_store or create_snapshot_store(
+            config.get("snapshot", {}), self.settings
+        )
+
+        # Columnar p0/mid arrays for vectorized delta computation
+        self._book = MarketBook()
+
+        # Events are processed concurrently (network-bound CLOB calls) on one
+        # engine-wide pool, so parallel news scans share the same bound
+        self.max_concurrent_events = config.get("max_concurrent_events", 16)
+        self._event_executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_events, thread_name_prefix="arb-event"
+        )
+
+        # News items are processed concurrently; bounded to respect API rate limits
+        self.max_parallel_news = config.get("max_parallel_news", 8)
+
+        # Risk filtering stays serial so cooldowns see every confirmation
+        self._filter_lock = threading.Lock()
 
         # Track detected opportunities
         self._opportunities: list[ArbOpportunity] = []
 
+        # Hashes of processed news (URL, or title if no URL), oldest first
+        self._seen_news: OrderedDict[bytes, None] = OrderedDict()
+
+    def _get_finnhub(self) -> FinnhubProvider:
+        """Get the shared Finnhub provider, creating it if needed."""
+        if self._finnhub is None:
+            self._finnhub = FinnhubProvider()
+        return self._finnhub
+
     def check_news_trigger(self, headline: str, summary: str = "") -> list[str]:
         """
         Check if news matches trigger keywords.
@@ -101,15 +185,133 @@ class ArbEngine(LoggerMixin):
             List of matched keywords
         """
         text = f"{headline} {summary}"
-        matched = []
+        lowered = text.lower()
+
+        if self._keyword_automaton is not None and len(lowered) == len(text):
+            # Leftmost match per pattern, earlier alternative wins ties (regex semantics)
+            best: dict[int, tuple[int, int, int]] = {}
+            for end, (length, entries) in self._keyword_automaton.iter(lowered):
+                start = end - length + 1
+                for pattern_idx, alt_idx in entries:
+                    candidate = (start, alt_idx, end)
+                    if pattern_idx not in best or candidate < best[pattern_idx]:
+                        best[pattern_idx] = candidate
+            return [text[best[i][0]:best[i][2] + 1] for i in sorted(best)]
+
+        # The combined alternation only rejects non-matching text in one
+        # pass; a single scan cannot report overlapping matches (e.g.
+        # "gold" and "gold reserve"), so hits are resolved per pattern
+        if self._combined_pattern is not None and self._combined_pattern.search(text) is None:
+            return []
 
+        matched = []
         for pattern in self.keyword_patterns:
             match = pattern.search(text)
             if match:
                 matched.append(match.group())
-
         return matched
 
+    def check_news_triggers(self, news_items: list) -> list[list[str]]:
+        """
+        Check a batch of news items against trigger keywords.
+
+        Joins all texts and scans them once, mapping matches back to
+        their item. Same results as check_news_trigger per item.
+
+        Args:
+            news_items: NewsItem list
+
+        Returns:
+            Matched keywords per item, aligned with news_items
+        """
+        texts = [f"{item.title} {item.summary}" for item in news_items]
+        if not texts or not self.keyword_patterns:
+            return [[] for _ in texts]
+
+        joined = _NEWS_SEP.join(texts)
+        lowered = joined.lower()
+        use_automaton = self._keyword_automaton is not None and len(lowered) == len(joined)
+
+        if (
+            (not use_automaton and not self._batch_trigger_safe)
+            or joined.count(_NEWS_SEP) != len(texts) - 1
+        ):
+            return [self.check_news_trigger(item.title, item.summary) for item in news_items]
+
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        if use_automaton:
+            # Leftmost match per (item, pattern), earlier alternative wins ties
+            best: dict[tuple[int, int], tuple[int, int, int]] = {}
+            for end, (length, entries) in self._keyword_automaton.iter(lowered):
+                start = end - length + 1
+                item_idx = bisect_right(starts, start) - 1
+                for pattern_idx, alt_idx in entries:
+                    key = (item_idx, pattern_idx)
+                    candidate = (start, alt_idx, end)
+                    if key not in best or candidate < best[key]:
+                        best[key] = candidate
+            results: list[list[str]] = [[] for _ in texts]
+            for item_idx, pattern_idx in sorted(best):
+                start, _, end = best[(item_idx, pattern_idx)]
+                results[item_idx].append(joined[start:end + 1])
+            return results
+
+        # The joined scan only finds which items contain any trigger (an
+        # alternation cannot report overlapping matches); those items, and
+        # items touched by a match spanning the separator, are resolved
+        # per pattern like check_news_trigger
+        hit: set[int] = set()
+        for match in self._combined_pattern.finditer(joined):
+            item_idx = bisect_right(starts, match.start()) - 1
+            end_idx = bisect_right(starts, match.end() - 1) - 1
+            hit.update(range(item_idx, end_idx + 1))
+
+        return [
+            self.check_news_trigger(item.title, item.summary) if item_idx in hit else []
+            for item_idx, item in enumerate(news_items)
+        ]
+
+    def _build_keyword_automaton(self):
+        """
+        Build an Aho-Corasick automaton for literal trigger patterns.
+
+        Only used when every pattern is a plain "(a|b|c)" alternation and
+        pyahocorasick is installed; otherwise the regex path is used.
+
+        Returns:
+            ahocorasick.Automaton or None
+        """
+        if not self.keyword_patterns:
+            return None
+
+        # keyword -> [(pattern index, alternative index)]
+        words: dict[str, list[tuple[int, int]]] = {}
+        for pattern_idx, pattern in enumerate(self.keyword_patterns):
+            raw = pattern.pattern
+            if raw.startswith("(") and raw.endswith(")"):
+                raw = raw[1:-1]
+            for alt_idx, alt in enumerate(raw.split("|")):
+                if not alt or any(c in _REGEX_METACHARS for c in alt):
+                    return None
+                words.setdefault(alt.lower(), []).append((pattern_idx, alt_idx))
+
+        try:
+            import ahocorasick
+        except ImportError:
+            self.logger.debug("pyahocorasick not installed, using regex trigger scan")
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for word, entries in words.items():
+            automaton.add_word(word, (len(word), entries))
+        automaton.make_automaton()
+        return automaton
+
     def scan_markets(
         self,
         keywords: Optional[list[str]] = None,
@@ -127,16 +329,9 @@ class ArbEngine(LoggerMixin):
             return {}
 
         if keywords is None:
-            # Extract keywords from patterns
-            keywords = []
-            for pattern in self.keyword_patterns:
-                # Simple extraction: use pattern string as keyword
-                # In production, maintain a separate keyword list
-                raw = pattern.pattern.replace("(", "").replace(")", "").replace("|", " ")
-                keywords.extend(raw.split())
-
-        # Dedupe and clean
-        keywords = list(set(k.strip() for k in keywords if len(k) > 2))[:20]
+            keywords = self._default_keywords
+        else:
+            keywords = self._dedupe_keywords(keywords)
 
         self.logger.info(f"Scanning markets for keywords: {keywords[:5]}...")
 
@@ -150,6 +345,11 @@ class ArbEngine(LoggerMixin):
             synonym_map=self.synonym_map,
         )
 
+    @staticmethod
+    def _dedupe_keywords(keywords) -> list[str]:
+        """Dedupe and clean keywords, capped at 20."""
+        return list(set(k.strip() for k in keywords if len(k) > 2))[:20]
+
     def create_snapshots(
         self,
         markets: list[PolymarketMarket],
@@ -168,16 +368,27 @@ class ArbEngine(LoggerMixin):
             Dict of market_id -> ArbSnapshot
         """
         snapshots = {}
-        timestamp = format_timestamp(now_utc())
+        now = now_utc()
+        timestamp = format_timestamp(now)
+        epoch = now.timestamp()
 
+        new_markets = []
         for market in markets:
-            if market.market_id in self._snapshots:
+            existing = self._snapshots.get(market.market_id)
+            if existing:
                 # Already have snapshot
-                snapshots[market.market_id] = self._snapshots[market.market_id]
-                continue
+                snapshots[market.market_id] = existing
+            else:
+                new_markets.append(market)
 
-            # Get current quote
-            quote = self.provider.get_quote(market)
+        if not new_markets:
+            return snapshots
+
+        # Get current quotes in one batch
+        quotes = self.provider.get_quotes_batch(new_markets)
+
+        for market in new_markets:
+            quote = quotes.get(market.market_id)
             if not quote:
                 continue
 
@@ -190,11 +401,12 @@ class ArbEngine(LoggerMixin):
                 volume0=quote.volume_24h,
             )
 
-            self._snapshots[market.market_id] = snapshot
+            # Another worker may have snapshotted the same market meanwhile
+            snapshot = self._snapshots.add(snapshot, epoch)
             snapshots[market.market_id] = snapshot
 
             self.logger.debug(
-                f"Created snapshot for {market.market_id}: p0={quote.mid:.4f}"
+                f"Created snapshot for {market.market_id}: p0={snapshot.p0:.4f}"
             )
 
         return snapshots
@@ -203,7 +415,7 @@ class ArbEngine(LoggerMixin):
         self,
         event_markets: dict[str, list[PolymarketMarket]],
         trigger_ts: Optional[datetime] = None,
-    ) -> list[ArbOpportunity]:
+    ) -> list[tuple[ArbOpportunity, dict[str, PolymarketQuote]]]:
         """
         Detect arbitrage opportunities across events.
 
@@ -212,55 +424,86 @@ class ArbEngine(LoggerMixin):
             trigger_ts: Timestamp of triggering event
 
         Returns:
-            List of detected opportunities (before risk filter)
+            List of (opportunity, quotes used for detection) tuples
+            (before risk filter)
         """
         if not self.enabled:
             return []
 
-        opportunities = []
+        detections = []
 
-        for event_id, markets in event_markets.items():
-            # Ensure snapshots exist
-            snapshots = self.create_snapshots(markets)
+        submit = self._event_executor.submit
+        futures = {
+            submit(self._process_event, event_id, markets, trigger_ts): event_id
+            for event_id, markets in event_markets.items()
+        }
+        for future in as_completed(futures):
+            try:
+                detection = future.result()
+            except Exception as e:
+                self.logger.warning(f"Event {futures[future]}: Detection failed: {e}")
+                continue
+            if detection:
+                detections.append(detection)
 
-            # Get current quotes
-            quotes = self.provider.get_quotes_batch(markets)
+        return detections
 
-            if len(quotes) < 2:
-                self.logger.debug(f"Event {event_id}: Not enough quotes ({len(quotes)})")
-                continue
+    def _process_event(
+        self,
+        event_id: str,
+        markets: list[PolymarketMarket],
+        trigger_ts: Optional[datetime] = None,
+    ) -> Optional[tuple[ArbOpportunity, dict[str, PolymarketQuote]]]:
+        """
+        Snapshot, quote and evaluate a single event.
 
-            # Get snapshots for this event's markets
-            event_snapshots = {
-                m.market_id: self._snapshots[m.market_id]
-                for m in markets
-                if m.market_id in self._snapshots
-            }
-
-            # Run strategy
-            opportunity = self.strategy.evaluate(
-                event_id=event_id,
-                markets=markets,
-                quotes=quotes,
-                snapshots=event_snapshots,
-                trigger_ts=trigger_ts,
-            )
+        Args:
+            event_id: Polymarket event ID
+            markets: Markets in the event
+            trigger_ts: Timestamp of triggering event
 
-            if opportunity:
-                opportunities.append(opportunity)
+        Returns:
+            (ArbOpportunity, quotes) if detected, None otherwise
+        """
+        # Ensure snapshots exist
+        event_snapshots = self.create_snapshots(markets)
+
+        # Get current quotes
+        quotes = self.provider.get_quotes_batch(markets)
+
+        if len(quotes) < 2:
+            self.logger.debug(f"Event {event_id}: Not enough quotes ({len(quotes)})")
+            return None
+
+        self._book.update(event_snapshots, quotes)
+
+        # Run strategy
+        opportunity = self.strategy.evaluate(
+            event_id=event_id,
+            markets=markets,
+            quotes=quotes,
+            snapshots=event_snapshots,
+            trigger_ts=trigger_ts,
+            book=self._book,
+        )
 
-        return opportunities
+        if opportunity is None:
+            return None
+        return opportunity, quotes
 
     def filter_opportunities(
         self,
-        opportunities: list[ArbOpportunity],
+        detections: list[tuple[ArbOpportunity, dict[str, PolymarketQuote]]],
         event_markets: dict[str, list[PolymarketMarket]],
     ) -> list[ArbOpportunity]:
         """
         Apply risk filters to opportunities.
 
+        Quotes fetched during detection are reused, so no extra
+        CLOB requests are made here.
+
         Args:
-            opportunities: Raw opportunities from detection
+            detections: (opportunity, quotes) tuples from detect_opportunities
             event_markets: Market data for context
 
         Returns:
@@ -268,19 +511,19 @@ class ArbEngine(LoggerMixin):
         """
         filtered = []
 
-        for opp in opportunities:
-            # Get markets and quotes for this event
-            markets = event_markets.get(opp.event_id, [])
-            markets_dict = {m.market_id: m for m in markets}
-            quotes = self.provider.get_quotes_batch(markets)
+        with self._filter_lock:
+            for opp, quotes in detections:
+                # Get markets for this event
+                markets = event_markets.get(opp.event_id, [])
+                markets_dict = {m.market_id: m for m in markets}
 
-            # Apply risk filter
-            opp = self.risk_manager.filter(opp, quotes, markets_dict)
+                # Apply risk filter
+                opp = self.risk_manager.filter(opp, quotes, markets_dict)
 
-            if opp.status == "CANDIDATE":
-                opp.status = "CONFIRMED"
-                filtered.append(opp)
-                self._opportunities.append(opp)
+                if opp.status == "CANDIDATE":
+                    opp.status = "CONFIRMED"
+                    filtered.append(opp)
+                    self._opportunities.append(opp)
 
         return filtered
 
@@ -313,14 +556,14 @@ class ArbEngine(LoggerMixin):
             return []
 
         # 2. Detect opportunities
-        raw_opportunities = self.detect_opportunities(event_markets, trigger_ts)
-        self.logger.info(f"Detected {len(raw_opportunities)} raw opportunities")
+        detections = self.detect_opportunities(event_markets, trigger_ts)
+        self.logger.info(f"Detected {len(detections)} raw opportunities")
 
-        if not raw_opportunities:
+        if not detections:
             return []
 
-        # 3. Filter
-        confirmed = self.filter_opportunities(raw_opportunities, event_markets)
+        # 3. Filter (reuses quotes from detection)
+        confirmed = self.filter_opportunities(detections, event_markets)
         self.logger.info(f"Confirmed {len(confirmed)} opportunities after risk filter")
 
         return confirmed
@@ -330,6 +573,7 @@ class ArbEngine(LoggerMixin):
         headline: str,
         summary: str = "",
         news_id: str = "",
+        matched_keywords: Optional[list[str]] = None,
     ) -> list[ArbOpportunity]:
         """
         Process a news event and check for arbitrage.
@@ -338,6 +582,7 @@ class ArbEngine(LoggerMixin):
             headline: News headline
             summary: News summary
             news_id: Unique news identifier
+            matched_keywords: Trigger matches if already checked
 
         Returns:
             List of confirmed opportunities
@@ -346,7 +591,8 @@ class ArbEngine(LoggerMixin):
             return []
 
         # Check trigger
-        matched_keywords = self.check_news_trigger(headline, summary)
+        if matched_keywords is None:
+            matched_keywords = self.check_news_trigger(headline, summary)
 
         if not matched_keywords:
             self.logger.debug(f"No keyword match for: {headline[:50]}...")
@@ -363,6 +609,93 @@ class ArbEngine(LoggerMixin):
             trigger_ts=datetime.now(timezone.utc),
         )
 
+    def _process_news_items(self, news_items: list) -> tuple[int, list[ArbOpportunity]]:
+        """
+        Process news items concurrently.
+
+        Each triggered item runs its own Polymarket scan, which is
+        network-bound, so items are overlapped up to max_parallel_news.
+
+        Args:
+            news_items: NewsItem list
+
+        Returns:
+            (triggered item count, confirmed opportunities in news order)
+
+        Items already processed in earlier polls are skipped. An item
+        whose processing fails is not remembered, so the next poll retries it.
+        """
+        def process(item, matched: list[str]) -> Optional[list[ArbOpportunity]]:
+            try:
+                return self.process_news(
+                    headline=item.title,
+                    summary=item.summary,
+                    news_id=item.url or item.title[:50],
+                    matched_keywords=matched,
+                )
+            except Exception as e:
+                self.logger.warning(f"News processing failed for '{item.title[:50]}': {e}")
+                return None
+
+        fresh = self._filter_seen_news(news_items)
+        if not fresh:
+            return 0, []
+        news_items = [item for item, _ in fresh]
+
+        # One trigger scan for the whole batch; only matching items are processed
+        triggers = self.check_news_triggers(news_items)
+        matched = [i for i, m in enumerate(triggers) if m]
+        self.logger.debug(f"{len(matched)}/{len(news_items)} news items matched triggers")
+
+        results: list[Optional[list[ArbOpportunity]]] = [[] for _ in news_items]
+        if matched:
+            with ThreadPoolExecutor(max_workers=self.max_parallel_news) as executor:
+                processed = executor.map(
+                    lambda i: process(news_items[i], triggers[i]), matched
+                )
+                for i, opps in zip(matched, processed):
+                    results[i] = opps
+
+        self._mark_news_seen(key for (_, key), opps in zip(fresh, results) if opps is not None)
+
+        triggered = [opps for opps in results if opps]
+        return len(triggered), [o for opps in triggered for o in opps]
+
+    @staticmethod
+    def _news_key(item) -> bytes:
+        """Dedup key for a news item: hash of its URL, or title if no URL."""
+        return hashlib.blake2b((item.url or item.title).encode(), digest_size=16).digest()
+
+    def _filter_seen_news(self, news_items: list) -> list[tuple[Any, bytes]]:
+        """
+        Drop news items processed in earlier batches or repeated in this one.
+
+        Args:
+            news_items: NewsItem list
+
+        Returns:
+            (item, dedup key) pairs not processed before, in original order
+        """
+        fresh = []
+        batch_keys = set()
+        for item in news_items:
+            key = self._news_key(item)
+            if key in self._seen_news or key in batch_keys:
+                continue
+            batch_keys.add(key)
+            fresh.append((item, key))
+
+        if len(fresh) < len(news_items):
+            self.logger.debug(f"Skipped {len(news_items) - len(fresh)} duplicate news items")
+        return fresh
+
+    def _mark_news_seen(self, keys) -> None:
+        """Remember processed news keys, evicting the oldest past MAX_SEEN_NEWS."""
+        for key in keys:
+            self._seen_news[key] = None
+        while len(self._seen_news) > self.MAX_SEEN_NEWS:
+            self._seen_news.popitem(last=False)
+
     def get_opportunities(self) -> list[dict]:
         """
         Get all detected opportunities.
@@ -379,7 +712,7 @@ class ArbEngine(LoggerMixin):
         Returns:
             Dict of market_id -> snapshot dict
         """
-        return {k: v.to_dict() for k, v in self._snapshots.items()}
+        return self._snapshots.to_dicts()
 
     def clear_snapshots(self, older_than_hours: float = 6) -> int:
         """
@@ -391,20 +724,9 @@ class ArbEngine(LoggerMixin):
         Returns:
             Number of snapshots removed
         """
-        now = datetime.now(timezone.utc)
-        to_remove = []
-
-        for market_id, snapshot in self._snapshots.items():
-            try:
-                ts = datetime.fromisoformat(snapshot.first_seen_ts.replace("Z", "+00:00"))
-                age_hours = (now - ts).total_seconds() / 3600
-                if age_hours > older_than_hours:
-                    to_remove.append(market_id)
-            except Exception:
-                pass
-
-        for market_id in to_remove:
-            del self._snapshots[market_id]
+        cutoff = now_utc().timestamp() - older_than_hours * 3600
+        to_remove = self._snapshots.expire(cutoff)
+        self._book.remove(to_remove)
 
         if to_remove:
             self.logger.info(f"Cleared {len(to_remove)} old snapshots")
@@ -446,19 +768,7 @@ class ArbEngine(LoggerMixin):
 
         self.logger.info(f"Processing {len(news_items)} news items...")
 
-        all_opportunities = []
-        triggered_count = 0
-
-        for item in news_items:
-            opportunities = self.process_news(
-                headline=item.title,
-                summary=item.summary,
-                news_id=item.url or item.title[:50],
-            )
-
-            if opportunities:
-                triggered_count += 1
-                all_opportunities.extend(opportunities)
+        triggered_count, all_opportunities = self._process_news_items(news_items)
 
         self.logger.info(
             f"News scan complete: {triggered_count} triggered, "
@@ -478,7 +788,7 @@ class ArbEngine(LoggerMixin):
         For multi-provider support, use scan_news() instead.
 
         Args:
-            finnhub_provider: Finnhub provider instance (creates one if not provided)
+            finnhub_provider: Finnhub provider instance (shared engine instance if not provided)
             category: News category (general, forex, crypto, merger)
 
         Returns:
@@ -491,7 +801,7 @@ class ArbEngine(LoggerMixin):
         # Initialize Finnhub provider
         if finnhub_provider is None:
             try:
-                finnhub_provider = FinnhubProvider()
+                finnhub_provider = self._get_finnhub()
             except Exception as e:
                 self.logger.error(f"Failed to initialize Finnhub provider: {e}")
                 return []
@@ -506,19 +816,7 @@ class ArbEngine(LoggerMixin):
 
         self.logger.info(f"Processing {len(news_items)} news items...")
 
-        all_opportunities = []
-        triggered_count = 0
-
-        for item in news_items:
-            opportunities = self.process_news(
-                headline=item.title,
-                summary=item.summary,
-                news_id=item.url or item.title[:50],
-            )
-
-            if opportunities:
-                triggered_count += 1
-                all_opportunities.extend(opportunities)
+        triggered_count, all_opportunities = self._process_news_items(news_items)
 
         self.logger.info(
             f"News scan complete: {triggered_count} triggered, "
@@ -583,16 +881,14 @@ class ArbEngine(LoggerMixin):
 
                 except Exception as e:
                     self.logger.warning(f"NewsRouter failed, falling back to Finnhub: {e}")
-                    finnhub = FinnhubProvider()
-                    news_items = finnhub.get_market_news(finnhub_category)
+                    news_items = self._get_finnhub().get_market_news(finnhub_category)
                     result["news_providers_used"] = ["finnhub"]
 
                 result["news_scanned"] = len(news_items)
 
-                for item in news_items:
-                    matched = self.check_news_trigger(item.title, item.summary)
-                    if matched:
-                        result["news_triggered"] += 1
+                result["news_triggered"] = sum(
+                    1 for matched in self.check_news_triggers(news_items) if matched
+                )
 
                 opportunities = self.scan_news()
             else:
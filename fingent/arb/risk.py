@@ -12,10 +12,16 @@ Only opportunities passing all hard filters proceed to notification.
 """
 
 import time
+from collections import OrderedDict
 from typing import Optional
 
 from fingent.core.logging import LoggerMixin
-from fingent.domain.models import ArbOpportunity, PolymarketQuote, PolymarketMarket
+from fingent.domain.models import (
+    ArbOpportunity,
+    PolymarketQuote,
+    PolymarketMarket,
+    RiskFlag,
+)
 
 
 class RiskManager(LoggerMixin):
@@ -24,8 +30,14 @@ class RiskManager(LoggerMixin):
 
     Hard filters result in FILTERED status.
     Soft filters add risk_flags but allow progression.
+
+    Checks only OR RiskFlag bits and collect raw values; the
+    human-readable risk_flags are formatted on demand.
     """
 
+    # Upper bound on events tracked for cooldown
+    MAX_TRACKED_EVENTS = 10000
+
     def __init__(self, config: dict):
         """
         Initialize risk manager.
@@ -39,8 +51,9 @@ class RiskManager(LoggerMixin):
         self.min_time_to_settle_hours = config.get("min_time_to_settle_hours", 12)
         self.cooldown_seconds = config.get("cooldown_seconds", 900)
 
-        # Track last alert time per event
-        self._last_alert: dict[str, float] = {}
+        # Track last alert time per event, oldest first.
+        # Entries past the cooldown are dropped on write; size is capped.
+        self._last_alert: OrderedDict[str, float] = OrderedDict()
 
     def filter(
         self,
@@ -59,7 +72,23 @@ class RiskManager(LoggerMixin):
         Returns:
             Opportunity with updated risk_flags and status
         """
-        flags = []
+        event_id = opportunity.event_id
+        now = time.time()
+
+        # Cooldown check first: recently alerted events skip per-leg checks
+        elapsed = now - self._last_alert.get(event_id, 0)
+        if elapsed < self.cooldown_seconds:
+            remaining = self.cooldown_seconds - elapsed
+            opportunity.set_risk_flags(RiskFlag.COOLDOWN, [(RiskFlag.COOLDOWN, event_id, remaining)])
+            opportunity.status = "FILTERED"
+            self.logger.info(
+                f"Risk check for {event_id}: "
+                f"status={opportunity.status}, flags={RiskFlag.COOLDOWN.name}"
+            )
+            return opportunity
+
+        bits = 0
+        details = []
         hard_fail = False
 
         for leg in opportunity.legs:
@@ -67,59 +96,66 @@ class RiskManager(LoggerMixin):
             quote = quotes.get(market_id)
 
             if not quote:
-                flags.append(f"MISSING_QUOTE:{market_id}")
+                bits |= RiskFlag.MISSING_QUOTE
+                details.append((RiskFlag.MISSING_QUOTE, market_id, None))
                 hard_fail = True
                 continue
 
             # Volume check (hard filter)
             if quote.volume_24h is not None and quote.volume_24h < self.min_volume_24h:
-                flags.append(f"LOW_VOLUME:{market_id}:{quote.volume_24h:.0f}")
+                bits |= RiskFlag.LOW_VOLUME
+                details.append((RiskFlag.LOW_VOLUME, market_id, quote.volume_24h))
                 hard_fail = True
 
             # Spread check (hard filter)
             if quote.spread_bps > self.max_spread_bps:
-                flags.append(f"WIDE_SPREAD:{market_id}:{quote.spread_bps:.0f}bps")
+                bits |= RiskFlag.WIDE_SPREAD
+                details.append((RiskFlag.WIDE_SPREAD, market_id, quote.spread_bps))
                 hard_fail = True
 
             # Depth check (soft filter - warn but allow)
             min_depth = min(quote.depth_bid, quote.depth_ask)
             if min_depth < self.min_depth_usd:
-                flags.append(f"LOW_DEPTH:{market_id}:{min_depth:.0f}")
+                bits |= RiskFlag.LOW_DEPTH
+                details.append((RiskFlag.LOW_DEPTH, market_id, min_depth))
                 # Note: soft filter, doesn't set hard_fail
 
             # Time to settle check (if markets provided)
             if markets:
                 market = markets.get(market_id)
                 if market and market.tenor_days * 24 < self.min_time_to_settle_hours:
-                    flags.append(f"TOO_CLOSE_TO_SETTLE:{market_id}:{market.tenor_days}d")
+                    bits |= RiskFlag.TOO_CLOSE_TO_SETTLE
+                    details.append((RiskFlag.TOO_CLOSE_TO_SETTLE, market_id, market.tenor_days))
                     hard_fail = True
 
-        # Cooldown check
-        event_id = opportunity.event_id
-        now = time.time()
-        last_alert = self._last_alert.get(event_id, 0)
-
-        if now - last_alert < self.cooldown_seconds:
-            remaining = self.cooldown_seconds - (now - last_alert)
-            flags.append(f"COOLDOWN:{event_id}:{remaining:.0f}s")
-            hard_fail = True
-
         # Update opportunity
-        opportunity.risk_flags = flags
+        opportunity.set_risk_flags(bits, details)
         opportunity.status = "FILTERED" if hard_fail else "CANDIDATE"
 
         # Update cooldown tracker if passing
         if opportunity.status == "CANDIDATE":
-            self._last_alert[event_id] = now
+            self._record_alert(event_id, now)
 
-        if flags:
+        if bits:
             self.logger.info(
                 f"Risk check for {event_id}: "
-                f"status={opportunity.status}, flags={flags}"
+                f"status={opportunity.status}, flags={RiskFlag(bits).name}"
             )
 
         return opportunity
 
+    def _record_alert(self, event_id: str, now: float) -> None:
+        """Record alert time and evict expired or excess entries."""
+        self._last_alert[event_id] = now
+        self._last_alert.move_to_end(event_id)
+
+        while self._last_alert:
+            oldest_id, oldest_ts = next(iter(self._last_alert.items()))
+            expired = now - oldest_ts >= self.cooldown_seconds
+            if not expired and len(self._last_alert) <= self.MAX_TRACKED_EVENTS:
+                break
+            self._last_alert.popitem(last=False)
+
     def reset_cooldown(self, event_id: str) -> None:
         """
         Reset cooldown for an event.
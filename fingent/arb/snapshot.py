@@ -0,0 +1,276 @@
+"""
+Snapshot storage for arbitrage baselines.
+
+Snapshots record P0/Quote0 the first time a market is seen and are
+read on every polling cycle until they expire.
+
+Backends:
+- memory: In-process dict + expiry heap (default)
+- redis: Shared across workers, survives restarts, native TTL
+"""
+
+import heapq
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+from fingent.core.config import Settings, get_settings
+from fingent.core.logging import get_logger
+from fingent.core.timeutil import now_utc
+from fingent.domain.models import ArbSnapshot
+
+logger = get_logger("arb.snapshot")
+
+
+class SnapshotStore(ABC):
+    """Abstract base class for snapshot stores."""
+
+    @abstractmethod
+    def get(self, market_id: str) -> Optional[ArbSnapshot]:
+        """Get snapshot for a market, None if missing or expired."""
+        pass
+
+    @abstractmethod
+    def add(self, snapshot: ArbSnapshot, epoch: float) -> ArbSnapshot:
+        """
+        Store snapshot unless one already exists for the market.
+
+        Args:
+            snapshot: Snapshot to store
+            epoch: Creation time (unix seconds)
+
+        Returns:
+            The stored snapshot (existing one wins)
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, market_id: str) -> None:
+        """Delete snapshot for a market."""
+        pass
+
+    @abstractmethod
+    def items(self) -> Iterator[tuple[str, ArbSnapshot]]:
+        """Iterate over (market_id, snapshot) pairs."""
+        pass
+
+    def to_dicts(self) -> dict[str, dict]:
+        """Get {market_id: snapshot dict} for all snapshots."""
+        return {market_id: snapshot.to_dict() for market_id, snapshot in self.items()}
+
+    @abstractmethod
+    def expire(self, cutoff: float) -> list[str]:
+        """
+        Remove snapshots created before cutoff.
+
+        Args:
+            cutoff: Unix timestamp
+
+        Returns:
+            Removed market IDs
+        """
+        pass
+
+
+class InMemorySnapshotStore(SnapshotStore):
+    """
+    In-process snapshot store.
+
+    Keeps a min-heap of (epoch, market_id) so expiry only touches the
+    snapshots that are actually stale, and maintains the serialized
+    view incrementally so to_dicts() does not re-serialize anything.
+    """
+
+    def __init__(self):
+        self._snapshots: dict[str, ArbSnapshot] = {}
+        self._snapshot_dicts: dict[str, dict] = {}
+        self._epochs: dict[str, float] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def get(self, market_id: str) -> Optional[ArbSnapshot]:
+        with self._lock:
+            return self._snapshots.get(market_id)
+
+    def add(self, snapshot: ArbSnapshot, epoch: float) -> ArbSnapshot:
+        market_id = snapshot.market_id
+        with self._lock:
+            if market_id not in self._snapshots:
+                self._snapshots[market_id] = snapshot
+                self._snapshot_dicts[market_id] = snapshot.to_dict()
+                self._epochs[market_id] = epoch
+                heapq.heappush(self._expiry_heap, (epoch, market_id))
+            return self._snapshots[market_id]
+
+    def delete(self, market_id: str) -> None:
+        with self._lock:
+            self._snapshots.pop(market_id, None)
+            self._snapshot_dicts.pop(market_id, None)
+            self._epochs.pop(market_id, None)
+
+    def items(self) -> Iterator[tuple[str, ArbSnapshot]]:
+        with self._lock:
+            return iter(list(self._snapshots.items()))
+
+    def to_dicts(self) -> dict[str, dict]:
+        with self._lock:
+            return self._snapshot_dicts.copy()
+
+    def expire(self, cutoff: float) -> list[str]:
+        removed = []
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] < cutoff:
+                epoch, market_id = heapq.heappop(heap)
+                # Skip heap entries whose snapshot was deleted or replaced
+                if self._epochs.get(market_id) == epoch:
+                    del self._snapshots[market_id]
+                    del self._snapshot_dicts[market_id]
+                    del self._epochs[market_id]
+                    removed.append(market_id)
+        return removed
+
+
+class RedisSnapshotStore(SnapshotStore):
+    """
+    Redis-backed snapshot store.
+
+    Keys are arb:snap:{market_id} with native TTL. Snapshots are
+    immutable once written, so a small in-process LRU sits in front
+    of Redis to avoid a round trip for hot markets.
+    """
+
+    KEY_PREFIX = "arb:snap:"
+
+    def __init__(
+        self,
+        client,
+        ttl_seconds: int = 21600,
+        local_maxsize: int = 1024,
+    ):
+        """
+        Initialize Redis store.
+
+        Args:
+            client: redis.Redis instance
+            ttl_seconds: Snapshot TTL (SET ... EX)
+            local_maxsize: Max entries in the in-process LRU
+        """
+        self._redis = client
+        self.ttl_seconds = ttl_seconds
+        self._local: OrderedDict[str, tuple[ArbSnapshot, float]] = OrderedDict()
+        self._local_maxsize = local_maxsize
+        self._lock = threading.Lock()
+
+    def _key(self, market_id: str) -> str:
+        return f"{self.KEY_PREFIX}{market_id}"
+
+    def _remember(self, snapshot: ArbSnapshot, expires_at: float) -> None:
+        with self._lock:
+            self._local[snapshot.market_id] = (snapshot, expires_at)
+            self._local.move_to_end(snapshot.market_id)
+            if len(self._local) > self._local_maxsize:
+                self._local.popitem(last=False)
+
+    def _load(self, raw) -> ArbSnapshot:
+        return ArbSnapshot.from_dict(json.loads(raw))
+
+    def get(self, market_id: str) -> Optional[ArbSnapshot]:
+        now = now_utc().timestamp()
+        with self._lock:
+            entry = self._local.get(market_id)
+            if entry:
+                if entry[1] > now:
+                    self._local.move_to_end(market_id)
+                    return entry[0]
+                del self._local[market_id]
+
+        raw = self._redis.get(self._key(market_id))
+        if raw is None:
+            return None
+
+        snapshot = self._load(raw)
+        ttl = self._redis.ttl(self._key(market_id))
+        self._remember(snapshot, now + (ttl if ttl and ttl > 0 else self.ttl_seconds))
+        return snapshot
+
+    def add(self, snapshot: ArbSnapshot, epoch: float) -> ArbSnapshot:
+        key = self._key(snapshot.market_id)
+        created = self._redis.set(
+            key,
+            json.dumps(snapshot.to_dict()),
+            nx=True,
+            ex=self.ttl_seconds,
+        )
+        if not created:
+            existing = self.get(snapshot.market_id)
+            if existing:
+                return existing
+
+        self._remember(snapshot, epoch + self.ttl_seconds)
+        return snapshot
+
+    def delete(self, market_id: str) -> None:
+        with self._lock:
+            self._local.pop(market_id, None)
+        self._redis.delete(self._key(market_id))
+
+    def items(self) -> Iterator[tuple[str, ArbSnapshot]]:
+        for key in self._redis.scan_iter(match=f"{self.KEY_PREFIX}*"):
+            raw = self._redis.get(key)
+            if raw is None:
+                continue
+            snapshot = self._load(raw)
+            yield snapshot.market_id, snapshot
+
+    def expire(self, cutoff: float) -> list[str]:
+        # Redis TTL handles routine expiry; this only serves callers
+        # asking for a shorter window than ttl_seconds.
+        removed = []
+        for market_id, snapshot in list(self.items()):
+            try:
+                if snapshot.first_seen_dt.timestamp() < cutoff:
+                    self.delete(market_id)
+                    removed.append(market_id)
+            except ValueError:
+                continue
+        return removed
+
+
+def create_snapshot_store(
+    config: Optional[dict] = None,
+    settings: Optional[Settings] = None,
+) -> SnapshotStore:
+    """
+    Create snapshot store based on config.
+
+    Args:
+        config: config.yaml['arbitrage']['snapshot']
+        settings: Application settings (for redis_url)
+
+    Returns:
+        Redis store if configured and reachable, in-memory store otherwise
+    """
+    config = config or {}
+    backend = config.get("backend", "memory")
+
+    if backend == "redis":
+        settings = settings or get_settings()
+        try:
+            import redis
+
+            client = redis.Redis.from_url(settings.redis_url)
+            client.ping()
+            logger.info(f"Using Redis snapshot store: {settings.redis_url}")
+            return RedisSnapshotStore(
+                client,
+                ttl_seconds=config.get("ttl_seconds", 21600),
+            )
+        except ImportError:
+            logger.error("redis not installed, falling back to in-memory snapshots")
+        except Exception as e:
+            logger.error(f"Redis unavailable ({e}), falling back to in-memory snapshots")
+
+    return InMemorySnapshotStore()
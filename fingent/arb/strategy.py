@@ -9,13 +9,17 @@ Core Logic:
 1. Group markets by event_id
 2. Sort by tenor_days (short vs long)
 3. Calculate delta = current_mid - p0 for each
-4. Trigger if abs(delta_short - delta_long) > threshold
+4. Pick the tenor pair with the largest abs(delta_i - delta_j)
+5. Trigger if that divergence > threshold
 """
 
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
+import numpy as np
+
+from fingent.arb.book import MarketBook
 from fingent.core.logging import LoggerMixin
 from fingent.domain.models import (
     PolymarketMarket,
@@ -115,6 +119,7 @@ class TermStructureStrategy(LoggerMixin):
         quotes: dict[str, PolymarketQuote],
         snapshots: dict[str, ArbSnapshot],
         trigger_ts: Optional[datetime] = None,
+        book: Optional[MarketBook] = None,
     ) -> Optional[ArbOpportunity]:
         """
         Evaluate term structure for arbitrage opportunity.
@@ -125,10 +130,14 @@ class TermStructureStrategy(LoggerMixin):
             quotes: Current quotes by market_id
             snapshots: Initial snapshots by market_id
             trigger_ts: Timestamp when news triggered (for window check)
+            book: Market book holding these markets (vectorized deltas)
 
         Returns:
             ArbOpportunity if detected, None otherwise
         """
+        # Single clock read for the window check and the opportunity timestamp
+        now = datetime.now(timezone.utc)
+
         # 1. Filter active markets with quotes
         active = [
             m for m in markets
@@ -142,11 +151,24 @@ class TermStructureStrategy(LoggerMixin):
         # 2. Sort by tenor_days
         active.sort(key=lambda x: x.tenor_days)
 
-        # 3. Take short (nearest) and long (farthest)
+        # 3. Pick the most divergent pair across all tenors
         # Limit to configured max markets
         active = active[:self.max_markets_per_event]
-        short = active[0]
-        long = active[-1]
+        n = len(active)
+        if book is not None:
+            deltas = book.deltas([m.market_id for m in active])
+        else:
+            mids = np.fromiter((quotes[m.market_id].mid for m in active), float, n)
+            p0s = np.fromiter((snapshots[m.market_id].p0 for m in active), float, n)
+            deltas = mids - p0s
+        diff = np.abs(deltas[:, None] - deltas[None, :])
+        diff[np.isnan(diff)] = -np.inf  # Markets missing from the book never win
+        np.fill_diagonal(diff, -np.inf)
+        i, j = np.unravel_index(diff.argmax(), diff.shape)
+
+        # Legs ordered by tenor (active is sorted ascending)
+        short = active[min(i, j)]
+        long = active[max(i, j)]
 
         # 4. Get snapshots
         snap_s = snapshots.get(short.market_id)
@@ -155,12 +177,11 @@ class TermStructureStrategy(LoggerMixin):
             return None
 
         # 5. Check trigger window
-        now = datetime.now(timezone.utc)
         if trigger_ts:
             first_seen = trigger_ts
         else:
             try:
-                first_seen = datetime.fromisoformat(snap_s.first_seen_ts.replace("Z", "+00:00"))
+                first_seen = snap_s.first_seen_dt
             except Exception:
                 first_seen = now
 
@@ -200,7 +221,7 @@ class TermStructureStrategy(LoggerMixin):
         confidence = confidence_from_liquidity(quote_s, quote_l)
 
         # 10. Build opportunity
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = now.isoformat()
 
         legs = [
             ArbOpportunityLeg(
@@ -221,17 +242,19 @@ class TermStructureStrategy(LoggerMixin):
             ).to_dict(),
         ]
 
-        evidence = {
-            "trigger_ts": trigger_ts.isoformat() if trigger_ts else None,
-            "window_elapsed_min": window_elapsed,
-            "short_p0": snap_s.p0,
-            "long_p0": snap_l.p0,
-            "short_quote": quote_s.to_dict(),
-            "long_quote": quote_l.to_dict(),
-            "delta_short": delta_s,
-            "delta_long": delta_l,
-            "estimated_costs": costs,
-        }
+        # Built only if someone reads it; filtered opportunities skip the quote dumps
+        def build_evidence() -> dict:
+            return {
+                "trigger_ts": trigger_ts.isoformat() if trigger_ts else None,
+                "window_elapsed_min": window_elapsed,
+                "short_p0": snap_s.p0,
+                "long_p0": snap_l.p0,
+                "short_quote": quote_s.to_dict(),
+                "long_quote": quote_l.to_dict(),
+                "delta_short": delta_s,
+                "delta_long": delta_l,
+                "estimated_costs": costs,
+            }
 
         opportunity = ArbOpportunity(
             id=str(uuid.uuid4()),
@@ -242,9 +265,9 @@ class TermStructureStrategy(LoggerMixin):
             delta_diff=delta_diff,
             edge=edge,
             confidence=confidence,
-            evidence=evidence,
             risk_flags=[],
             status="CANDIDATE",
+            evidence_factory=build_evidence,
         )
 
         self.logger.info(
@@ -13,24 +13,58 @@ Usage:
 """
 
 import signal
-import sys
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from fingent.core.config import get_settings, load_yaml_config
 from fingent.core.logging import setup_logging, get_logger
-from fingent.graph.builder import create_default_workflow, run_workflow
-from fingent.graph.state import create_initial_state
-from fingent.services.persistence import create_persistence_service
-from fingent.services.scheduler import create_scheduler_service
-from fingent.services.telegram import create_telegram_service
 
-console = Console()
+# rich and the workflow/service stack are imported where used, so that
+# light commands (--status, --help) don't pay for the full import graph
+_console = None
 logger = get_logger("cli")
 
+# Set by the signal handler to stop run_scheduled
+_shutdown_event = threading.Event()
+
+# Rich color per signal direction
+_DIRECTION_COLORS = {
+    "bullish": "green",
+    "bearish": "red",
+    "neutral": "white",
+    "hawkish": "yellow",
+    "dovish": "blue",
+}
+
+# Emoji per alert severity
+_SEVERITY_EMOJI = {"low": "📢", "medium": "⚠️", "high": "🚨", "critical": "🔴"}
+
+# API key status cells
+_KEY_CONFIGURED = "[green]✓ Configured[/green]"
+_KEY_MISSING = "[red]✗ Missing[/red]"
+
+# (label, Settings attribute) for the API key status table
+_API_KEYS = (
+    ("FRED", "fred_api_key"),
+    ("Finnhub", "finnhub_api_key"),
+    ("AlphaVantage", "alphavantage_api_key"),
+    ("OKX", "okx_api_key"),
+    ("DeepSeek", "deepseek_api_key"),
+    ("Qwen", "dashscope_api_key"),
+    ("Telegram", "telegram_bot_token"),
+)
+
+
+def get_console():
+    """Get the shared rich console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
 
 def run_pipeline_once() -> dict:
     """
@@ -39,6 +73,10 @@ def run_pipeline_once() -> dict:
     Returns:
         Final state dict
     """
+    from fingent.graph.builder import create_default_workflow, run_workflow
+    from fingent.graph.state import create_initial_state
+    from fingent.services.persistence import create_persistence_service
+
     logger.info("Starting single pipeline run")
 
     # Create workflow
@@ -48,15 +86,33 @@ def run_pipeline_once() -> dict:
     # Execute
     final_state = run_workflow(workflow, initial_state)
 
-    # Persist results
-    persistence = create_persistence_service()
-    run_id = persistence.save_snapshot(final_state)
-
-    # Send notifications
     alerts = final_state.get("alerts", [])
-    if alerts:
-        telegram = create_telegram_service()
-        telegram.send_alerts(alerts)
+
+    # Runs that produced nothing (e.g. failed early) are not persisted
+    has_content = bool(
+        final_state.get("signals") or final_state.get("report") or alerts
+    )
+    if not has_content:
+        logger.warning("Pipeline produced no signals, report or alerts; skipping snapshot")
+
+    # Persist results and send notifications concurrently (DB vs network I/O)
+    run_id = None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        save_future = None
+        if has_content:
+            persistence = create_persistence_service()
+            save_future = executor.submit(persistence.save_snapshot, final_state)
+
+        alert_future = None
+        if alerts:
+            from fingent.services.telegram import create_telegram_service
+            telegram = create_telegram_service()
+            alert_future = executor.submit(telegram.send_alerts, alerts)
+
+        if save_future:
+            run_id = save_future.result()
+        if alert_future:
+            alert_future.result()
 
     # Log summary
     logger.info(
@@ -71,65 +127,64 @@ def run_pipeline_once() -> dict:
 
 def display_report(state: dict) -> None:
     """Display report in terminal."""
-    report = state.get("report", {})
-
-    console.print("\n" + "=" * 60)
-    console.print(f"[bold blue]{report.get('title', 'Fingent Report')}[/bold blue]")
-    console.print("=" * 60 + "\n")
-
-    # Summary
-    if report.get("summary"):
-        console.print("[bold]Summary[/bold]")
-        console.print(report["summary"])
-        console.print()
-
-    # Signals table
-    signals = state.get("signals", [])
-    if signals:
-        table = Table(title="Signals")
-        table.add_column("Name", style="cyan")
-        table.add_column("Direction", style="green")
-        table.add_column("Score", justify="right")
-        table.add_column("Source", style="dim")
-
-        for sig in signals[:10]:
-            direction_color = {
-                "bullish": "green",
-                "bearish": "red",
-                "neutral": "white",
-                "hawkish": "yellow",
-                "dovish": "blue",
-            }.get(sig.get("direction", ""), "white")
-
-            table.add_row(
-                sig.get("name", ""),
-                f"[{direction_color}]{sig.get('direction', '')}[/{direction_color}]",
-                f"{sig.get('score', 0):+.2f}",
-                sig.get("source_node", ""),
-            )
-
-        console.print(table)
-        console.print()
-
-    # Alerts
-    alerts = state.get("alerts", [])
-    if alerts:
-        console.print("[bold red]Alerts[/bold red]")
-        for alert in alerts:
-            severity = alert.get("severity", "medium")
-            emoji = {"low": "📢", "medium": "⚠️", "high": "🚨", "critical": "🔴"}.get(
-                severity, "⚠️"
-            )
-            console.print(f"  {emoji} {alert.get('title')}: {alert.get('message')}")
-        console.print()
-
-    # Errors
-    errors = state.get("errors", [])
-    if errors:
-        console.print("[bold yellow]Errors[/bold yellow]")
-        for error in errors:
-            console.print(f"  ⚠️ [{error.get('node')}] {error.get('error')}")
-        console.print()
+    from rich.table import Table
+
+    console = get_console()
+
+    # Buffer the whole report and write it to the terminal once
+    with console:
+        report = state.get("report", {})
+
+        console.print("\n" + "=" * 60)
+        console.print(f"[bold blue]{report.get('title', 'Fingent Report')}[/bold blue]")
+        console.print("=" * 60 + "\n")
+
+        # Summary
+        if report.get("summary"):
+            console.print("[bold]Summary[/bold]")
+            console.print(report["summary"])
+            console.print()
+
+        # Signals table
+        signals = state.get("signals", [])
+        if signals:
+            table = Table(title="Signals")
+            table.add_column("Name", style="cyan")
+            table.add_column("Direction", style="green")
+            table.add_column("Score", justify="right")
+            table.add_column("Source", style="dim")
+
+            for sig in signals[:10]:
+                direction = sig.get("direction", "")
+                direction_color = _DIRECTION_COLORS.get(direction, "white")
+
+                table.add_row(
+                    sig.get("name", ""),
+                    f"[{direction_color}]{direction}[/{direction_color}]",
+                    f"{sig.get('score', 0):+.2f}",
+                    sig.get("source_node", ""),
+                )
+
+            console.print(table)
+            console.print()
+
+        # Alerts
+        alerts = state.get("alerts", [])
+        if alerts:
+            console.print("[bold red]Alerts[/bold red]")
+            for alert in alerts:
+                severity = alert.get("severity", "medium")
+                emoji = _SEVERITY_EMOJI.get(severity, "⚠️")
+                console.print(f"  {emoji} {alert.get('title')}: {alert.get('message')}")
+            console.print()
+
+        # Errors
+        errors = state.get("errors", [])
+        if errors:
+            console.print("[bold yellow]Errors[/bold yellow]")
+            for error in errors:
+                console.print(f"  ⚠️ [{error.get('node')}] {error.get('error')}")
+            console.print()
 
 
 @click.command()
@@ -149,7 +204,7 @@ def main(once: bool, scheduled: bool, status: bool, verbose: bool) -> None:
         return
 
     if once:
-        console.print("[bold]Running Fingent analysis...[/bold]\n")
+        get_console().print("[bold]Running Fingent analysis...[/bold]\n")
         state = run_pipeline_once()
         display_report(state)
         return
@@ -165,71 +220,73 @@ def main(once: bool, scheduled: bool, status: bool, verbose: bool) -> None:
 
 def show_status() -> None:
     """Show system status."""
-    settings = get_settings()
-    config = load_yaml_config()
-
-    console.print("\n[bold]Fingent System Status[/bold]\n")
-
-    # Settings table
-    table = Table(title="Configuration")
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value")
-
-    table.add_row("Environment", settings.fingent_env)
-    table.add_row("Timezone", settings.timezone)
-    table.add_row("Log Level", settings.log_level)
-    table.add_row("Database", settings.database_url)
-
-    console.print(table)
-    console.print()
-
-    # API Keys status
-    table = Table(title="API Keys")
-    table.add_column("Provider", style="cyan")
-    table.add_column("Status")
-
-    def check_key(key: Optional[str]) -> str:
-        if key and len(key) > 5:
-            return "[green]✓ Configured[/green]"
-        return "[red]✗ Missing[/red]"
-
-    table.add_row("FRED", check_key(settings.fred_api_key))
-    table.add_row("Finnhub", check_key(settings.finnhub_api_key))
-    table.add_row("AlphaVantage", check_key(settings.alphavantage_api_key))
-    table.add_row("OKX", check_key(settings.okx_api_key))
-    table.add_row("DeepSeek", check_key(settings.deepseek_api_key))
-    table.add_row("Qwen", check_key(settings.dashscope_api_key))
-    table.add_row("Telegram", check_key(settings.telegram_bot_token))
-
-    console.print(table)
-    console.print()
-
-    # Recent runs
-    persistence = create_persistence_service()
-    recent = persistence.list_snapshots(limit=5)
-
-    if recent:
-        table = Table(title="Recent Runs")
-        table.add_column("Run ID", style="cyan")
-        table.add_column("Time")
-        table.add_column("Signals", justify="right")
-        table.add_column("Alerts", justify="right")
-        table.add_column("Errors", justify="right")
-
-        for run in recent:
-            table.add_row(
-                run["run_id"][:20] + "...",
-                run["timestamp"][:19],
-                str(run["signal_count"]),
-                str(run["alert_count"]),
-                str(run["error_count"]),
-            )
+    from rich.table import Table
+    from fingent.services.persistence import create_persistence_service
+
+    console = get_console()
+
+    # Buffer all tables and write them to the terminal once
+    with console:
+        settings = get_settings()
+        config = load_yaml_config()
+
+        console.print("\n[bold]Fingent System Status[/bold]\n")
+
+        # Settings table
+        table = Table(title="Configuration")
+        table.add_column("Setting", style="cyan")
+        table.add_column("Value")
+
+        table.add_row("Environment", settings.fingent_env)
+        table.add_row("Timezone", settings.timezone)
+        table.add_row("Log Level", settings.log_level)
+        table.add_row("Database", settings.database_url)
+
+        console.print(table)
+        console.print()
+
+        # API Keys status
+        table = Table(title="API Keys")
+        table.add_column("Provider", style="cyan")
+        table.add_column("Status")
+
+        for label, attr in _API_KEYS:
+            key = getattr(settings, attr)
+            table.add_row(label, _KEY_CONFIGURED if key and len(key) > 5 else _KEY_MISSING)
 
         console.print(table)
+        console.print()
+
+        # Recent runs
+        persistence = create_persistence_service()
+        recent = persistence.list_snapshots(limit=5)
+
+        if recent:
+            table = Table(title="Recent Runs")
+            table.add_column("Run ID", style="cyan")
+            table.add_column("Time")
+            table.add_column("Signals", justify="right")
+            table.add_column("Alerts", justify="right")
+            table.add_column("Errors", justify="right")
+
+            for run in recent:
+                table.add_row(
+                    run["run_id"][:20] + "...",
+                    run["timestamp"][:19],
+                    str(run["signal_count"]),
+                    str(run["alert_count"]),
+                    str(run["error_count"]),
+                )
+
+            console.print(table)
 
 
 def run_scheduled() -> None:
     """Run with scheduler."""
+    from rich.table import Table
+    from fingent.services.scheduler import create_scheduler_service
+
+    console = get_console()
     console.print("[bold]Starting Fingent scheduler...[/bold]")
     console.print("Press Ctrl+C to stop\n")
 
@@ -255,20 +312,15 @@ def run_scheduled() -> None:
     def shutdown(signum, frame):
         console.print("\n[yellow]Shutting down...[/yellow]")
         scheduler.stop()
-        sys.exit(0)
+        _shutdown_event.set()
 
     signal.signal(signal.SIGINT, shutdown)
     signal.signal(signal.SIGTERM, shutdown)
 
-    # Keep running
-    try:
-        while True:
-            signal.pause()
-    except AttributeError:
-        # Windows doesn't have signal.pause
-        import time
-        while True:
-            time.sleep(1)
+    # Keep running until a signal arrives. Wait in short slices: an untimed
+    # wait is not interruptible on Windows, so the handler would never run
+    while not _shutdown_event.wait(timeout=1):
+        pass
 
 
 if __name__ == "__main__":
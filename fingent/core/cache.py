@@ -6,17 +6,106 @@ Provides TTL-based caching for API responses to reduce API calls.
 
 import hashlib
 import json
+import threading
 import time
-from functools import wraps
-from typing import Any, Callable, Optional
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from typing import Any, Callable, Hashable, Optional
 
-from cachetools import TTLCache
-
-from fingent.core.config import get_settings, load_yaml_config
+from fingent.core.config import get_settings, load_yaml_config, on_config_reload
 from fingent.core.logging import get_logger
 
+try:
+    import xxhash
+
+    def _hash_bytes(data: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(data)
+except ImportError:
+    def _hash_bytes(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _hash_key(key_str: str) -> str:
+    return _hash_bytes(key_str.encode())
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values JSON can't represent (sets sorted for stable keys)."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    return repr(obj)
+
+
+try:
+    import orjson
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+except ImportError:
+    def _dumps_sorted(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=_json_default).encode()
+
 logger = get_logger("cache")
 
+# Marks a cache miss, so None can be cached as a real result
+_MISSING = object()
+
+
+class FastTTLCache:
+    """
+    LRU cache with per-entry TTL and lazy expiry.
+
+    Entries carry their monotonic expiry time and are only checked when
+    read, so get/set avoid the timer bookkeeping TTLCache does on every
+    operation. Stale entries that are never read again are pushed out
+    by LRU eviction.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value, expiring after ttl seconds (cache default if None)."""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
 
 class CacheManager:
     """
@@ -31,26 +120,32 @@ class CacheManager:
     def __init__(self, maxsize: int = 1000, ttl: Optional[int] = None):
         settings = get_settings()
         self.ttl = ttl or settings.cache_ttl
-        self._cache = TTLCache(maxsize=maxsize, ttl=self.ttl)
-        self._stats = {"hits": 0, "misses": 0}
-
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache."""
-        value = self._cache.get(key)
-        if value is not None:
-            self._stats["hits"] += 1
+        self._cache = FastTTLCache(maxsize=maxsize, ttl=self.ttl)
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get value from cache.
+
+        Cached None values count as hits; pass a sentinel default to
+        tell them apart from misses.
+        """
+        value = self._cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self._hits += 1
             logger.debug(f"Cache hit: {key}")
-        else:
-            self._stats["misses"] += 1
-            logger.debug(f"Cache miss: {key}")
-        return value
-
-    def set(self, key: str, value: Any) -> None:
-        """Set value in cache."""
-        self._cache[key] = value
+            return value
+        self._misses += 1
+        logger.debug(f"Cache miss: {key}")
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Set value in cache (ttl overrides the cache TTL for this entry)."""
+        self._cache.set(key, value, ttl)
         logger.debug(f"Cache set: {key}")
 
-    def delete(self, key: str) -> None:
+    def delete(self, key: Hashable) -> None:
         """Delete key from cache."""
         self._cache.pop(key, None)
 
@@ -62,10 +157,11 @@ class CacheManager:
     @property
     def stats(self) -> dict[str, int]:
         """Get cache statistics."""
-        total = self._stats["hits"] + self._stats["misses"]
-        hit_rate = self._stats["hits"] / total if total > 0 else 0
+        total = self._hits + self._misses
+        hit_rate = self._hits / total if total > 0 else 0
         return {
-            **self._stats,
+            "hits": self._hits,
+            "misses": self._misses,
             "total": total,
             "hit_rate": round(hit_rate, 3),
             "size": len(self._cache),
@@ -73,48 +169,81 @@ class CacheManager:
 
 
 def make_cache_key(*args, **kwargs) -> str:
-    """Generate a cache key from function arguments."""
-    key_parts = [str(arg) for arg in args]
-    key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-    key_str = ":".join(key_parts)
-    return hashlib.md5(key_str.encode()).hexdigest()
+    """
+    Generate a cache key from function arguments.
+
+    Keys only live in this process, so a fast non-cryptographic
+    64-bit hash is used (xxh3 if installed, else BLAKE2b). Container
+    arguments are serialized with sorted keys so equal dicts always
+    give the same key regardless of insertion order.
+    """
+    if any(isinstance(v, (dict, list, set, frozenset)) for v in (*args, *kwargs.values())):
+        try:
+            return _hash_bytes(_dumps_sorted((args, kwargs)))
+        except TypeError:
+            # e.g. mixed-type dict keys that can't be sorted
+            pass
+    if kwargs:
+        return _hash_key(repr(args) + repr(_kwargs_items(kwargs)))
+    return _hash_key(repr(args))
+
+
+def _kwargs_items(kwargs: dict[str, Any]) -> tuple:
+    """Kwargs as a canonical tuple; only multi-kwarg calls need sorting."""
+    if len(kwargs) == 1:
+        return tuple(kwargs.items())
+    return tuple(sorted(kwargs.items()))
 
 
 def cached(
     cache: Optional[CacheManager] = None,
     ttl: Optional[int] = None,
     key_prefix: str = "",
+    cache_name: Optional[str] = None,
 ) -> Callable:
     """
     Decorator for caching function results.
 
+    Decorated functions share named caches instead of each allocating
+    their own, so keys are namespaced by the function's qualified name.
+
     Args:
-        cache: CacheManager instance. Creates new one if not provided.
+        cache: CacheManager instance. Uses a shared named cache if not provided.
         ttl: Override TTL for this cache
         key_prefix: Prefix for cache keys
+        cache_name: Shared cache to use (defaults to one cache per TTL)
 
     Example:
         @cached(ttl=300)
         def fetch_data(symbol: str) -> dict:
             ...
     """
-    _cache = cache or CacheManager(ttl=ttl)
+    if cache is None:
+        cache = get_named_cache(cache_name or (f"ttl:{ttl}" if ttl else "default"), ttl=ttl)
+    _cache = cache
 
     def decorator(func: Callable) -> Callable:
+        func_name = f"{func.__module__}.{func.__qualname__}"
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Generate cache key
-            key = f"{key_prefix}:{func.__name__}:{make_cache_key(*args, **kwargs)}"
+            # Hashable arguments are used as the key directly (no hashing
+            # or formatting); anything else goes through make_cache_key
+            key = (key_prefix, func_name, args, _kwargs_items(kwargs) if kwargs else ())
+            try:
+                hash(key)
+            except TypeError:
+                key = f"{key_prefix}:{func_name}:{make_cache_key(*args, **kwargs)}"
 
             # Try to get from cache
-            result = _cache.get(key)
-            if result is not None:
+            result = _cache.get(key, _MISSING)
+            if result is not _MISSING:
                 return result
 
-            # Execute function and cache result
+            # Execute function and cache result (None included, so
+            # "no data" answers don't re-hit the upstream API)
             result = func(*args, **kwargs)
-            if result is not None:
-                _cache.set(key, result)
+            _cache.set(key, result)
             return result
 
         # Expose cache for manual operations
@@ -124,13 +253,39 @@ def cached(
     return decorator
 
 
-# Global cache instances for different purposes
-_provider_cache: Optional[CacheManager] = None
-_provider_caches: dict[str, CacheManager] = {}
-_llm_cache: Optional[CacheManager] = None
+# Shared cache instances by name (decorators, providers, LLM)
+_named_caches: dict[str, CacheManager] = {}
+
+
+def get_named_cache(
+    name: str,
+    ttl: Optional[int] = None,
+    maxsize: int = 1000,
+) -> CacheManager:
+    """
+    Get or create a shared cache.
+
+    Args:
+        name: Cache name
+        ttl: TTL in seconds (settings.cache_ttl if not provided). If an
+            existing cache has a different TTL it is replaced.
+        maxsize: Max entries when creating the cache
 
+    Returns:
+        CacheManager shared by all callers using this name
+    """
+    existing = _named_caches.get(name)
+    if existing and (ttl is None or existing.ttl == ttl):
+        return existing
 
+    cache = CacheManager(maxsize=maxsize, ttl=ttl)
+    _named_caches[name] = cache
+    return cache
+
+
+@lru_cache(maxsize=128)
 def _get_provider_ttl(provider_name: Optional[str]) -> int:
+    """Resolve provider cache TTL (memoized until reload_config)."""
     settings = get_settings()
     config = load_yaml_config()
     usage_mode = config.get("usage_mode", {})
@@ -143,29 +298,39 @@ def _get_provider_ttl(provider_name: Optional[str]) -> int:
     return int(default_ttl)
 
 
+@lru_cache(maxsize=128)
+def get_kind_ttl(provider_name: Optional[str], kind: str) -> int:
+    """
+    Resolve cache TTL for one kind of provider data.
+
+    usage_mode.cache_ttl.kinds sets a floor per data kind (e.g. daily bars
+    barely change intraday), so short provider TTLs tuned for quotes do not
+    force re-fetching slow-moving series. Memoized until reload_config.
+    """
+    provider_ttl = _get_provider_ttl(provider_name)
+    kinds = load_yaml_config().get("usage_mode", {}).get("cache_ttl", {}).get("kinds", {})
+    kind_ttl = kinds.get(kind)
+    return max(provider_ttl, int(kind_ttl)) if kind_ttl else provider_ttl
+
+
+# Provider caches whose TTL changed are rebuilt on next access
+on_config_reload(_get_provider_ttl.cache_clear)
+on_config_reload(get_kind_ttl.cache_clear)
+
+
 def get_provider_cache(provider_name: Optional[str] = None) -> CacheManager:
     """Get cache for provider API responses (supports per-provider TTL)."""
-    global _provider_cache
     if not provider_name:
-        if _provider_cache is None:
-            settings = get_settings()
-            _provider_cache = CacheManager(maxsize=500, ttl=settings.cache_ttl)
-        return _provider_cache
-
-    ttl = _get_provider_ttl(provider_name)
-    existing = _provider_caches.get(provider_name)
-    if existing and existing.ttl == ttl:
-        return existing
+        return get_named_cache("provider", maxsize=500)
 
-    cache = CacheManager(maxsize=500, ttl=ttl)
-    _provider_caches[provider_name] = cache
-    return cache
+    return get_named_cache(
+        f"provider:{provider_name}",
+        ttl=_get_provider_ttl(provider_name),
+        maxsize=500,
+    )
 
 
 def get_llm_cache() -> CacheManager:
     """Get cache for LLM responses (longer TTL)."""
-    global _llm_cache
-    if _llm_cache is None:
-        # LLM responses cached for 1 hour
-        _llm_cache = CacheManager(maxsize=100, ttl=3600)
-    return _llm_cache
+    # LLM responses cached for 1 hour
+    return get_named_cache("llm", ttl=3600, maxsize=100)
@@ -8,9 +8,10 @@ Supports:
 """
 
 import os
+import threading
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import yaml
 from pydantic import Field, field_validator
@@ -77,6 +78,7 @@ class Settings(BaseSettings):
     # Database
     # ==============================================
     database_url: str = Field(default="sqlite:///data/fingent.db")
+    redis_url: str = Field(default="redis://localhost:6379/0", description="Redis for shared arb snapshots")
 
     # ==============================================
     # Telegram
@@ -90,6 +92,7 @@ class Settings(BaseSettings):
     # ==============================================
     cache_ttl: int = Field(default=3600, description="Cache TTL in seconds")
     http_timeout: int = Field(default=30, description="HTTP timeout in seconds")
+    http_cache_ttl: int = Field(default=0, description="Reuse GET responses for N seconds unless Cache-Control says otherwise (0 = cache off)")
 
     @field_validator("log_level")
     @classmethod
@@ -151,10 +154,24 @@ def get_settings() -> Settings:
     return loader.load()
 
 
+# Parsed YAML keyed by path, with the (mtime_ns, size, inode) it was read at
+_yaml_cache: dict[str, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+_yaml_cache_lock = threading.Lock()
+
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:  # PyYAML built without libyaml
+    _YamlLoader = yaml.SafeLoader
+
+
 def load_yaml_config(config_path: Optional[str] = None) -> dict[str, Any]:
     """
     Load YAML configuration file.
 
+    The parsed result is cached and only re-read when the file changes
+    on disk, so the returned dict is shared and must be treated as
+    read-only.
+
     Args:
         config_path: Path to config file. Defaults to config/config.yaml
 
@@ -171,20 +188,56 @@ def load_yaml_config(config_path: Optional[str] = None) -> dict[str, Any]:
         else:
             config_path = "config/config.yaml"
 
-    path = Path(config_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
 
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(config_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    with _yaml_cache_lock:
+        _yaml_cache[config_path] = (signature, config)
+    return config
 
 
 # Convenience function
+@lru_cache(maxsize=1)
 def get_config() -> dict[str, Any]:
-    """Get the full configuration (settings + YAML config)."""
+    """Get the full configuration (settings + YAML config), cached until reload_config()."""
     settings = get_settings()
     yaml_config = load_yaml_config()
     return {
         "settings": settings,
         "config": yaml_config,
     }
+
+
+# Callbacks that drop values derived from config (registered by other modules)
+_reload_hooks: list[Callable[[], None]] = []
+
+
+def on_config_reload(hook: Callable[[], None]) -> None:
+    """Register a callback to run on reload_config()."""
+    _reload_hooks.append(hook)
+
+
+def reload_config() -> None:
+    """
+    Drop cached settings and YAML config.
+
+    Call after editing .env or config.yaml at runtime; the next
+    get_settings() / load_yaml_config() reads them again.
+    """
+    get_settings.cache_clear()
+    get_config.cache_clear()
+    with _yaml_cache_lock:
+        _yaml_cache.clear()
+    for hook in _reload_hooks:
+        hook()
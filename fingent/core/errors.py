@@ -10,6 +10,8 @@ from typing import Any, Optional
 class FingentError(Exception):
     """Base exception for all Fingent errors."""
 
+    __slots__ = ("message", "code", "details")
+
     def __init__(
         self,
         message: str,
@@ -34,6 +36,8 @@ class FingentError(Exception):
 class ConfigurationError(FingentError):
     """Configuration-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, **kwargs):
         super().__init__(message, code="CONFIG_ERROR", **kwargs)
 
@@ -41,6 +45,8 @@ class ConfigurationError(FingentError):
 class ProviderError(FingentError):
     """Data provider errors (API failures, rate limits, etc.)."""
 
+    __slots__ = ("provider", "recoverable")
+
     def __init__(
         self,
         message: str,
@@ -49,9 +55,7 @@ class ProviderError(FingentError):
         recoverable: bool = True,
         **kwargs,
     ):
-        details = kwargs.pop("details", {})
-        details["provider"] = provider
-        details["recoverable"] = recoverable
+        details = {**kwargs.pop("details", {}), "provider": provider, "recoverable": recoverable}
         super().__init__(message, code="PROVIDER_ERROR", details=details, **kwargs)
         self.provider = provider
         self.recoverable = recoverable
@@ -60,6 +64,8 @@ class ProviderError(FingentError):
 class DataNotAvailableError(ProviderError):
     """Requested data is not available (missing, insufficient history, etc.)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, *, provider: str, **kwargs):
         super().__init__(message, provider=provider, recoverable=True, **kwargs)
         self.code = "DATA_NOT_AVAILABLE"
@@ -68,6 +74,8 @@ class DataNotAvailableError(ProviderError):
 class RateLimitError(ProviderError):
     """API rate limit exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str,
@@ -76,8 +84,7 @@ class RateLimitError(ProviderError):
         retry_after: Optional[int] = None,
         **kwargs,
     ):
-        details = kwargs.pop("details", {})
-        details["retry_after"] = retry_after
+        details = {**kwargs.pop("details", {}), "retry_after": retry_after}
         super().__init__(message, provider=provider, recoverable=True, details=details, **kwargs)
         self.code = "RATE_LIMIT"
         self.retry_after = retry_after
@@ -86,6 +93,8 @@ class RateLimitError(ProviderError):
 class QuotaExceededError(ProviderError):
     """Internal quota exceeded (configured budget)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, *, provider: str, **kwargs):
         super().__init__(message, provider=provider, recoverable=True, **kwargs)
         self.code = "QUOTA_EXCEEDED"
@@ -94,6 +103,8 @@ class QuotaExceededError(ProviderError):
 class AuthenticationError(ProviderError):
     """API authentication failed."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, *, provider: str, **kwargs):
         super().__init__(message, provider=provider, recoverable=False, **kwargs)
         self.code = "AUTH_ERROR"
@@ -102,6 +113,8 @@ class AuthenticationError(ProviderError):
 class NodeExecutionError(FingentError):
     """Error during LangGraph node execution."""
 
+    __slots__ = ("node_name", "cause")
+
     def __init__(
         self,
         message: str,
@@ -110,8 +123,7 @@ class NodeExecutionError(FingentError):
         cause: Optional[Exception] = None,
         **kwargs,
     ):
-        details = kwargs.pop("details", {})
-        details["node"] = node_name
+        details = {**kwargs.pop("details", {}), "node": node_name}
         if cause:
             details["cause"] = str(cause)
         super().__init__(message, code="NODE_ERROR", details=details, **kwargs)
@@ -122,6 +134,8 @@ class NodeExecutionError(FingentError):
 class LLMError(FingentError):
     """LLM invocation errors."""
 
+    __slots__ = ("provider", "model")
+
     def __init__(
         self,
         message: str,
@@ -130,9 +144,7 @@ class LLMError(FingentError):
         model: Optional[str] = None,
         **kwargs,
     ):
-        details = kwargs.pop("details", {})
-        details["llm_provider"] = provider
-        details["model"] = model
+        details = {**kwargs.pop("details", {}), "llm_provider": provider, "model": model}
         super().__init__(message, code="LLM_ERROR", details=details, **kwargs)
         self.provider = provider
         self.model = model
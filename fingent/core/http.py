@@ -5,22 +5,174 @@ Provides a unified HTTP interface for all providers.
 """
 
 import asyncio
+import atexit
+import copy
+import json
+import logging
+import re
+import threading
+import time
+from importlib.util import find_spec
 from typing import Any, Optional
 
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from tenacity import RetryCallState, retry, retry_if_exception, wait_random_exponential
 
+from fingent.core.cache import FastTTLCache, make_cache_key
 from fingent.core.config import get_settings
 from fingent.core.errors import ProviderError, RateLimitError
 from fingent.core.logging import get_logger
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger("http")
 
+# Upper bound on a server-supplied Retry-After before we give up waiting
+MAX_RETRY_AFTER = 60
+
+_backoff = wait_random_exponential(multiplier=0.1, max=10)
+
+# Proactive throttling: pause a provider once its rate-limit headers
+# show less than this fraction (or count) of requests remaining.
+THROTTLE_REMAINING_RATIO = 0.1
+THROTTLE_REMAINING_MIN = 2
+DEFAULT_THROTTLE_SECONDS = 1.0
+
+# (remaining, limit, reset) header names, checked in order
+_RATELIMIT_HEADERS = (
+    ("x-ratelimit-remaining", "x-ratelimit-limit", "x-ratelimit-reset"),
+    ("x-ratelimit-remaining-requests", "x-ratelimit-limit-requests", "x-ratelimit-reset-requests"),
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-limit", "anthropic-ratelimit-requests-reset"),
+)
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate-limit reset header into seconds from now.
+
+    Accepts delta seconds ("12"), epoch seconds ("1767225600") and
+    durations ("1m30s", "250ms"). Unparseable values return None.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        parts = _DURATION_PART.findall(value)
+        if not parts:
+            return None
+        return sum(float(n) * _DURATION_UNITS[unit] for n, unit in parts)
+    if seconds > 1e9:
+        seconds -= time.time()
+    return max(seconds, 0.0)
+
+
+# Response cache for idempotent GETs
+RESPONSE_CACHE_MAXSIZE = 4096
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def _response_ttl(response: httpx.Response, default_ttl: float) -> float:
+    """
+    Get how long a response may be reused.
+
+    Only consulted when the cache is on (default TTL > 0). Cache-Control
+    wins when present (no-store/no-cache -> 0, else max-age); otherwise
+    the client's default TTL applies.
+    """
+    cache_control = response.headers.get("cache-control")
+    if not cache_control:
+        return default_ttl
+    cache_control = cache_control.lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    match = _MAX_AGE.search(cache_control)
+    return float(match.group(1)) if match else default_ttl
+
+
+# Retry token bucket (per provider): each retry costs a token, each
+# success refunds a fraction. An empty bucket fails retries fast. The
+# bucket holds a few requests' worth of retries, so an outage drains it
+# after a handful of failed calls.
+RETRY_BUCKET_MULTIPLE = 3
+RETRY_COST = 1.0
+RETRY_SUCCESS_REFUND = 0.1
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry on 429s and on timeouts/network errors (wrapped as ProviderError)."""
+    if isinstance(exc, RateLimitError):
+        return True
+    return isinstance(exc, ProviderError) and isinstance(
+        exc.__cause__, (httpx.TimeoutException, httpx.NetworkError)
+    )
+
+
+def _wait_strategy(retry_state: RetryCallState) -> float:
+    """Honor Retry-After on 429, otherwise full-jitter exponential backoff."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, RateLimitError) and exc.retry_after is not None:
+        return float(min(exc.retry_after, MAX_RETRY_AFTER))
+    return _backoff(retry_state)
+
+
+def _stop_strategy(retry_state: RetryCallState) -> bool:
+    """Stop after the client's own max_retries attempts."""
+    return retry_state.attempt_number >= retry_state.args[0].max_retries
+
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Async clients are shared process-wide so keep-alive connections are
+# reused across HttpClient instances with the same settings.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=100,
+    max_connections=200,
+    keepalive_expiry=30,
+)
+_async_clients: dict[tuple, httpx.AsyncClient] = {}
+_async_clients_lock = threading.Lock()
+
+
+async def aclose_all() -> None:
+    """Close all pooled async clients. Await from the owning event loop on shutdown."""
+    with _async_clients_lock:
+        clients = list(_async_clients.values())
+        _async_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+def _consume_retry_token(retry_state: RetryCallState) -> None:
+    """Charge a retry against the provider's token bucket, or fail fast."""
+    if retry_state.attempt_number <= 1:
+        return
+    client = retry_state.args[0]
+    provider = retry_state.kwargs.get("provider_name", "unknown")
+    if not client._take_retry_token(provider):
+        raise ProviderError(
+            "Retry budget exhausted, failing fast",
+            provider=provider,
+            recoverable=False,
+        )
+
+
+_retry_policy = retry(
+    before=_consume_retry_token,
+    retry=retry_if_exception(_is_retryable),
+    stop=_stop_strategy,
+    wait=_wait_strategy,
+    reraise=True,
+)
+
 
 class HttpClient:
     """
@@ -28,8 +180,11 @@ class HttpClient:
 
     Features:
     - Configurable timeout
-    - Exponential backoff retry
-    - Rate limit handling
+    - Pooled keep-alive connections (HTTP/2 when h2 is installed)
+    - Response cache for GETs (Cache-Control aware)
+    - Jittered exponential backoff retry
+    - Rate limit handling (honors Retry-After, pauses early on
+      rate-limit headers)
     - Request/response logging
     """
 
@@ -44,11 +199,93 @@ class HttpClient:
         self.base_url = base_url
         self.timeout = timeout or settings.http_timeout
         self.max_retries = max_retries
+        self.cache_ttl = settings.http_cache_ttl
+        self._response_cache = FastTTLCache(maxsize=RESPONSE_CACHE_MAXSIZE, ttl=self.cache_ttl)
+        self._throttle_until: dict[str, float] = {}
+        self._retry_tokens_max = float(RETRY_BUCKET_MULTIPLE * max(max_retries, 1))
+        self._retry_tokens: dict[str, float] = {}
+        self._retry_tokens_lock = threading.Lock()
         self.default_headers = headers or {}
 
         self._client: Optional[httpx.Client] = None
         self._async_client: Optional[httpx.AsyncClient] = None
 
+    def _take_retry_token(self, provider_name: str) -> bool:
+        """Consume one retry token for a provider. False if the bucket is empty."""
+        with self._retry_tokens_lock:
+            tokens = self._retry_tokens.get(provider_name, self._retry_tokens_max)
+            if tokens < RETRY_COST:
+                return False
+            self._retry_tokens[provider_name] = tokens - RETRY_COST
+            return True
+
+    def _refund_retry_token(self, provider_name: str) -> None:
+        """Refill a provider's retry bucket after a successful response."""
+        with self._retry_tokens_lock:
+            tokens = self._retry_tokens.get(provider_name)
+            if tokens is not None and tokens < self._retry_tokens_max:
+                self._retry_tokens[provider_name] = min(
+                    self._retry_tokens_max, tokens + RETRY_SUCCESS_REFUND
+                )
+
+    def _throttle_delay(self, provider_name: str) -> float:
+        """Seconds to wait before the next request to a provider."""
+        until = self._throttle_until.get(provider_name)
+        if until is None:
+            return 0.0
+        delay = until - time.monotonic()
+        if delay <= 0:
+            self._throttle_until.pop(provider_name, None)
+            return 0.0
+        return delay
+
+    def _update_throttle(self, response: httpx.Response, provider_name: str) -> None:
+        """Pause a provider ahead of a 429 when its rate-limit headers run low."""
+        response_headers = response.headers
+        for remaining_name, limit_name, reset_name in _RATELIMIT_HEADERS:
+            remaining = response_headers.get(remaining_name)
+            if remaining is not None:
+                break
+        else:
+            return
+
+        try:
+            remaining = float(remaining)
+            limit = float(response_headers.get(limit_name) or 0)
+        except ValueError:
+            return
+        if remaining > THROTTLE_REMAINING_MIN and (
+            not limit or remaining / limit >= THROTTLE_REMAINING_RATIO
+        ):
+            return
+
+        reset = _parse_reset(response_headers.get(reset_name))
+        if reset is None:
+            reset = DEFAULT_THROTTLE_SECONDS
+        reset = min(reset, MAX_RETRY_AFTER)
+        logger.info(f"{provider_name}: {remaining:.0f} requests left, pausing {reset:.1f}s")
+        self._throttle_until[provider_name] = time.monotonic() + reset
+
+    def _cache_key(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]],
+    ) -> str:
+        """Cache key for a GET (URL, params and per-call headers)."""
+        return make_cache_key(url, params=params or {}, headers=headers or {})
+
+    def _cached_response(self, key: str) -> Any:
+        """Get a private copy of a cached GET body, or None."""
+        cached = self._response_cache.get(key)
+        return None if cached is None else copy.deepcopy(cached)
+
+    def _cache_response(self, key: str, response: httpx.Response, data: Any) -> None:
+        """Remember a copy of a successful GET body for as long as it may be reused."""
+        ttl = _response_ttl(response, self.cache_ttl)
+        if ttl > 0:
+            self._response_cache.set(key, copy.deepcopy(data), ttl=ttl)
+
     @property
     def client(self) -> httpx.Client:
         """Lazy-initialized sync HTTP client."""
@@ -56,6 +293,8 @@ class HttpClient:
             client_kwargs = {
                 "timeout": self.timeout,
                 "headers": self.default_headers,
+                "limits": _POOL_LIMITS,
+                "http2": HTTP2_AVAILABLE,
             }
             if self.base_url:
                 client_kwargs["base_url"] = self.base_url
@@ -64,31 +303,49 @@ class HttpClient:
 
     @property
     def async_client(self) -> httpx.AsyncClient:
-        """Lazy-initialized async HTTP client."""
+        """Pooled async HTTP client shared by clients with the same settings."""
         if self._async_client is None:
-            client_kwargs = {
-                "timeout": self.timeout,
-                "headers": self.default_headers,
-            }
-            if self.base_url:
-                client_kwargs["base_url"] = self.base_url
-            self._async_client = httpx.AsyncClient(**client_kwargs)
+            key = (
+                self.base_url,
+                self.timeout,
+                tuple(sorted(self.default_headers.items())),
+            )
+            with _async_clients_lock:
+                client = _async_clients.get(key)
+                if client is None or client.is_closed:
+                    client_kwargs = {
+                        "timeout": self.timeout,
+                        "headers": self.default_headers,
+                        "limits": _POOL_LIMITS,
+                        "http2": HTTP2_AVAILABLE,
+                    }
+                    if self.base_url:
+                        client_kwargs["base_url"] = self.base_url
+                    client = httpx.AsyncClient(**client_kwargs)
+                    _async_clients[key] = client
+            self._async_client = client
         return self._async_client
 
     def close(self) -> None:
-        """Close HTTP clients."""
+        """Close the sync HTTP client."""
         if self._client:
             self._client.close()
             self._client = None
-        if self._async_client:
-            asyncio.get_event_loop().run_until_complete(self._async_client.aclose())
-            self._async_client = None
-
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
+        # The async client is pooled; release our reference only
+        self._async_client = None
+
+    async def aclose(self) -> None:
+        """Close HTTP clients, including the pooled async client."""
+        client = self._async_client
+        self.close()
+        if client is not None:
+            with _async_clients_lock:
+                for key, pooled in list(_async_clients.items()):
+                    if pooled is client:
+                        del _async_clients[key]
+            await client.aclose()
+
+    @_retry_policy
     def get(
         self,
         url: str,
@@ -106,6 +363,10 @@ class HttpClient:
             headers: Additional headers
             provider_name: Provider name for error reporting
 
+        With HTTP_CACHE_TTL > 0, successful responses are reused until
+        their Cache-Control max-age (or HTTP_CACHE_TTL if the server sends
+        none) runs out. Each caller gets its own copy of a cached body.
+
         Returns:
             JSON response as dict
 
@@ -113,10 +374,24 @@ class HttpClient:
             ProviderError: On request failure
             RateLimitError: On 429 status
         """
+        cache_key = None
+        if self.cache_ttl > 0:
+            cache_key = self._cache_key(url, params, headers)
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
+
+        delay = self._throttle_delay(provider_name)
+        if delay:
+            time.sleep(delay)
         try:
-            logger.debug(f"GET {url} params={params}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"GET {url} params={params}")
             response = self.client.get(url, params=params, headers=headers)
-            return self._handle_response(response, provider_name)
+            data = self._handle_response(response, provider_name)
+            if cache_key is not None:
+                self._cache_response(cache_key, response, data)
+            return data
         except httpx.TimeoutException as e:
             logger.warning(f"Timeout on GET {url}: {e}")
             raise ProviderError(
@@ -132,11 +407,7 @@ class HttpClient:
                 recoverable=True,
             ) from e
 
-    @retry(
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-    )
+    @_retry_policy
     def post(
         self,
         url: str,
@@ -147,8 +418,12 @@ class HttpClient:
         provider_name: str = "unknown",
     ) -> dict[str, Any]:
         """Make a POST request with retry logic."""
+        delay = self._throttle_delay(provider_name)
+        if delay:
+            time.sleep(delay)
         try:
-            logger.debug(f"POST {url}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"POST {url}")
             response = self.client.post(url, json=json, data=data, headers=headers)
             return self._handle_response(response, provider_name)
         except httpx.TimeoutException as e:
@@ -172,11 +447,25 @@ class HttpClient:
         headers: Optional[dict[str, str]] = None,
         provider_name: str = "unknown",
     ) -> dict[str, Any]:
-        """Async GET request."""
+        """Async GET request. Cached like get()."""
+        cache_key = None
+        if self.cache_ttl > 0:
+            cache_key = self._cache_key(url, params, headers)
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
+
+        delay = self._throttle_delay(provider_name)
+        if delay:
+            await asyncio.sleep(delay)
         try:
-            logger.debug(f"Async GET {url} params={params}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Async GET {url} params={params}")
             response = await self.async_client.get(url, params=params, headers=headers)
-            return self._handle_response(response, provider_name)
+            data = self._handle_response(response, provider_name)
+            if cache_key is not None:
+                self._cache_response(cache_key, response, data)
+            return data
         except httpx.TimeoutException as e:
             raise ProviderError(
                 f"Request timeout: {url}",
@@ -199,16 +488,19 @@ class HttpClient:
             )
 
         if response.status_code >= 400:
-            logger.error(f"HTTP {response.status_code}: {response.text[:200]}")
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"HTTP {response.status_code}: {response.text[:200]}")
             raise ProviderError(
                 f"HTTP {response.status_code}: {response.reason_phrase}",
                 provider=provider_name,
                 recoverable=response.status_code >= 500,
             )
 
+        self._refund_retry_token(provider_name)
+        self._update_throttle(response, provider_name)
         try:
-            return response.json()
-        except Exception:
+            return _json_loads(response.content)
+        except ValueError:
             # Return text content wrapped in dict
             return {"_raw": response.text}
 
@@ -222,4 +514,5 @@ def get_http_client() -> HttpClient:
     global _default_client
     if _default_client is None:
         _default_client = HttpClient()
+        atexit.register(_default_client.close)
     return _default_client
@@ -6,15 +6,60 @@ Supports:
 - Cloud: JSON format for CloudWatch
 """
 
+import copy
 import logging
 import logging.config
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 
+# Parsed logging.yaml by path, tagged with the file's (mtime_ns, size)
+_config_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:  # PyYAML built without libyaml
+    _YamlLoader = yaml.SafeLoader
+
+
+@lru_cache(maxsize=1)
+def _default_config_path() -> Optional[str]:
+    """Find config/logging.yaml next to the project's pyproject.toml."""
+    current = Path(__file__).resolve()
+    for parent in current.parents:
+        if (parent / "pyproject.toml").exists():
+            return str(parent / "config" / "logging.yaml")
+    return None
+
+
+def _load_logging_config(config_path: str) -> dict[str, Any]:
+    """
+    Load logging.yaml, re-parsing only when the file changes.
+
+    Returns a fresh copy each call because dictConfig mutates its input.
+    """
+    st = os.stat(config_path)
+    signature = (st.st_mtime_ns, st.st_size)
+
+    cached = _config_cache.get(config_path)
+    if cached is None or cached[0] != signature:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+
+        # Ensure log file directory exists
+        for handler in config.get("handlers", {}).values():
+            if "filename" in handler:
+                Path(handler["filename"]).parent.mkdir(parents=True, exist_ok=True)
+
+        cached = (signature, config)
+        _config_cache[config_path] = cached
+
+    return copy.deepcopy(cached[1])
+
 
 def setup_logging(
     config_path: Optional[str] = None,
@@ -36,22 +81,10 @@ def setup_logging(
 
     # Try to load from YAML config
     if config_path is None:
-        current = Path(__file__).resolve()
-        for parent in current.parents:
-            if (parent / "pyproject.toml").exists():
-                config_path = str(parent / "config" / "logging.yaml")
-                break
+        config_path = _default_config_path()
 
     if config_path and Path(config_path).exists():
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-
-        # Ensure log file directory exists
-        for handler in config.get("handlers", {}).values():
-            if "filename" in handler:
-                Path(handler["filename"]).parent.mkdir(parents=True, exist_ok=True)
-
-        logging.config.dictConfig(config)
+        logging.config.dictConfig(_load_logging_config(config_path))
     else:
         # Fallback to basic configuration
         _setup_basic_logging(env, level)
@@ -97,6 +130,8 @@ class LoggerMixin:
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class."""
-        if not hasattr(self, "_logger"):
+        try:
+            return self._logger
+        except AttributeError:
             self._logger = get_logger(self.__class__.__name__)
-        return self._logger
+            return self._logger
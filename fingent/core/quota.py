@@ -6,14 +6,16 @@ Tracks per-minute and per-day limits for providers based on config.yaml.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Optional
 
-from cachetools import TTLCache
-
 from fingent.core.config import load_yaml_config
 
+MINUTE = 60
+DAY = 86400
+
 
 @dataclass
 class QuotaCheckResult:
@@ -21,11 +23,22 @@ class QuotaCheckResult:
     reason: str = ""
 
 
+@dataclass(slots=True)
+class _Counter:
+    """Per-provider usage in the current minute and day windows."""
+    minute: int = 0
+    day: int = 0
+    m_win: int = -1
+    d_win: int = -1
+
+
 class QuotaManager:
     """
     Simple in-memory quota tracker.
 
     Limits are configured in config.yaml under usage_mode.quotas.
+    Usage is counted in fixed windows aligned to the epoch; a provider's
+    counter resets when the current minute/day window index moves on.
     """
 
     def __init__(self, config: Optional[dict] = None):
@@ -34,9 +47,19 @@ class QuotaManager:
         self.enabled = usage_mode.get("enabled", True)
         self.quotas = usage_mode.get("quotas", {})
 
-        # Counters reset by TTL.
-        self._per_minute = TTLCache(maxsize=512, ttl=60)
-        self._per_day = TTLCache(maxsize=512, ttl=86400)
+        self._counters: dict[str, _Counter] = {}
+
+    @staticmethod
+    def _roll(counter: _Counter, now: int) -> None:
+        """Reset counts whose window has passed."""
+        m_win = now // MINUTE
+        if counter.m_win != m_win:
+            counter.minute = 0
+            counter.m_win = m_win
+            d_win = now // DAY
+            if counter.d_win != d_win:
+                counter.day = 0
+                counter.d_win = d_win
 
     def check_and_consume(self, provider: str, cost: int = 1) -> QuotaCheckResult:
         """
@@ -49,38 +72,37 @@ class QuotaManager:
         if not self.enabled:
             return QuotaCheckResult(True)
 
-        limits = self.quotas.get(provider, {})
+        limits = self.quotas.get(provider)
         if not limits:
             return QuotaCheckResult(True)
 
-        per_minute = limits.get("per_minute")
-        per_day = limits.get("per_day")
+        counter = self._counters.get(provider)
+        if counter is None:
+            counter = self._counters.setdefault(provider, _Counter())
+        self._roll(counter, int(time.time()))
 
         # Check without consuming first.
-        if per_minute is not None:
-            used = self._per_minute.get(provider, 0)
-            if used + cost > per_minute:
-                return QuotaCheckResult(False, "per_minute quota exceeded")
+        per_minute = limits.get("per_minute")
+        if per_minute is not None and counter.minute + cost > per_minute:
+            return QuotaCheckResult(False, "per_minute quota exceeded")
 
-        if per_day is not None:
-            used = self._per_day.get(provider, 0)
-            if used + cost > per_day:
-                return QuotaCheckResult(False, "per_day quota exceeded")
+        per_day = limits.get("per_day")
+        if per_day is not None and counter.day + cost > per_day:
+            return QuotaCheckResult(False, "per_day quota exceeded")
 
         # Consume.
-        if per_minute is not None:
-            self._per_minute[provider] = self._per_minute.get(provider, 0) + cost
-        if per_day is not None:
-            self._per_day[provider] = self._per_day.get(provider, 0) + cost
+        counter.minute += cost
+        counter.day += cost
 
         return QuotaCheckResult(True)
 
     def get_usage(self, provider: str) -> dict[str, int]:
         """Get current usage counters for a provider."""
-        return {
-            "per_minute": self._per_minute.get(provider, 0),
-            "per_day": self._per_day.get(provider, 0),
-        }
+        counter = self._counters.get(provider)
+        if counter is None:
+            return {"per_minute": 0, "per_day": 0}
+        self._roll(counter, int(time.time()))
+        return {"per_minute": counter.minute, "per_day": counter.day}
 
 
 @lru_cache()
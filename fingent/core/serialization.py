@@ -0,0 +1,97 @@
+"""
+JSON serialization helpers for dataclass models.
+
+to_dict() always uses dataclasses.asdict, so values keep their Python
+types (int keys, tuples, NaN, big ints). JSON output uses orjson when
+installed (it serializes dataclasses natively in C), falling back to
+stdlib json otherwise; with orjson, NaN/inf serialize as null.
+"""
+
+import json
+from dataclasses import asdict
+from typing import Any
+
+import numpy as np
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values JSON does not handle natively (numpy, sets)."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_default_str(obj: Any) -> Any:
+    """Like _json_default, but stringify anything else (json default=str)."""
+    try:
+        return _json_default(obj)
+    except TypeError:
+        return str(obj)
+
+
+try:
+    import orjson
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def to_json(obj: Any) -> bytes:
+        """Serialize a dataclass (or plain data) to JSON bytes."""
+        return orjson.dumps(obj, default=_json_default, option=_OPTIONS)
+
+    def to_json_text(obj: Any) -> str:
+        """
+        Serialize to a JSON string for storage.
+
+        Unknown types are stringified; naive datetimes are taken as UTC.
+        """
+        return orjson.dumps(
+            obj, default=_json_default_str, option=_OPTIONS | orjson.OPT_NAIVE_UTC
+        ).decode()
+
+    from_json = orjson.loads
+
+except ImportError:
+    def to_json(obj: Any) -> bytes:
+        """Serialize a dataclass (or plain data) to JSON bytes."""
+        if hasattr(obj, "__dataclass_fields__"):
+            obj = asdict(obj)
+        return json.dumps(obj, default=_json_default, ensure_ascii=False).encode()
+
+    def to_json_text(obj: Any) -> str:
+        """
+        Serialize to a JSON string for storage.
+
+        Unknown types are stringified.
+        """
+        if hasattr(obj, "__dataclass_fields__"):
+            obj = asdict(obj)
+        return json.dumps(obj, default=_json_default_str, ensure_ascii=False)
+
+    from_json = json.loads
+
+
+def dataclass_to_dict(obj: Any) -> dict[str, Any]:
+    """Convert a dataclass to a dict (nested dataclasses are walked)."""
+    return asdict(obj)
+
+
+class JsonSerializable:
+    """
+    Mixin giving dataclasses to_dict() and to_json().
+
+    Only dataclass fields are serialized; nested dataclasses are walked.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable dict."""
+        return dataclass_to_dict(self)
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes."""
+        return to_json(self)
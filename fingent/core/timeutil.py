@@ -6,17 +6,33 @@ All internal timestamps use UTC, converted for display.
 """
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Union
-
-import pytz
+from zoneinfo import ZoneInfo
 
 from fingent.core.config import get_settings
 
 
-def get_timezone() -> pytz.timezone:
+_EASTERN = ZoneInfo("America/New_York")
+
+_FORMATS = {
+    "iso": "%Y-%m-%dT%H:%M:%SZ",
+    "display": "%Y-%m-%d %H:%M:%S",
+    "date": "%Y-%m-%d",
+    "time": "%H:%M:%S",
+    "log": "%Y-%m-%d %H:%M:%S.%f",
+}
+
+
+@lru_cache(maxsize=None)
+def _tz(name: str) -> ZoneInfo:
+    """Get a timezone by name (memoized)."""
+    return ZoneInfo(name)
+
+
+def get_timezone() -> ZoneInfo:
     """Get configured timezone."""
-    settings = get_settings()
-    return pytz.timezone(settings.timezone)
+    return _tz(get_settings().timezone)
 
 
 def now_utc() -> datetime:
@@ -34,8 +50,7 @@ def to_utc(dt: datetime) -> datetime:
     """Convert datetime to UTC."""
     if dt.tzinfo is None:
         # Assume it's in configured timezone
-        tz = get_timezone()
-        dt = tz.localize(dt)
+        dt = dt.replace(tzinfo=get_timezone())
     return dt.astimezone(timezone.utc)
 
 
@@ -61,15 +76,16 @@ def format_timestamp(dt: Optional[datetime] = None, fmt: str = "iso") -> str:
     if dt is None:
         dt = now_utc()
 
-    formats = {
-        "iso": "%Y-%m-%dT%H:%M:%SZ",
-        "display": "%Y-%m-%d %H:%M:%S",
-        "date": "%Y-%m-%d",
-        "time": "%H:%M:%S",
-        "log": "%Y-%m-%d %H:%M:%S.%f",
-    }
+    # Fast paths for the hot formats skip libc strftime
+    if fmt == "iso":
+        return dt.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
+    if fmt == "log":
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.{dt.microsecond:06d}"
+        )
 
-    return dt.strftime(formats.get(fmt, fmt))
+    return dt.strftime(_FORMATS.get(fmt, fmt))
 
 
 def parse_timestamp(s: str, fmt: str = "iso") -> datetime:
@@ -120,8 +136,7 @@ def is_market_hours(dt: Optional[datetime] = None) -> bool:
         dt = now_utc()
 
     # Convert to Eastern time
-    eastern = pytz.timezone("America/New_York")
-    dt_eastern = dt.astimezone(eastern)
+    dt_eastern = dt.astimezone(_EASTERN)
 
     # Check if weekday
     if dt_eastern.weekday() >= 5:  # Saturday = 5, Sunday = 6
@@ -5,10 +5,13 @@ Alerts are rule-based notifications triggered by market conditions.
 They are NOT produced by LLM - only by the rule engine.
 """
 
-from dataclasses import dataclass, asdict, field
+import operator
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
+import numpy as np
+
 from fingent.core.timeutil import format_timestamp, now_utc
 
 
@@ -20,7 +23,15 @@ class AlertSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+_SEVERITY_EMOJI = {
+    AlertSeverity.LOW.value: "📢",
+    AlertSeverity.MEDIUM.value: "⚠️",
+    AlertSeverity.HIGH.value: "🚨",
+    AlertSeverity.CRITICAL.value: "🔴",
+}
+
+
+@dataclass(slots=True)
 class Alert:
     """
     An alert triggered by rule-based conditions.
@@ -58,8 +69,19 @@ class Alert:
             self.triggered_at = format_timestamp(now_utc())
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to JSON-serializable dict."""
-        return asdict(self)
+        """Convert to JSON-serializable dict (condition/metadata are shared, not copied)."""
+        return {
+            "id": self.id,
+            "rule_name": self.rule_name,
+            "title": self.title,
+            "message": self.message,
+            "severity": self.severity,
+            "triggered_at": self.triggered_at,
+            "condition": self.condition,
+            "current_value": self.current_value,
+            "threshold": self.threshold,
+            "metadata": self.metadata,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Alert":
@@ -68,15 +90,9 @@ class Alert:
 
     def to_telegram_message(self) -> str:
         """Format alert for Telegram notification."""
-        severity_emoji = {
-            AlertSeverity.LOW.value: "📢",
-            AlertSeverity.MEDIUM.value: "⚠️",
-            AlertSeverity.HIGH.value: "🚨",
-            AlertSeverity.CRITICAL.value: "🔴",
-        }
-        emoji = severity_emoji.get(self.severity, "📢")
+        emoji = _SEVERITY_EMOJI.get(self.severity, "📢")
 
-        lines = [
+        return "\n".join((
             f"{emoji} *{self.title}*",
             "",
             self.message,
@@ -84,8 +100,7 @@ class Alert:
             f"📊 当前值: `{self.current_value}`",
             f"📏 阈值: `{self.threshold}`",
             f"⏰ 时间: {self.triggered_at}",
-        ]
-        return "\n".join(lines)
+        ))
 
 
 def create_alert(
@@ -99,11 +114,13 @@ def create_alert(
     threshold: Optional[float] = None,
     metadata: Optional[dict[str, Any]] = None,
     run_id: str = "",
+    triggered_at: Optional[str] = None,
 ) -> dict[str, Any]:
     """
     Factory function to create an alert dict.
 
-    Returns dict directly for easy insertion into GraphState.
+    Returns dict directly for easy insertion into GraphState; no Alert
+    instance is built. Alert remains for typed APIs (Alert.from_dict).
 
     Args:
         rule_name: Name of the rule (from config.yaml)
@@ -115,6 +132,8 @@ def create_alert(
         threshold: Threshold that was exceeded
         metadata: Additional context
         run_id: Current run ID
+        triggered_at: Trigger timestamp (defaults to now); batch callers
+            pass one shared stamp
 
     Returns:
         Alert as dict (JSON-serializable)
@@ -138,7 +157,7 @@ def create_alert(
         "title": title,
         "message": message,
         "severity": severity,
-        "triggered_at": format_timestamp(now_utc()),
+        "triggered_at": triggered_at or format_timestamp(now_utc()),
         "condition": condition or {},
         "current_value": current_value,
         "threshold": threshold,
@@ -152,17 +171,32 @@ class AlertRuleEngine:
 
     Evaluates conditions from config and produces alerts.
     This is NOT an LLM - it's deterministic rule matching.
+
+    Rules are compiled once into parallel arrays (metric index, operator
+    code, threshold) so evaluate() checks every rule in a few vectorized
+    comparisons; alerts are only built for rules that fire.
     """
 
     OPERATORS = {
-        ">": lambda a, b: a > b,
-        ">=": lambda a, b: a >= b,
-        "<": lambda a, b: a < b,
-        "<=": lambda a, b: a <= b,
-        "==": lambda a, b: a == b,
-        "!=": lambda a, b: a != b,
+        ">": operator.gt,
+        ">=": operator.ge,
+        "<": operator.lt,
+        "<=": operator.le,
+        "==": operator.eq,
+        "!=": operator.ne,
     }
 
+    # Operator code -> vectorized comparison (same order as OPERATORS)
+    _OP_CODES = {op: code for code, op in enumerate(OPERATORS)}
+    _NP_OPS = (
+        np.greater,
+        np.greater_equal,
+        np.less,
+        np.less_equal,
+        np.equal,
+        np.not_equal,
+    )
+
     def __init__(self, rules: list[dict[str, Any]]):
         """
         Initialize with rules from config.
@@ -171,6 +205,33 @@ class AlertRuleEngine:
             rules: List of rule definitions from config.yaml
         """
         self.rules = rules
+        self._compile()
+
+    def _compile(self) -> None:
+        """Build rule arrays, dropping incomplete or unknown-operator rules."""
+        compiled = []
+        metric_keys: dict[str, int] = {}
+
+        for rule in self.rules:
+            condition = rule.get("condition", {})
+            metric_name = condition.get("metric")
+            op = condition.get("operator")
+            threshold = condition.get("threshold")
+
+            if not all([metric_name, op, threshold is not None]):
+                continue
+            op_code = self._OP_CODES.get(op)
+            if op_code is None:
+                continue
+
+            metric_idx = metric_keys.setdefault(metric_name, len(metric_keys))
+            compiled.append((rule, metric_idx, op_code, threshold))
+
+        self._compiled_rules = [rule for rule, _, _, _ in compiled]
+        self._metric_keys = list(metric_keys)
+        self._metric_idx = np.array([c[1] for c in compiled], dtype=np.intp)
+        self._op_codes = np.array([c[2] for c in compiled], dtype=np.int8)
+        self._thresholds = np.array([c[3] for c in compiled], dtype=np.float64)
 
     def evaluate(
         self,
@@ -187,48 +248,51 @@ class AlertRuleEngine:
         Returns:
             List of triggered alerts
         """
-        alerts = []
-
-        for rule in self.rules:
-            alert = self._evaluate_rule(rule, metrics, run_id)
-            if alert:
-                alerts.append(alert)
-
-        return alerts
+        if not self._compiled_rules:
+            return []
+
+        values = np.array(
+            [metrics.get(key) for key in self._metric_keys],
+            dtype=np.float64,
+        )[self._metric_idx]
+        fired = np.zeros(len(values), dtype=bool)
+        for op_code in np.unique(self._op_codes):
+            rows = self._op_codes == op_code
+            fired[rows] = self._NP_OPS[op_code](values[rows], self._thresholds[rows])
+        # Missing metrics (None -> NaN) never fire, even for "!="
+        fired &= ~np.isnan(values)
+
+        triggered = np.flatnonzero(fired)
+        if not len(triggered):
+            return []
+        triggered_at = format_timestamp(now_utc())
+        return [
+            self._build_alert(self._compiled_rules[i], metrics, run_id, triggered_at)
+            for i in triggered
+        ]
 
-    def _evaluate_rule(
+    def _build_alert(
         self,
         rule: dict[str, Any],
         metrics: dict[str, float],
         run_id: str,
-    ) -> Optional[dict[str, Any]]:
-        """Evaluate a single rule."""
-        condition = rule.get("condition", {})
-        metric_name = condition.get("metric")
-        operator = condition.get("operator")
-        threshold = condition.get("threshold")
-
-        if not all([metric_name, operator, threshold is not None]):
-            return None
-
-        current_value = metrics.get(metric_name)
-        if current_value is None:
-            return None
-
-        op_func = self.OPERATORS.get(operator)
-        if op_func is None:
-            return None
-
-        if op_func(current_value, threshold):
-            return create_alert(
-                rule_name=rule.get("name", "unknown"),
-                title=rule.get("description", rule.get("name", "Alert")),
-                message=f"{metric_name} = {current_value:.4f} {operator} {threshold}",
-                severity=rule.get("severity", AlertSeverity.MEDIUM.value),
-                condition=condition,
-                current_value=current_value,
-                threshold=threshold,
-                run_id=run_id,
-            )
-
-        return None
+        triggered_at: str,
+    ) -> dict[str, Any]:
+        """Create the alert for a rule that fired."""
+        condition = rule["condition"]
+        metric_name = condition["metric"]
+        op = condition["operator"]
+        threshold = condition["threshold"]
+        current_value = metrics[metric_name]
+
+        return create_alert(
+            rule_name=rule.get("name", "unknown"),
+            title=rule.get("description", rule.get("name", "Alert")),
+            message=f"{metric_name} = {current_value:.4f} {op} {threshold}",
+            severity=rule.get("severity", AlertSeverity.MEDIUM.value),
+            condition=condition,
+            current_value=current_value,
+            threshold=threshold,
+            run_id=run_id,
+            triggered_at=triggered_at,
+        )
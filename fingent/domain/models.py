@@ -1,14 +1,19 @@
 """
 Core data models for Fingent.
 
-All models use dataclass and provide to_dict() for JSON serialization.
+All models use dataclass and provide to_dict()/to_json() for JSON
+serialization (see fingent.core.serialization).
 These models represent the domain objects without external API dependencies.
 """
 
-from dataclasses import dataclass, field, asdict
+from copy import deepcopy
+from dataclasses import dataclass, field, fields, asdict, InitVar
 from datetime import datetime
-from typing import Any, Optional
-from enum import Enum
+from typing import Any, Callable, Optional
+from enum import Enum, IntFlag
+from operator import itemgetter
+
+from fingent.core.serialization import JsonSerializable
 
 
 class AssetType(str, Enum):
@@ -21,8 +26,8 @@ class AssetType(str, Enum):
     FX = "fx"
 
 
-@dataclass
-class MacroIndicator:
+@dataclass(slots=True)
+class MacroIndicator(JsonSerializable):
     """
     Macro economic indicator data point.
 
@@ -38,18 +43,14 @@ class MacroIndicator:
     timestamp: Optional[str] = None
     source: str = "fred"
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to JSON-serializable dict."""
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "MacroIndicator":
         """Create from dict."""
         return cls(**data)
 
 
-@dataclass
-class PriceBar:
+@dataclass(slots=True)
+class PriceBar(JsonSerializable):
     """
     Price data for a single time period.
 
@@ -68,16 +69,13 @@ class PriceBar:
     change_24h: Optional[float] = None  # 24h percentage change
     change_7d: Optional[float] = None   # 7d percentage change
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PriceBar":
         return cls(**data)
 
 
-@dataclass
-class MarketData:
+@dataclass(slots=True)
+class MarketData(JsonSerializable):
     """
     Aggregated market data for an asset.
 
@@ -104,16 +102,37 @@ class MarketData:
     # Data source
     source: str = "unknown"
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "MarketData":
+        # Complete dicts (as written by to_dict) go in positionally, about
+        # 2x faster than **data; anything else takes the keyword path
+        if len(data) == _MARKET_DATA_FIELD_COUNT:
+            try:
+                return cls(*_market_data_values(data))
+            except KeyError:
+                pass
         return cls(**data)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict (all fields are flat, so no asdict walk is needed)."""
+        return _market_data_dict(self)
 
-@dataclass
-class NewsItem:
+
+# MarketData field names in __init__ order, resolved once at import
+_MARKET_DATA_FIELDS = tuple(f.name for f in fields(MarketData))
+_MARKET_DATA_FIELD_COUNT = len(_MARKET_DATA_FIELDS)
+
+# Field values of a MarketData dict in __init__ order (for from_dict)
+_market_data_values = itemgetter(*_MARKET_DATA_FIELDS)
+
+
+def _market_data_dict(data: MarketData) -> dict[str, Any]:
+    """Build a MarketData dict directly from the cached field names."""
+    return {name: getattr(data, name) for name in _MARKET_DATA_FIELDS}
+
+
+@dataclass(slots=True)
+class NewsItem(JsonSerializable):
     """
     A single news article with sentiment analysis.
     """
@@ -134,16 +153,13 @@ class NewsItem:
     # Provider info
     provider: str = "unknown"
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "NewsItem":
         return cls(**data)
 
 
-@dataclass
-class SentimentData:
+@dataclass(slots=True)
+class SentimentData(JsonSerializable):
     """
     Aggregated sentiment data from prediction markets or other sources.
     """
@@ -162,16 +178,13 @@ class SentimentData:
     volume: Optional[float] = None
     timestamp: str = ""
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SentimentData":
         return cls(**data)
 
 
-@dataclass
-class CrossAssetSnapshot:
+@dataclass(slots=True)
+class CrossAssetSnapshot(JsonSerializable):
     """
     Snapshot of cross-asset market conditions.
 
@@ -187,16 +200,6 @@ class CrossAssetSnapshot:
     # Yield curve
     yield_spread_2y10y: Optional[float] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result = {
-            "timestamp": self.timestamp,
-            "assets": {k: v.to_dict() for k, v in self.assets.items()},
-            "btc_gold_correlation": self.btc_gold_correlation,
-            "risk_on_score": self.risk_on_score,
-            "yield_spread_2y10y": self.yield_spread_2y10y,
-        }
-        return result
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CrossAssetSnapshot":
         assets = {k: MarketData.from_dict(v) for k, v in data.get("assets", {}).items()}
@@ -208,13 +211,49 @@ class CrossAssetSnapshot:
             yield_spread_2y10y=data.get("yield_spread_2y10y"),
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict, building each asset dict without asdict()."""
+        return {
+            "timestamp": self.timestamp,
+            "assets": {symbol: _market_data_dict(a) for symbol, a in self.assets.items()},
+            "btc_gold_correlation": self.btc_gold_correlation,
+            "risk_on_score": self.risk_on_score,
+            "yield_spread_2y10y": self.yield_spread_2y10y,
+        }
+
 
 # ==============================================
 # Polymarket Arbitrage Models
 # ==============================================
 
-@dataclass
-class PolymarketEvent:
+class _DictCacheMixin:
+    """
+    Memoize to_dict() for models that are read far more often than mutated.
+
+    Any attribute assignment drops the cached dict. In-place mutation of
+    nested containers is not tracked, so reassign fields instead. Each
+    call returns a private copy, so callers may modify the result.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+
+    def to_dict(self) -> dict[str, Any]:
+        cached = getattr(self, "_dict_cache", None)
+        if cached is None:
+            cached = self._as_dict()
+            object.__setattr__(self, "_dict_cache", cached)
+        return deepcopy(cached)
+
+    def _as_dict(self) -> dict[str, Any]:
+        """Build the dict that to_dict() caches."""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class PolymarketEvent(JsonSerializable):
     """
     Polymarket event (a group of related markets).
 
@@ -229,16 +268,13 @@ class PolymarketEvent:
     markets: list[str] = field(default_factory=list)  # market_ids
     tags: list[str] = field(default_factory=list)
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PolymarketEvent":
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
-@dataclass
-class PolymarketMarket:
+@dataclass(slots=True)
+class PolymarketMarket(JsonSerializable):
     """
     Single Polymarket market with CLOB data.
 
@@ -264,16 +300,13 @@ class PolymarketMarket:
     # Calculated field for term structure
     tenor_days: int = 0  # Days until end_time
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PolymarketMarket":
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
-@dataclass
-class PolymarketQuote:
+@dataclass(slots=True)
+class PolymarketQuote(JsonSerializable):
     """
     Orderbook quote from Polymarket CLOB.
 
@@ -298,9 +331,6 @@ class PolymarketQuote:
     # Volume
     volume_24h: Optional[float] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PolymarketQuote":
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
@@ -338,7 +368,7 @@ class PolymarketQuote:
 
 
 @dataclass
-class ArbSnapshot:
+class ArbSnapshot(_DictCacheMixin):
     """
     Snapshot of market state at first detection.
 
@@ -357,16 +387,23 @@ class ArbSnapshot:
     # Initial volume (for detecting activity changes)
     volume0: Optional[float] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+    @property
+    def first_seen_dt(self) -> datetime:
+        """first_seen_ts as an aware datetime, parsed once per timestamp."""
+        cached = self.__dict__.get("_first_seen_dt")
+        if cached is None or cached[0] != self.first_seen_ts:
+            dt = datetime.fromisoformat(self.first_seen_ts.replace("Z", "+00:00"))
+            cached = (self.first_seen_ts, dt)
+            object.__setattr__(self, "_first_seen_dt", cached)
+        return cached[1]
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ArbSnapshot":
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
-@dataclass
-class ArbOpportunityLeg:
+@dataclass(slots=True)
+class ArbOpportunityLeg(JsonSerializable):
     """
     Single leg of an arbitrage opportunity.
     """
@@ -377,12 +414,30 @@ class ArbOpportunityLeg:
     current_mid: float
     delta: float  # current_mid - p0
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+
+class RiskFlag(IntFlag):
+    """Risk check outcomes for an arbitrage opportunity."""
+    MISSING_QUOTE = 1
+    LOW_VOLUME = 2
+    WIDE_SPREAD = 4
+    LOW_DEPTH = 8
+    TOO_CLOSE_TO_SETTLE = 16
+    COOLDOWN = 32
+
+
+# Human-readable form of each flag: (subject id, measured value)
+RISK_FLAG_FORMATS: dict[RiskFlag, str] = {
+    RiskFlag.MISSING_QUOTE: "MISSING_QUOTE:{0}",
+    RiskFlag.LOW_VOLUME: "LOW_VOLUME:{0}:{1:.0f}",
+    RiskFlag.WIDE_SPREAD: "WIDE_SPREAD:{0}:{1:.0f}bps",
+    RiskFlag.LOW_DEPTH: "LOW_DEPTH:{0}:{1:.0f}",
+    RiskFlag.TOO_CLOSE_TO_SETTLE: "TOO_CLOSE_TO_SETTLE:{0}:{1}d",
+    RiskFlag.COOLDOWN: "COOLDOWN:{0}:{1:.0f}s",
+}
 
 
 @dataclass
-class ArbOpportunity:
+class ArbOpportunity(_DictCacheMixin):
     """
     Detected arbitrage opportunity.
 
@@ -402,19 +457,106 @@ class ArbOpportunity:
     edge: float = 0.0            # delta_diff - estimated_costs
     confidence: float = 0.0      # 0-1 based on liquidity
 
-    # Evidence for analysis
-    evidence: dict = field(default_factory=dict)
-
-    # Risk assessment
-    risk_flags: list[str] = field(default_factory=list)
+    # Evidence for analysis; read through the evidence property, which
+    # builds it from evidence_factory on first access
+    evidence: InitVar[Optional[dict]] = None
+    _evidence: dict = field(default_factory=dict, init=False)
+    _evidence_factory: Optional[Callable[[], dict]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Risk assessment; risk_flags is read through a property that formats
+    # the details recorded by set_risk_flags on first access
+    risk_flags: InitVar[Optional[list[str]]] = None
+    _risk_flags: list[str] = field(default_factory=list, init=False)
+    _risk_details: Optional[list[tuple[RiskFlag, str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    risk_flags_bits: int = 0   # RiskFlag bitmask
     status: str = "CANDIDATE"  # CANDIDATE | FILTERED | CONFIRMED
 
     # Agent explanation (optional)
     agent_note: Optional[str] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+    # Deferred evidence builder, used when no evidence is given
+    evidence_factory: InitVar[Optional[Callable[[], dict]]] = None
+
+    def __post_init__(
+        self,
+        evidence: Optional[dict],
+        risk_flags: Optional[list[str]],
+        evidence_factory: Optional[Callable[[], dict]],
+    ) -> None:
+        if risk_flags:
+            self._risk_flags = risk_flags
+        if evidence:
+            self._evidence = evidence
+        elif evidence_factory is not None:
+            self._evidence_factory = evidence_factory
+
+    def _get_evidence(self) -> dict:
+        """Evidence dict, built by the deferred factory on first access."""
+        if self._evidence_factory is not None:
+            factory = self._evidence_factory
+            self._evidence_factory = None
+            self._evidence = factory()
+        return self._evidence
+
+    def _set_evidence(self, value: dict) -> None:
+        self._evidence_factory = None
+        self._evidence = value
+
+    def set_risk_flags(
+        self,
+        bits: int,
+        details: list[tuple[RiskFlag, str, Any]],
+    ) -> None:
+        """
+        Record risk check results without formatting them.
+
+        risk_flags strings are built from details on first access.
+
+        Args:
+            bits: RiskFlag bitmask
+            details: (flag, subject id, measured value) per raised flag
+        """
+        self.risk_flags_bits = int(bits)
+        self._risk_details = details
+
+    def _get_risk_flags(self) -> list[str]:
+        """Risk flag strings, formatted from recorded details on first access."""
+        if self._risk_details is not None:
+            details = self._risk_details
+            self._risk_details = None
+            self._risk_flags = [
+                RISK_FLAG_FORMATS[flag].format(subject, value)
+                for flag, subject, value in details
+            ]
+        return self._risk_flags
+
+    def _set_risk_flags(self, value: list[str]) -> None:
+        self._risk_details = None
+        self._risk_flags = value
+
+    def _as_dict(self) -> dict[str, Any]:
+        self._get_evidence()
+        self._get_risk_flags()
+        return {
+            _ARB_OPPORTUNITY_PUBLIC.get(key, key): value
+            for key, value in asdict(self).items()
+            if key not in ("_evidence_factory", "_risk_details")
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ArbOpportunity":
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        init_fields = cls.__dataclass_fields__
+        return cls(**{k: v for k, v in data.items() if k in init_fields and init_fields[k].init})
+
+
+# Set after the class body: a property named like its InitVar would
+# otherwise be taken as the InitVar's default
+ArbOpportunity.evidence = property(ArbOpportunity._get_evidence, ArbOpportunity._set_evidence)
+ArbOpportunity.risk_flags = property(ArbOpportunity._get_risk_flags, ArbOpportunity._set_risk_flags)
+
+# Private backing field -> public to_dict() key
+_ARB_OPPORTUNITY_PUBLIC = {"_evidence": "evidence", "_risk_flags": "risk_flags"}
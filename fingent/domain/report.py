@@ -4,10 +4,11 @@ Report generation for Fingent.
 Reports are the final output combining signals, alerts, and LLM narrative.
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
+from fingent.core.serialization import JsonSerializable
 from fingent.core.timeutil import format_timestamp, now_utc
 
 
@@ -19,8 +20,8 @@ class ReportType(str, Enum):
     WEEKLY = "weekly"
 
 
-@dataclass
-class ReportSection:
+@dataclass(slots=True)
+class ReportSection(JsonSerializable):
     """
     A section of the analysis report.
 
@@ -33,16 +34,13 @@ class ReportSection:
     key_points: list[str] = field(default_factory=list)
     data: dict[str, Any] = field(default_factory=dict)
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ReportSection":
         return cls(**data)
 
 
-@dataclass
-class Report:
+@dataclass(slots=True)
+class Report(JsonSerializable):
     """
     Complete analysis report.
 
@@ -75,9 +73,6 @@ class Report:
         if not self.title:
             self.title = f"Fingent 分析报告 - {self.timestamp[:10]}"
 
-    def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Report":
         return cls(**data)
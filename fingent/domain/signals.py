@@ -5,11 +5,15 @@ Signals are the standardized output of each analysis node.
 They represent actionable insights extracted from raw data.
 """
 
-from dataclasses import dataclass, asdict, field
+import heapq
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
+import numpy as np
+
+from fingent.core.serialization import JsonSerializable
 from fingent.core.timeutil import format_timestamp, now_utc
 
 
@@ -22,6 +26,12 @@ class SignalDirection(str, Enum):
     DOVISH = "dovish"
 
 
+# Plain-str direction values for aggregate_signals (skips Enum .value lookups)
+_BULLISH = SignalDirection.BULLISH.value
+_BEARISH = SignalDirection.BEARISH.value
+_NEUTRAL = SignalDirection.NEUTRAL.value
+
+
 class SignalName(str, Enum):
     """
     Predefined signal names.
@@ -55,8 +65,8 @@ class SignalName(str, Enum):
     VIX_CALM = "vix_calm"
 
 
-@dataclass
-class Signal:
+@dataclass(slots=True)
+class Signal(JsonSerializable):
     """
     A single signal produced by an analysis node.
 
@@ -86,10 +96,6 @@ class Signal:
         if not self.id:
             self.id = f"{self.source_node}_{self.name}_{self.run_id}"
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to JSON-serializable dict for GraphState."""
-        return asdict(self)
-
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Signal":
         """Create Signal from dict."""
@@ -110,6 +116,8 @@ def create_signal(
     run_id: str = "",
     confidence: float = 0.5,
     evidence: Optional[dict[str, Any]] = None,
+    timestamp: Optional[str] = None,
+    signal_id: Optional[str] = None,
 ) -> dict[str, Any]:
     """
     Factory function to create a signal dict.
@@ -124,6 +132,9 @@ def create_signal(
         run_id: Current run ID
         confidence: Confidence level (0 to 1)
         evidence: Supporting data
+        timestamp: Signal timestamp (defaults to now); nodes pass the
+            run's asof so a batch shares one formatted stamp
+        signal_id: Precomputed id (defaults to source_node_name_run_id)
 
     Returns:
         Signal as dict (JSON-serializable)
@@ -139,21 +150,26 @@ def create_signal(
             evidence={"fed_funds_rate": 5.25, "cpi_yoy": 3.2}
         )
     """
-    signal_id = f"{source_node}_{name}_{run_id}"
-
     return {
-        "id": signal_id,
+        "id": signal_id or f"{source_node}_{name}_{run_id}",
         "name": name,
         "direction": direction,
         "score": score,
         "confidence": confidence,
         "source_node": source_node,
         "evidence": evidence or {},
-        "timestamp": format_timestamp(now_utc()),
+        "timestamp": timestamp or format_timestamp(now_utc()),
         "run_id": run_id,
     }
 
 
+# Below this many signals the plain-Python path beats NumPy setup cost
+_VECTORIZE_MIN_SIGNALS = 8
+
+# Number of strongest signals reported as key_signals
+_KEY_SIGNAL_COUNT = 5
+
+
 def aggregate_signals(signals: list[dict[str, Any]]) -> dict[str, Any]:
     """
     Aggregate multiple signals into a summary.
@@ -166,36 +182,24 @@ def aggregate_signals(signals: list[dict[str, Any]]) -> dict[str, Any]:
     """
     if not signals:
         return {
-            "overall_direction": SignalDirection.NEUTRAL.value,
+            "overall_direction": _NEUTRAL,
             "overall_score": 0,
             "signal_count": 0,
             "key_signals": [],
         }
 
-    # Calculate weighted average score
-    total_weight = sum(s.get("confidence", 0.5) for s in signals)
-    if total_weight == 0:
-        avg_score = 0
+    if len(signals) >= _VECTORIZE_MIN_SIGNALS:
+        avg_score, significant, key_signals = _score_signals_vectorized(signals)
     else:
-        avg_score = sum(
-            s.get("score", 0) * s.get("confidence", 0.5) for s in signals
-        ) / total_weight
+        avg_score, significant, key_signals = _score_signals(signals)
 
     # Determine overall direction
     if avg_score > 0.2:
-        overall_direction = SignalDirection.BULLISH.value
+        overall_direction = _BULLISH
     elif avg_score < -0.2:
-        overall_direction = SignalDirection.BEARISH.value
+        overall_direction = _BEARISH
     else:
-        overall_direction = SignalDirection.NEUTRAL.value
-
-    # Get significant signals
-    significant = [s for s in signals if abs(s.get("score", 0)) >= 0.3]
-    key_signals = sorted(
-        significant,
-        key=lambda x: abs(x.get("score", 0)) * x.get("confidence", 0.5),
-        reverse=True,
-    )[:5]
+        overall_direction = _NEUTRAL
 
     return {
         "overall_direction": overall_direction,
@@ -204,3 +208,56 @@ def aggregate_signals(signals: list[dict[str, Any]]) -> dict[str, Any]:
         "significant_count": len(significant),
         "key_signals": key_signals,
     }
+
+
+def _score_signals(
+    signals: list[dict[str, Any]],
+) -> tuple[float, list[dict[str, Any]], list[dict[str, Any]]]:
+    """Weighted average score, significant signals and top 5 (scalar path)."""
+    # Calculate weighted average score
+    total_weight = sum(s.get("confidence", 0.5) for s in signals)
+    if total_weight == 0:
+        avg_score = 0
+    else:
+        avg_score = sum(
+            s.get("score", 0) * s.get("confidence", 0.5) for s in signals
+        ) / total_weight
+
+    # Get significant signals
+    significant = [s for s in signals if abs(s.get("score", 0)) >= 0.3]
+    # nlargest is O(N log 5) and, like sorted(), keeps input order among ties
+    key_signals = heapq.nlargest(
+        _KEY_SIGNAL_COUNT,
+        significant,
+        key=lambda x: abs(x.get("score", 0)) * x.get("confidence", 0.5),
+    )
+
+    return avg_score, significant, key_signals
+
+
+def _score_signals_vectorized(
+    signals: list[dict[str, Any]],
+) -> tuple[float, list[dict[str, Any]], list[dict[str, Any]]]:
+    """Same as _score_signals, computed with NumPy reductions."""
+    n = len(signals)
+    scores = np.fromiter((s.get("score", 0) for s in signals), dtype=np.float64, count=n)
+    confidences = np.fromiter((s.get("confidence", 0.5) for s in signals), dtype=np.float64, count=n)
+
+    total_weight = confidences.sum()
+    avg_score = float((scores * confidences).sum() / total_weight) if total_weight != 0 else 0
+
+    abs_scores = np.abs(scores)
+    significant_idx = np.flatnonzero(abs_scores >= 0.3)
+    significant = [signals[i] for i in significant_idx]
+
+    # Partition down to the top-k candidates (ties at the cutoff included),
+    # then stable-sort only those so input order among ties is kept
+    strength = abs_scores[significant_idx] * confidences[significant_idx]
+    candidates = np.arange(len(strength))
+    if len(strength) > _KEY_SIGNAL_COUNT:
+        cutoff = np.partition(strength, -_KEY_SIGNAL_COUNT)[-_KEY_SIGNAL_COUNT]
+        candidates = np.flatnonzero(strength >= cutoff)
+    top = candidates[np.argsort(-strength[candidates], kind="stable")[:_KEY_SIGNAL_COUNT]]
+    key_signals = [significant[i] for i in top]
+
+    return avg_score, significant, key_signals
@@ -7,13 +7,14 @@ Contains:
 - Workflow builder
 """
 
-from fingent.graph.state import GraphState, create_initial_state
+from fingent.graph.state import GraphState, create_initial_state, merge_state
 from fingent.graph.registry import ProviderRegistry, NodeRegistry
 from fingent.graph.builder import WorkflowBuilder, create_default_workflow
 
 __all__ = [
     "GraphState",
     "create_initial_state",
+    "merge_state",
     "ProviderRegistry",
     "NodeRegistry",
     "WorkflowBuilder",
@@ -6,6 +6,7 @@ Assembles nodes into an executable workflow graph.
 
 from typing import Any, Callable, Optional
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 
 from fingent.core.config import Settings, get_settings, load_yaml_config
@@ -14,7 +15,7 @@ from fingent.graph.state import GraphState, create_initial_state
 from fingent.graph.registry import (
     NodeRegistry,
     ProviderRegistry,
-    create_default_registries,
+    get_default_registries,
 )
 
 logger = get_logger("builder")
@@ -33,7 +34,7 @@ class WorkflowBuilder:
         node_registry: Optional[NodeRegistry] = None,
     ):
         if provider_registry is None or node_registry is None:
-            provider_registry, node_registry = create_default_registries()
+            provider_registry, node_registry = get_default_registries()
 
         self.provider_registry = provider_registry
         self.node_registry = node_registry
@@ -56,7 +57,10 @@ class WorkflowBuilder:
             raise ValueError(f"Node not registered: {name}")
 
         node_instance = self.node_registry.create(name)
-        self._graph.add_node(name, node_instance)
+        # Sync invoke() calls the node; ainvoke() awaits its arun()
+        self._graph.add_node(
+            name, RunnableLambda(node_instance, afunc=node_instance.arun, name=name)
+        )
         self._nodes_added.append(name)
 
         logger.debug(f"Added node to workflow: {name}")
@@ -191,12 +195,46 @@ def run_workflow(
 
     # Execute workflow
     final_state = workflow.invoke(initial_state)
+    _log_completion(final_state)
+
+    return final_state
+
+
+async def arun_workflow(
+    workflow: Optional[Any] = None,
+    initial_state: Optional[GraphState] = None,
+) -> GraphState:
+    """
+    Execute the workflow on the running event loop.
+
+    Nodes run through their arun(), so independent branches can overlap
+    their I/O instead of blocking the loop.
+
+    Args:
+        workflow: Compiled workflow (creates default if not provided)
+        initial_state: Initial state (creates empty if not provided)
+
+    Returns:
+        Final state after workflow execution
+    """
+    if workflow is None:
+        workflow = create_default_workflow()
+
+    if initial_state is None:
+        initial_state = create_initial_state()
 
+    logger.info("Starting async workflow execution")
+
+    final_state = await workflow.ainvoke(initial_state)
+    _log_completion(final_state)
+
+    return final_state
+
+
+def _log_completion(final_state: GraphState) -> None:
     logger.info(
         f"Workflow completed. "
         f"Signals: {len(final_state.get('signals', []))}, "
         f"Alerts: {len(final_state.get('alerts', []))}, "
         f"Errors: {len(final_state.get('errors', []))}"
     )
-
-    return final_state
@@ -4,13 +4,26 @@ Registry for providers and nodes.
 Enables plugin-style registration and dependency injection.
 """
 
-from typing import Any, Callable, Dict, Optional, Type
+from functools import lru_cache, partial
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional, Type, Union
 
-from fingent.core.config import Settings, get_settings, load_yaml_config
+from fingent.core.config import Settings, get_settings, load_yaml_config, on_config_reload
 from fingent.core.logging import get_logger
 
 logger = get_logger("registry")
 
+# A class, or a "package.module:ClassName" spec imported on first use
+ClassSpec = Union[Type, str]
+
+
+def _resolve_class(spec: ClassSpec) -> Type:
+    """Import a "module:attr" spec; classes are returned unchanged."""
+    if not isinstance(spec, str):
+        return spec
+    module_name, _, attr = spec.partition(":")
+    return getattr(import_module(module_name), attr)
+
 
 class ProviderRegistry:
     """
@@ -22,17 +35,24 @@ class ProviderRegistry:
 
     def __init__(self, settings: Optional[Settings] = None):
         self.settings = settings or get_settings()
-        self._providers: Dict[str, Type] = {}
+        self._providers: Dict[str, ClassSpec] = {}
         self._instances: Dict[str, Any] = {}
+        self._frozen = False
 
-    def register(self, name: str, provider_class: Type) -> None:
+    def register(self, name: str, provider_class: ClassSpec) -> None:
         """
         Register a provider class.
 
         Args:
             name: Provider name (e.g., "fred", "finnhub")
-            provider_class: Provider class (not instance)
+            provider_class: Provider class (not instance), or a
+                "module:ClassName" spec imported on first get()
+
+        Raises:
+            RuntimeError: If the registry has been frozen
         """
+        if self._frozen:
+            raise RuntimeError(f"Provider registry is frozen, cannot register: {name}")
         self._providers[name] = provider_class
         logger.debug(f"Registered provider: {name}")
 
@@ -57,7 +77,8 @@ class ProviderRegistry:
             raise KeyError(f"Provider not registered: {name}")
 
         if name not in self._instances:
-            provider_class = self._providers[name]
+            provider_class = _resolve_class(self._providers[name])
+            self._providers[name] = provider_class
             self._instances[name] = provider_class(
                 settings=self.settings,
                 **kwargs,
@@ -78,6 +99,10 @@ class ProviderRegistry:
         """Clear cached instances (for testing)."""
         self._instances.clear()
 
+    def freeze(self) -> None:
+        """Reject further registrations (lookups and lazy imports still work)."""
+        self._frozen = True
+
 
 class NodeRegistry:
     """
@@ -96,14 +121,17 @@ class NodeRegistry:
         self.config = config or load_yaml_config()
         self.provider_registry = provider_registry or ProviderRegistry(self.settings)
 
-        self._nodes: Dict[str, Type] = {}
+        self._nodes: Dict[str, ClassSpec] = {}
         self._node_providers: Dict[str, list[str]] = {}  # Node -> required providers
         self._node_kwargs: Dict[str, dict[str, Any]] = {}
+        self._instances: Dict[str, Any] = {}  # Nodes built with default kwargs
+        self._builders: Dict[str, Callable[..., Any]] = {}  # See _make_builder
+        self._frozen = False
 
     def register(
         self,
         name: str,
-        node_class: Type,
+        node_class: ClassSpec,
         providers: Optional[list[str]] = None,
         default_kwargs: Optional[dict[str, Any]] = None,
     ) -> None:
@@ -112,10 +140,18 @@ class NodeRegistry:
 
         Args:
             name: Node name (e.g., "macro_auditor")
-            node_class: Node class (not instance)
+            node_class: Node class (not instance), or a "module:ClassName"
+                spec imported on first create()
             providers: List of required provider names
+
+        Raises:
+            RuntimeError: If the registry has been frozen
         """
+        if self._frozen:
+            raise RuntimeError(f"Node registry is frozen, cannot register: {name}")
         self._nodes[name] = node_class
+        self._instances.pop(name, None)
+        self._builders.pop(name, None)
         self._node_providers[name] = providers or []
         self._node_kwargs[name] = default_kwargs or {}
         logger.debug(f"Registered node: {name}")
@@ -124,6 +160,9 @@ class NodeRegistry:
         """
         Create a node instance with injected dependencies.
 
+        Nodes hold no per-run state, so an instance built without extra
+        kwargs is cached and reused by later calls (and workflow builds).
+
         Args:
             name: Node name
             **kwargs: Additional arguments for node constructor
@@ -137,29 +176,45 @@ class NodeRegistry:
         if name not in self._nodes:
             raise KeyError(f"Node not registered: {name}")
 
-        node_class = self._nodes[name]
-        required_providers = self._node_providers.get(name, [])
+        if not kwargs and name in self._instances:
+            return self._instances[name]
+
+        builder = self._builders.get(name)
+        if builder is None:
+            builder = self._builders[name] = self._make_builder(name)
+
+        instance = builder(**kwargs)
+        if not kwargs:
+            self._instances[name] = instance
+        logger.debug(f"Created node instance: {name}")
+        return instance
+
+    def _make_builder(self, name: str) -> Callable[..., Any]:
+        """
+        Bind a node's class and injected dependencies once.
+
+        Resolves the class spec and provider instances on first use; later
+        create() calls only merge their explicit kwargs.
+        """
+        node_class = _resolve_class(self._nodes[name])
+        self._nodes[name] = node_class
 
         # Inject providers
         provider_kwargs = {}
-        for provider_name in required_providers:
+        for provider_name in self._node_providers.get(name, []):
             if self.provider_registry.has(provider_name):
                 # Convention: provider_name + "_provider" as kwarg
                 kwarg_name = f"{provider_name}_provider"
                 provider_kwargs[kwarg_name] = self.provider_registry.get(provider_name)
 
-        # Merge with explicit kwargs
-        all_kwargs = {
+        # Explicit create() kwargs override these at call time
+        bound_kwargs = {
             "settings": self.settings,
             "config": self.config,
             **provider_kwargs,
             **self._node_kwargs.get(name, {}),
-            **kwargs,
         }
-
-        instance = node_class(**all_kwargs)
-        logger.debug(f"Created node instance: {name}")
-        return instance
+        return partial(node_class, **bound_kwargs)
 
     def has(self, name: str) -> bool:
         """Check if node is registered."""
@@ -169,6 +224,15 @@ class NodeRegistry:
         """List all registered node names."""
         return list(self._nodes.keys())
 
+    def clear_instances(self) -> None:
+        """Clear cached instances and bound builders (for testing)."""
+        self._instances.clear()
+        self._builders.clear()
+
+    def freeze(self) -> None:
+        """Reject further registrations (lookups and lazy imports still work)."""
+        self._frozen = True
+
 
 def create_default_registries() -> tuple[ProviderRegistry, NodeRegistry]:
     """
@@ -177,22 +241,6 @@ def create_default_registries() -> tuple[ProviderRegistry, NodeRegistry]:
     Returns:
         Tuple of (ProviderRegistry, NodeRegistry)
     """
-    from fingent.providers import (
-        FREDProvider,
-        FinnhubProvider,
-        AlphaVantageProvider,
-        OKXProvider,
-        PolymarketProvider,
-        DBnomicsProvider,
-        PolygonProvider,
-    )
-    from fingent.nodes import (
-        BootstrapNode,
-        MacroAuditorNode,
-        CrossAssetNode,
-        NewsImpactNode,
-        SynthesizeAlertNode,
-    )
     from fingent.services.llm import create_llm_service
 
     settings = get_settings()
@@ -200,30 +248,59 @@ def create_default_registries() -> tuple[ProviderRegistry, NodeRegistry]:
 
     # Create provider registry
     provider_registry = ProviderRegistry(settings)
-    provider_registry.register("fred", FREDProvider)
-    provider_registry.register("finnhub", FinnhubProvider)
-    provider_registry.register("alphavantage", AlphaVantageProvider)
-    provider_registry.register("okx", OKXProvider)
-    provider_registry.register("polymarket", PolymarketProvider)
-    provider_registry.register("dbnomics", DBnomicsProvider)
-    provider_registry.register("polygon", PolygonProvider)
+    # Specs are imported on first use, so unused providers never load
+    provider_registry.register("fred", "fingent.providers.fred:FREDProvider")
+    provider_registry.register("finnhub", "fingent.providers.finnhub:FinnhubProvider")
+    provider_registry.register("alphavantage", "fingent.providers.alphavantage:AlphaVantageProvider")
+    provider_registry.register("okx", "fingent.providers.okx:OKXProvider")
+    provider_registry.register("polymarket", "fingent.providers.polymarket:PolymarketProvider")
+    provider_registry.register("dbnomics", "fingent.providers.dbnomics:DBnomicsProvider")
+    provider_registry.register("polygon", "fingent.providers.polygon:PolygonProvider")
 
     # Create node registry
     node_registry = NodeRegistry(settings, config, provider_registry)
-    node_registry.register("bootstrap", BootstrapNode, providers=[])
-    node_registry.register("macro_auditor", MacroAuditorNode, providers=["fred"])
+    node_registry.register("bootstrap", "fingent.nodes.bootstrap:BootstrapNode", providers=[])
+    node_registry.register(
+        "macro_auditor", "fingent.nodes.macro_auditor:MacroAuditorNode", providers=["fred"]
+    )
     node_registry.register(
         "cross_asset",
-        CrossAssetNode,
+        "fingent.nodes.cross_asset:CrossAssetNode",
         providers=["finnhub", "polygon", "okx"],
     )
-    node_registry.register("news_impact", NewsImpactNode, providers=["alphavantage", "finnhub"])
+    node_registry.register(
+        "news_impact",
+        "fingent.nodes.news_impact:NewsImpactNode",
+        providers=["alphavantage", "finnhub"],
+    )
     llm_service = create_llm_service(settings)
     node_registry.register(
         "synthesize_alert",
-        SynthesizeAlertNode,
+        "fingent.nodes.synthesize_alert:SynthesizeAlertNode",
         providers=[],
         default_kwargs={"llm_service": llm_service},
     )
 
+    # Default wiring is fixed for the process lifetime
+    provider_registry.freeze()
+    node_registry.freeze()
+
     return provider_registry, node_registry
+
+
+@lru_cache(maxsize=1)
+def get_default_registries() -> tuple[ProviderRegistry, NodeRegistry]:
+    """
+    Get the process-wide default registries.
+
+    Built once and shared by every default workflow build, so cached
+    providers and node instances are reused across runs. Rebuilt after
+    reload_config().
+
+    Returns:
+        Tuple of (ProviderRegistry, NodeRegistry)
+    """
+    return create_default_registries()
+
+
+on_config_reload(get_default_registries.cache_clear)
@@ -125,6 +125,10 @@ class GraphState(TypedDict, total=False):
     # }
 
 
+# List fields that are extended (deduplicated by id) rather than replaced
+_LIST_FIELDS = frozenset({"signals", "alerts", "errors"})
+
+
 def create_initial_state() -> GraphState:
     """
     Create an empty initial state.
@@ -151,35 +155,36 @@ def merge_state(current: GraphState, update: dict[str, Any]) -> GraphState:
     Merge partial state update into current state.
 
     Special handling for list fields (signals, alerts, errors):
-    - Lists are extended, not replaced
-    - Deduplication by 'id' field if present
+    - Lists are extended, not replaced (updates may be lists or tuples)
+    - Deduplication by 'id' field if present; items without an id
+      (e.g. node errors) are always kept
 
     Args:
-        current: Current state
+        current: Current state (its list fields are extended in place)
         update: Partial update from a node
 
     Returns:
-        Merged state
+        Merged state (a new dict sharing current's list fields)
     """
     result = dict(current)
 
     for key, value in update.items():
-        if key in ["signals", "alerts", "errors"]:
-            # Extend list fields
-            existing = result.get(key, [])
-            if isinstance(value, list):
-                # Deduplicate by id if present
+        if key in _LIST_FIELDS:
+            if isinstance(value, (list, tuple)):
+                # Extend list fields, deduplicating by id
+                existing = result.get(key, [])
+                result[key] = existing
                 existing_ids = {
                     item.get("id") for item in existing if isinstance(item, dict)
                 }
+                existing_ids.discard(None)
                 for item in value:
-                    if isinstance(item, dict):
-                        if item.get("id") not in existing_ids:
-                            existing.append(item)
-                            existing_ids.add(item.get("id"))
-                    else:
+                    item_id = item.get("id") if isinstance(item, dict) else None
+                    if item_id is None:
                         existing.append(item)
-                result[key] = existing
+                    elif item_id not in existing_ids:
+                        existing.append(item)
+                        existing_ids.add(item_id)
             else:
                 result[key] = value
         else:
@@ -8,12 +8,26 @@ Each node:
 - Handles errors gracefully (writes to state["errors"])
 """
 
+from importlib import import_module
+
 from fingent.nodes.base import BaseNode
-from fingent.nodes.bootstrap import BootstrapNode
-from fingent.nodes.macro_auditor import MacroAuditorNode
-from fingent.nodes.cross_asset import CrossAssetNode
-from fingent.nodes.news_impact import NewsImpactNode
-from fingent.nodes.synthesize_alert import SynthesizeAlertNode
+# Concrete nodes are imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "BootstrapNode": "fingent.nodes.bootstrap",
+    "MacroAuditorNode": "fingent.nodes.macro_auditor",
+    "CrossAssetNode": "fingent.nodes.cross_asset",
+    "NewsImpactNode": "fingent.nodes.news_impact",
+    "SynthesizeAlertNode": "fingent.nodes.synthesize_alert",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseNode",
@@ -0,0 +1,56 @@
+"""
+Numeric scoring kernels for node analyzers.
+
+Compiled with Numba when installed (pip install fingent[fast-score]);
+otherwise they run as plain Python, which is just as correct.
+Missing inputs are passed as NaN.
+"""
+
+from math import copysign, inf, isnan
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Risk-sentiment ladders, symmetric around zero: |change| is bucketed by
+# upper bounds (a change exactly on a bound falls in the lower bucket) and
+# the bucket's score takes the change's sign. Padded to a common length so
+# the tuples are homogeneous for Numba.
+_SPY_RISK_BOUNDS = (0.0, 0.005, 0.015)          # SPY - 更细致的评分
+_SPY_RISK_SCORES = (0.0, 0.5, 1.0, 1.5)
+_BTC_RISK_BOUNDS = (0.0, 0.01, 0.03)            # BTC (risk asset)
+_BTC_RISK_SCORES = (0.0, 0.3, 1.0, 1.5)
+_GLD_RISK_BOUNDS = (0.01, inf, inf)             # Gold (inverse risk)
+_GLD_RISK_SCORES = (0.0, 0.5, 0.5, 0.5)
+
+
+@njit(cache=True)
+def _ladder_score(change, bounds, scores):
+    """Signed ladder score for one change (0 if NaN)."""
+    if isnan(change) or change == 0.0:
+        return 0.0
+    magnitude = abs(change)
+    bucket = 0
+    while bucket < len(bounds) and magnitude > bounds[bucket]:
+        bucket += 1
+    return copysign(scores[bucket], change)
+
+
+@njit(cache=True)
+def risk_score(spy_change, btc_change, gld_change):
+    """
+    Risk-on/off score from 24h changes (fractions, NaN if missing).
+
+    Stocks and BTC up add risk-on; gold up counts against it.
+    """
+    return (
+        _ladder_score(spy_change, _SPY_RISK_BOUNDS, _SPY_RISK_SCORES)
+        + _ladder_score(btc_change, _BTC_RISK_BOUNDS, _BTC_RISK_SCORES)
+        - _ladder_score(gld_change, _GLD_RISK_BOUNDS, _GLD_RISK_SCORES)
+    )
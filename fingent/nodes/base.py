@@ -8,13 +8,21 @@ All nodes must:
 - Write errors to state["errors"], not raise exceptions
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from typing import Any, Optional
 
 from fingent.core.config import Settings, get_settings, load_yaml_config
 from fingent.core.errors import NodeExecutionError
 from fingent.core.logging import LoggerMixin
 from fingent.core.timeutil import format_timestamp, now_utc
+from fingent.graph.state import GraphState
+
+# Start timestamp of the safe_run() in progress. A context variable, not a
+# node attribute: node instances are shared across overlapping runs
+# (NodeRegistry caches them, arun() runs them in worker threads).
+_run_timestamp: ContextVar[Optional[str]] = ContextVar("run_timestamp", default=None)
 
 
 class BaseNode(ABC, LoggerMixin):
@@ -46,12 +54,12 @@ class BaseNode(ABC, LoggerMixin):
         self.config = config or load_yaml_config()
 
     @abstractmethod
-    def run(self, state: dict[str, Any]) -> dict[str, Any]:
+    def run(self, state: GraphState) -> dict[str, Any]:
         """
         Execute node logic.
 
         Args:
-            state: Current GraphState
+            state: Current GraphState (a plain dict at runtime)
 
         Returns:
             Partial state update (only fields to update)
@@ -64,45 +72,69 @@ class BaseNode(ABC, LoggerMixin):
         """
         pass
 
-    def __call__(self, state: dict[str, Any]) -> dict[str, Any]:
+    def __call__(self, state: GraphState) -> dict[str, Any]:
         """Make node callable for LangGraph."""
         return self.safe_run(state)
 
-    def safe_run(self, state: dict[str, Any]) -> dict[str, Any]:
+    async def arun(self, state: GraphState) -> dict[str, Any]:
+        """
+        Async entry point, used when the workflow runs via ainvoke().
+
+        Runs safe_run() in a worker thread so blocking provider I/O does
+        not stall the event loop. Override for natively async nodes.
+        """
+        return await asyncio.to_thread(self.safe_run, state)
+
+    def safe_run(self, state: GraphState) -> dict[str, Any]:
         """
         Execute node with error handling.
 
         Wraps run() to catch exceptions and record them in state.
+        The start time is taken once and reused by every error the run
+        records (see get_run_timestamp).
         """
-        self.logger.info(f"Node {self.node_name} starting")
+        log = self.logger
+        token = _run_timestamp.set(format_timestamp(now_utc()))
+        log.info(f"Node {self.node_name} starting")
 
         try:
             result = self.run(state)
-            self.logger.info(f"Node {self.node_name} completed")
+            log.info(f"Node {self.node_name} completed")
             return result
 
         except Exception as e:
-            self.logger.error(f"Node {self.node_name} failed: {e}", exc_info=True)
+            log.error(f"Node {self.node_name} failed: {e}", exc_info=True)
 
             # Record error in state
             error = {
                 "node": self.node_name,
                 "error": str(e),
-                "timestamp": format_timestamp(now_utc()),
+                "timestamp": self.get_run_timestamp(),
                 "recoverable": True,
             }
 
             return {"errors": [error]}
 
-    def get_run_id(self, state: dict[str, Any]) -> str:
+        finally:
+            _run_timestamp.reset(token)
+
+    def get_run_id(self, state: GraphState) -> str:
         """Get run_id from state."""
         return state.get("run_id", "unknown")
 
-    def get_existing_signals(self, state: dict[str, Any]) -> list[dict[str, Any]]:
+    def get_asof(self, state: GraphState) -> str:
+        """Get the run's analysis timestamp, shared by all signals it emits."""
+        return state.get("asof") or format_timestamp(now_utc())
+
+    def get_run_timestamp(self) -> str:
+        """Get the current run's start timestamp (now, outside safe_run)."""
+        return _run_timestamp.get() or format_timestamp(now_utc())
+
+    def get_existing_signals(self, state: GraphState) -> list[dict[str, Any]]:
         """Get existing signals from state."""
         return state.get("signals", [])
 
-    def get_existing_errors(self, state: dict[str, Any]) -> list[dict[str, Any]]:
+    def get_existing_errors(self, state: GraphState) -> list[dict[str, Any]]:
         """Get existing errors from state."""
         return state.get("errors", [])
 
@@ -114,17 +146,19 @@ class BaseNode(ABC, LoggerMixin):
         """
         Merge new signals with existing ones, avoiding duplicates.
 
-        Uses signal ID for deduplication.
+        Uses signal ID for deduplication. Existing signals are kept as-is
+        (including any without an ID); new ones are accumulated in a dict
+        keyed by ID, so the first signal per new ID wins.
         """
         existing_ids = {s.get("id") for s in existing}
-        merged = list(existing)
+        added: dict[Any, dict[str, Any]] = {}
 
         for signal in new_signals:
-            if signal.get("id") not in existing_ids:
-                merged.append(signal)
-                existing_ids.add(signal.get("id"))
+            signal_id = signal.get("id")
+            if signal_id not in existing_ids and signal_id not in added:
+                added[signal_id] = signal
 
-        return merged
+        return [*existing, *added.values()]
 
     def create_error(
         self,
@@ -137,7 +171,7 @@ class BaseNode(ABC, LoggerMixin):
         return {
             "node": self.node_name,
             "error": message,
-            "timestamp": format_timestamp(now_utc()),
+            "timestamp": self.get_run_timestamp(),
             "recoverable": recoverable,
             "details": details or {},
         }
@@ -9,7 +9,8 @@ Responsibilities:
 
 from typing import Any
 
-from fingent.core.timeutil import format_timestamp, generate_run_id, now_utc
+from fingent.core.timeutil import generate_run_id
+from fingent.graph.state import GraphState
 from fingent.nodes.base import BaseNode
 
 
@@ -23,7 +24,7 @@ class BootstrapNode(BaseNode):
 
     node_name = "bootstrap"
 
-    def run(self, state: dict[str, Any]) -> dict[str, Any]:
+    def run(self, state: GraphState) -> dict[str, Any]:
         """
         Initialize workflow state.
 
@@ -31,7 +32,7 @@ class BootstrapNode(BaseNode):
             Initial state with run_id, timestamp, and empty collections
         """
         run_id = generate_run_id()
-        timestamp = format_timestamp(now_utc())
+        timestamp = self.get_run_timestamp()
 
         self.logger.info(f"Starting new run: {run_id}")
 
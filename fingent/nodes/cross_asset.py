@@ -5,16 +5,78 @@ Data sources: Finnhub (US equity), OKX (crypto)
 Signals produced: risk_on, risk_off, flight_to_safety, etc.
 """
 
-from typing import Any, Optional
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from math import nan
+from typing import Any, Callable, Optional
 
 from fingent.core.timeutil import format_timestamp, now_utc
 from fingent.domain.signals import SignalDirection, SignalName, create_signal
+from fingent.graph.state import GraphState
+from fingent.nodes import _scoring
 from fingent.nodes.base import BaseNode
 from fingent.providers.finnhub import FinnhubProvider
 from fingent.providers.okx import OKXProvider
 from fingent.providers.polygon import PolygonProvider
 
 
+# Signal names and directions as plain strings, resolved once
+_BULLISH = SignalDirection.BULLISH.value
+_BEARISH = SignalDirection.BEARISH.value
+_NEUTRAL = SignalDirection.NEUTRAL.value
+_RISK_ON = SignalName.RISK_ON.value
+_RISK_OFF = SignalName.RISK_OFF.value
+_MARKET_NEUTRAL = "market_neutral"
+_FLIGHT_TO_SAFETY = SignalName.FLIGHT_TO_SAFETY.value
+_CRYPTO_SIDEWAYS = "crypto_sideways"
+_CRYPTO_MOMENTUM = SignalName.CRYPTO_MOMENTUM.value
+
+# |risk score| at which risk_on / risk_off fire (降低阈值，使信号更容易产出)
+_RISK_SIGNAL_THRESHOLD = 1.0
+
+# Flight to safety: SPY 24h drop below, and gold/bonds rise above
+_FLIGHT_SPY_DROP = -0.01
+_SAFE_HAVEN_RISE = 0.005
+
+# Evidence keys for the risk-sentiment inputs (spy, btc, gld)
+_RISK_EVIDENCE_KEYS = ("spy_24h", "btc_24h", "gold_24h")
+
+# Symbols whose 24h change feeds the analyzers, in _extract_changes order
+_CHANGE_SYMBOLS = ("SPY", "BTC-USDT", "GLD", "TLT", "ETH-USDT")
+
+# VIX bands (lower bounds, VIX 长期均值约为 19-20):
+# (name, direction, score, confidence); spike score scales with the level
+_VIX_BOUNDS = (15, 20, 25, 30)
+_VIX_BANDS = (
+    (SignalName.VIX_CALM.value, _BULLISH, 0.4, 0.7),         # 低波动/乐观
+    ("vix_normal", _NEUTRAL, 0, 0.5),                        # 正常波动
+    (SignalName.VIX_ELEVATED.value, _BEARISH, 0.3, 0.6),     # 略高于正常
+    (SignalName.VIX_ELEVATED.value, _BEARISH, 0.5, 0.8),     # 高波动
+    (SignalName.VIX_SPIKE.value, _BEARISH, None, 0.9),       # 恐慌
+)
+
+# Crypto momentum by |avg change| (same bound rule as the risk ladders):
+# (name, confidence) for sideways / moderate / strong moves
+_CRYPTO_BOUNDS = (0.02, 0.05)
+_CRYPTO_BANDS = (
+    (_CRYPTO_SIDEWAYS, 0.4),    # 横盘震荡
+    (_CRYPTO_MOMENTUM, 0.5),    # 温和
+    (_CRYPTO_MOMENTUM, 0.7),    # 强劲
+)
+
+
+def _extract_changes(changes: dict) -> tuple[Optional[float], ...]:
+    """24h changes for _CHANGE_SYMBOLS as (spy, btc, gld, tlt, eth); None if missing."""
+    values = []
+    for symbol in _CHANGE_SYMBOLS:
+        try:
+            values.append(changes[symbol]["change_24h"])
+        except KeyError:
+            values.append(None)
+    return tuple(values)
+
+
 class CrossAssetNode(BaseNode):
     """
     Cross-asset analysis node.
@@ -47,6 +109,8 @@ class CrossAssetNode(BaseNode):
         self.okx = okx_provider or OKXProvider()
         self._load_asset_config()
         self._load_quote_config()
+        # create_signal with this node's invariants bound once
+        self._make_signal = partial(create_signal, source_node=self.node_name)
 
     def _load_asset_config(self) -> None:
         assets_cfg = self.config.get("assets", {})
@@ -64,6 +128,7 @@ class CrossAssetNode(BaseNode):
         quote_cfg = self.config.get("providers", {}).get("quote", {})
         self.equity_primary = quote_cfg.get("us_equity", "finnhub")
         self.equity_fallback = quote_cfg.get("fallback")
+        self.fetch_workers = quote_cfg.get("fetch_workers", 12)
 
     def _get_quote_provider(self, name: Optional[str]):
         if name == "finnhub":
@@ -72,7 +137,15 @@ class CrossAssetNode(BaseNode):
             return self.polygon
         return None
 
-    def run(self, state: dict[str, Any]) -> dict[str, Any]:
+    def _signal_factory(
+        self,
+        run_id: str,
+        asof: Optional[str] = None,
+    ) -> Callable[..., dict[str, Any]]:
+        """create_signal bound to this node and run; analyzers pass the rest."""
+        return partial(self._make_signal, run_id=run_id, timestamp=asof)
+
+    def run(self, state: GraphState) -> dict[str, Any]:
         """
         Analyze cross-asset relationships.
 
@@ -80,6 +153,7 @@ class CrossAssetNode(BaseNode):
             State update with market_data and signals
         """
         run_id = self.get_run_id(state)
+        asof = self.get_asof(state)
         existing_signals = self.get_existing_signals(state)
         errors = []
         signals = []
@@ -89,7 +163,9 @@ class CrossAssetNode(BaseNode):
 
         # Analyze and produce signals
         if market_data.get("assets"):
-            signals = self._analyze_cross_asset(market_data, run_id)
+            signals = self._analyze_cross_asset(
+                market_data, self._signal_factory(run_id, asof)
+            )
 
         # Merge signals
         all_signals = self.merge_signals(existing_signals, signals)
@@ -101,108 +177,175 @@ class CrossAssetNode(BaseNode):
         }
 
     def _fetch_market_data(self, errors: list) -> dict[str, Any]:
-        """Fetch market data from all sources."""
+        """
+        Fetch market data from all sources.
+
+        Every quote/ticker/price-change call is network-bound and
+        independent, so they are fanned out on a thread pool; results are
+        written back in symbol order so output stays deterministic.
+        """
         market_data = {
             "timestamp": format_timestamp(now_utc()),
             "assets": {},
             "changes": {},
         }
+        primary = self._get_quote_provider(self.equity_primary)
+        fallback = self._get_quote_provider(self.equity_fallback)
+        equity_symbols = self.US_EQUITY_SYMBOLS + self.SAFE_HAVEN_SYMBOLS
+
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+            tickers_future = executor.submit(self.okx.get_tickers, self.CRYPTO_SYMBOLS)
+            crypto_change_futures = {
+                symbol: executor.submit(self.okx.calculate_price_changes, symbol)
+                for symbol in self.CRYPTO_SYMBOLS
+            }
+
+            # US equity + safe haven data
+            quotes, changes = self._fetch_equities(
+                executor, equity_symbols + ["VIX"], primary, fallback, errors
+            )
 
-        # Fetch US equity data
-        try:
-            primary = self._get_quote_provider(self.equity_primary)
-            fallback = self._get_quote_provider(self.equity_fallback)
-
-            def fetch_with_fallback(symbol: str):
-                for provider in [primary, fallback]:
-                    if not provider:
-                        continue
-                    try:
-                        quote = provider.get_quote(symbol)
-                        if quote:
-                            return quote, provider
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Quote failed ({provider.name}) {symbol}: {e}"
-                        )
-                return None, None
-
-            # Equity + safe haven symbols
-            for symbol in self.US_EQUITY_SYMBOLS + self.SAFE_HAVEN_SYMBOLS:
-                quote, provider = fetch_with_fallback(symbol)
-                if quote and provider:
-                    market_data["assets"][symbol] = quote.to_dict()
-                    if hasattr(provider, "calculate_price_changes"):
-                        market_data["changes"][symbol] = provider.calculate_price_changes(symbol)
-
-            # Fetch VIX (best effort) - try Finnhub first, then yfinance
-            vix_quote, provider = fetch_with_fallback("VIX")
+            for symbol in equity_symbols:
+                if symbol in quotes:
+                    market_data["assets"][symbol] = quotes[symbol].to_dict()
+                    if symbol in changes:
+                        market_data["changes"][symbol] = changes[symbol]
+
+            # VIX (best effort) - quote providers first, then yfinance
+            vix_quote = quotes.get("VIX")
             if vix_quote:
                 market_data["assets"]["VIX"] = vix_quote.to_dict()
                 market_data["vix_level"] = vix_quote.price
             else:
-                # Fallback: try yfinance for VIX
-                try:
-                    import yfinance as yf
-                    vix_ticker = yf.Ticker("^VIX")
-                    vix_info = vix_ticker.fast_info
-                    if hasattr(vix_info, 'last_price') and vix_info.last_price:
-                        market_data["vix_level"] = vix_info.last_price
-                        self.logger.info(f"Got VIX from yfinance: {vix_info.last_price:.2f}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to get VIX from yfinance: {e}")
+                self._fetch_vix_yfinance(market_data)
 
             self.logger.info(f"Fetched {len(market_data['assets'])} equity quotes")
 
-        except Exception as e:
-            self.logger.error(f"Failed to fetch equity data: {e}")
-            errors.append(self.create_error(f"Equity fetch failed: {e}"))
+            # Crypto data
+            try:
+                crypto_tickers = tickers_future.result()
+            except Exception as e:
+                self.logger.error(f"Failed to fetch crypto data: {e}")
+                errors.append(self.create_error(f"OKX fetch failed: {e}"))
+                crypto_tickers = {}
 
-        # Fetch crypto data
-        try:
-            crypto_tickers = self.okx.get_tickers(self.CRYPTO_SYMBOLS)
             for symbol, ticker in crypto_tickers.items():
                 market_data["assets"][symbol] = ticker.to_dict()
 
                 # Get 7d change
-                changes = self.okx.calculate_price_changes(symbol)
-                market_data["changes"][symbol] = changes
-
-            self.logger.info(f"Fetched {len(crypto_tickers)} crypto quotes")
+                future = crypto_change_futures.get(symbol)
+                if future is None:
+                    future = executor.submit(self.okx.calculate_price_changes, symbol)
+                try:
+                    market_data["changes"][symbol] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to fetch crypto changes for {symbol}: {e}")
+                    errors.append(self.create_error(f"OKX fetch failed ({symbol}): {e}"))
 
-        except Exception as e:
-            self.logger.error(f"Failed to fetch crypto data: {e}")
-            errors.append(self.create_error(f"OKX fetch failed: {e}"))
+            if crypto_tickers:
+                self.logger.info(f"Fetched {len(crypto_tickers)} crypto quotes")
 
         return market_data
 
+    def _fetch_equities(self, executor, symbols: list[str], primary, fallback, errors: list):
+        """
+        Get quotes and price changes for equity symbols.
+
+        Per-symbol calls run on the node's executor, so no provider-level
+        pool is nested inside it. Symbols the primary misses go to the
+        fallback; each symbol takes its price changes from the provider
+        that served its quote. A symbol that fails on every provider gets
+        its own error record, except VIX, which falls back to yfinance.
+
+        Returns:
+            (quotes by symbol, changes by symbol)
+        """
+        quotes = {}
+        failures: dict[str, Exception] = {}
+        sources: dict[str, list[str]] = {"primary": [], "fallback": []}
+        for role, provider in [("primary", primary), ("fallback", fallback)]:
+            missing = [s for s in symbols if s not in quotes]
+            if not provider or not missing:
+                continue
+            futures = {s: executor.submit(provider.get_quote, s) for s in missing}
+            for symbol, future in futures.items():
+                try:
+                    quote = future.result()
+                except Exception as e:
+                    self.logger.warning(f"Quote failed ({provider.name}) {symbol}: {e}")
+                    failures[symbol] = e
+                    continue
+                if quote:
+                    quotes[symbol] = quote
+                    sources[role].append(symbol)
+
+        for symbol in symbols:
+            if symbol in quotes or symbol not in failures or symbol == "VIX":
+                continue
+            e = failures[symbol]
+            self.logger.error(f"Failed to fetch equity data for {symbol}: {e}")
+            errors.append(self.create_error(f"Equity fetch failed ({symbol}): {e}"))
+
+        change_futures = {}
+        for role, provider in [("primary", primary), ("fallback", fallback)]:
+            if not provider or not hasattr(provider, "calculate_price_changes"):
+                continue
+            for symbol in sources[role]:
+                if symbol != "VIX":
+                    change_futures[symbol] = executor.submit(
+                        provider.calculate_price_changes, symbol
+                    )
+
+        changes = {}
+        for symbol in symbols:
+            future = change_futures.get(symbol)
+            if future is None:
+                continue
+            try:
+                changes[symbol] = future.result()
+            except Exception as e:
+                self.logger.error(f"Failed to fetch equity changes for {symbol}: {e}")
+                errors.append(self.create_error(f"Equity fetch failed ({symbol}): {e}"))
+        return quotes, changes
+
+    def _fetch_vix_yfinance(self, market_data: dict[str, Any]) -> None:
+        """Fallback: try yfinance for VIX."""
+        try:
+            import yfinance as yf
+            vix_ticker = yf.Ticker("^VIX")
+            vix_info = vix_ticker.fast_info
+            if hasattr(vix_info, 'last_price') and vix_info.last_price:
+                market_data["vix_level"] = vix_info.last_price
+                self.logger.info(f"Got VIX from yfinance: {vix_info.last_price:.2f}")
+        except Exception as e:
+            self.logger.warning(f"Failed to get VIX from yfinance: {e}")
+
     def _analyze_cross_asset(
         self,
         market_data: dict[str, Any],
-        run_id: str,
+        make_signal: Callable[..., dict[str, Any]],
     ) -> list[dict[str, Any]]:
         """Analyze cross-asset relationships."""
         signals = []
-        assets = market_data.get("assets", {})
-        changes = market_data.get("changes", {})
+        spy, btc, gld, tlt, eth = _extract_changes(market_data.get("changes", {}))
 
         # === Risk On/Off Analysis ===
-        risk_signal = self._analyze_risk_sentiment(assets, changes, run_id)
+        risk_signal = self._analyze_risk_sentiment(spy, btc, gld, make_signal)
         if risk_signal:
             signals.append(risk_signal)
 
         # === VIX Analysis ===
-        vix_signal = self._analyze_vix(market_data.get("vix_level"), run_id)
+        vix_signal = self._analyze_vix(market_data.get("vix_level"), make_signal)
         if vix_signal:
             signals.append(vix_signal)
 
         # === Flight to Safety ===
-        safety_signal = self._analyze_flight_to_safety(changes, run_id)
+        safety_signal = self._analyze_flight_to_safety(spy, gld, tlt, make_signal)
         if safety_signal:
             signals.append(safety_signal)
 
         # === Crypto Momentum ===
-        crypto_signal = self._analyze_crypto_momentum(changes, run_id)
+        crypto_signal = self._analyze_crypto_momentum(btc, eth, make_signal)
         if crypto_signal:
             signals.append(crypto_signal)
 
@@ -210,86 +353,45 @@ class CrossAssetNode(BaseNode):
 
     def _analyze_risk_sentiment(
         self,
-        assets: dict,
-        changes: dict,
-        run_id: str,
+        spy_change: Optional[float],
+        btc_change: Optional[float],
+        gld_change: Optional[float],
+        make_signal: Callable[..., dict[str, Any]],
     ) -> Optional[dict[str, Any]]:
         """Analyze overall risk sentiment."""
-        evidence = {}
-        risk_score = 0
-
-        # SPY performance - 更细致的评分
-        spy_change = changes.get("SPY", {}).get("change_24h")
-        if spy_change is not None:
-            evidence["spy_24h"] = round(spy_change * 100, 2)  # 转为百分比显示
-            if spy_change > 0.015:
-                risk_score += 1.5
-            elif spy_change > 0.005:
-                risk_score += 1
-            elif spy_change > 0:
-                risk_score += 0.5
-            elif spy_change < -0.015:
-                risk_score -= 1.5
-            elif spy_change < -0.005:
-                risk_score -= 1
-            elif spy_change < 0:
-                risk_score -= 0.5
-
-        # BTC performance (risk asset) - 更细致的评分
-        btc_change = changes.get("BTC-USDT", {}).get("change_24h")
-        if btc_change is not None:
-            evidence["btc_24h"] = round(btc_change * 100, 2)
-            if btc_change > 0.03:
-                risk_score += 1.5
-            elif btc_change > 0.01:
-                risk_score += 1
-            elif btc_change > 0:
-                risk_score += 0.3
-            elif btc_change < -0.03:
-                risk_score -= 1.5
-            elif btc_change < -0.01:
-                risk_score -= 1
-            elif btc_change < 0:
-                risk_score -= 0.3
-
-        # Gold performance (inverse risk)
-        gld_change = changes.get("GLD", {}).get("change_24h")
-        if gld_change is not None:
-            evidence["gold_24h"] = round(gld_change * 100, 2)
-            if gld_change > 0.01:
-                risk_score -= 0.5  # Gold up = risk off
-            elif gld_change < -0.01:
-                risk_score += 0.5  # Gold down = risk on
-
-        # 降低阈值，使信号更容易产出
-        if risk_score >= 1.0:
-            return create_signal(
-                name=SignalName.RISK_ON.value,
-                direction=SignalDirection.BULLISH.value,
+        values = (spy_change, btc_change, gld_change)
+        evidence = {
+            key: round(change * 100, 2)  # 转为百分比显示
+            for key, change in zip(_RISK_EVIDENCE_KEYS, values)
+            if change is not None
+        }
+
+        risk_score = _scoring.risk_score(
+            *(nan if change is None else change for change in values)
+        )
+
+        if risk_score >= _RISK_SIGNAL_THRESHOLD:
+            return make_signal(
+                name=_RISK_ON,
+                direction=_BULLISH,
                 score=min(risk_score / 3, 1.0),
-                source_node=self.node_name,
-                run_id=run_id,
                 confidence=0.4 + min(abs(risk_score) * 0.1, 0.4),
                 evidence=evidence,
             )
-        elif risk_score <= -1.0:
-            return create_signal(
-                name=SignalName.RISK_OFF.value,
-                direction=SignalDirection.BEARISH.value,
+        elif risk_score <= -_RISK_SIGNAL_THRESHOLD:
+            return make_signal(
+                name=_RISK_OFF,
+                direction=_BEARISH,
                 score=max(risk_score / 3, -1.0),
-                source_node=self.node_name,
-                run_id=run_id,
                 confidence=0.4 + min(abs(risk_score) * 0.1, 0.4),
                 evidence=evidence,
             )
         else:
             # 市场情绪中性 - 总是产出一个信号
-            return create_signal(
-                name="market_neutral",
-                direction=SignalDirection.NEUTRAL.value,
+            return make_signal(
+                name=_MARKET_NEUTRAL,
+                direction=_NEUTRAL,
                 score=risk_score / 3,
-                source_node=self.node_name,
-                run_id=run_id,
                 confidence=0.4,
                 evidence=evidence,
             )
@@ -297,7 +399,7 @@ class CrossAssetNode(BaseNode):
     def _analyze_vix(
         self,
         vix_level: Optional[float],
-        run_id: str,
+        make_signal: Callable[..., dict[str, Any]],
     ) -> Optional[dict[str, Any]]:
         """Analyze VIX levels."""
         if vix_level is None:
@@ -305,99 +407,50 @@ class CrossAssetNode(BaseNode):
 
         evidence = {"vix_level": round(vix_level, 2)}
 
-        # VIX 长期均值约为 19-20
-        if vix_level >= 30:
-            # 恐慌
-            return create_signal(
-                name=SignalName.VIX_SPIKE.value,
-                direction=SignalDirection.BEARISH.value,
-                score=min((vix_level - 20) / 20, 1.0),
-                source_node=self.node_name,
-                run_id=run_id,
-                confidence=0.9,
-                evidence=evidence,
-            )
-        elif vix_level >= 25:
-            # 高波动
-            return create_signal(
-                name=SignalName.VIX_ELEVATED.value,
-                direction=SignalDirection.BEARISH.value,
-                score=0.5,
-                source_node=self.node_name,
-                run_id=run_id,
-                confidence=0.8,
-                evidence=evidence,
-            )
-        elif vix_level >= 20:
-            # 略高于正常
-            return create_signal(
-                name=SignalName.VIX_ELEVATED.value,
-                direction=SignalDirection.BEARISH.value,
-                score=0.3,
-                source_node=self.node_name,
-                run_id=run_id,
-                confidence=0.6,
-                evidence=evidence,
-            )
-        elif vix_level < 15:
-            # 低波动/乐观
-            return create_signal(
-                name=SignalName.VIX_CALM.value,
-                direction=SignalDirection.BULLISH.value,
-                score=0.4,
-                source_node=self.node_name,
-                run_id=run_id,
-                confidence=0.7,
-                evidence=evidence,
-            )
-        else:
-            # 正常波动 (15-20)
-            return create_signal(
-                name="vix_normal",
-                direction=SignalDirection.NEUTRAL.value,
-                score=0,
-                source_node=self.node_name,
-                run_id=run_id,
-                confidence=0.5,
-                evidence=evidence,
-            )
+        name, direction, score, confidence = _VIX_BANDS[bisect_right(_VIX_BOUNDS, vix_level)]
+        if score is None:
+            score = min((vix_level - 20) / 20, 1.0)
+
+        return make_signal(
+            name=name,
+            direction=direction,
+            score=score,
+            confidence=confidence,
+            evidence=evidence,
+        )
 
     def _analyze_flight_to_safety(
         self,
-        changes: dict,
-        run_id: str,
+        spy_change: Optional[float],
+        gld_change: Optional[float],
+        tlt_change: Optional[float],
+        make_signal: Callable[..., dict[str, Any]],
     ) -> Optional[dict[str, Any]]:
         """Detect flight to safety patterns."""
         evidence = {}
 
-        spy_change = changes.get("SPY", {}).get("change_24h")
-        gld_change = changes.get("GLD", {}).get("change_24h")
-        tlt_change = changes.get("TLT", {}).get("change_24h")
-
         if spy_change is None:
             return None
 
         evidence["spy_24h"] = spy_change
 
         # Flight to safety: stocks down, gold/bonds up
-        if spy_change < -0.01:
+        if spy_change < _FLIGHT_SPY_DROP:
             safety_score = 0
 
-            if gld_change and gld_change > 0.005:
+            if gld_change and gld_change > _SAFE_HAVEN_RISE:
                 safety_score += 1
                 evidence["gold_24h"] = gld_change
 
-            if tlt_change and tlt_change > 0.005:
+            if tlt_change and tlt_change > _SAFE_HAVEN_RISE:
                 safety_score += 1
                 evidence["tlt_24h"] = tlt_change
 
             if safety_score >= 1:
-                return create_signal(
-                    name=SignalName.FLIGHT_TO_SAFETY.value,
-                    direction=SignalDirection.BEARISH.value,
+                return make_signal(
+                    name=_FLIGHT_TO_SAFETY,
+                    direction=_BEARISH,
                     score=min(safety_score * 0.4, 1.0),
-                    source_node=self.node_name,
-                    run_id=run_id,
                     confidence=0.7,
                     evidence=evidence,
                 )
@@ -406,13 +459,11 @@ class CrossAssetNode(BaseNode):
 
     def _analyze_crypto_momentum(
         self,
-        changes: dict,
-        run_id: str,
+        btc_change: Optional[float],
+        eth_change: Optional[float],
+        make_signal: Callable[..., dict[str, Any]],
     ) -> Optional[dict[str, Any]]:
         """Analyze crypto market momentum."""
-        btc_change = changes.get("BTC-USDT", {}).get("change_24h")
-        eth_change = changes.get("ETH-USDT", {}).get("change_24h")
-
         if btc_change is None:
             return None
 
@@ -426,58 +477,18 @@ class CrossAssetNode(BaseNode):
             avg_change = (btc_change + eth_change) / 2
 
         # 降低阈值，更敏感地检测动量
-        if avg_change > 0.05:
-            # 强劲上涨
-            return create_signal(
-                name=SignalName.CRYPTO_MOMENTUM.value,
-                direction=SignalDirection.BULLISH.value,
-                score=min(avg_change / 0.1, 1.0),
-                source_node=self.node_name,
-                run_id=run_id,
-                confidence=0.7,
-                evidence=evidence,
-            )
-        elif avg_change > 0.02:
-            # 温和上涨
-            return create_signal(
-                name=SignalName.CRYPTO_MOMENTUM.value,
-                direction=SignalDirection.BULLISH.value,
-                score=avg_change / 0.1,
-                source_node=self.node_name,
-                run_id=run_id,
-                confidence=0.5,
-                evidence=evidence,
-            )
-        elif avg_change < -0.05:
-            # 强劲下跌
-            return create_signal(
-                name=SignalName.CRYPTO_MOMENTUM.value,
-                direction=SignalDirection.BEARISH.value,
-                score=max(avg_change / 0.1, -1.0),
-                source_node=self.node_name,
-                run_id=run_id,
-                confidence=0.7,
-                evidence=evidence,
-            )
-        elif avg_change < -0.02:
-            # 温和下跌
-            return create_signal(
-                name=SignalName.CRYPTO_MOMENTUM.value,
-                direction=SignalDirection.BEARISH.value,
-                score=avg_change / 0.1,
-                source_node=self.node_name,
-                run_id=run_id,
-                confidence=0.5,
-                evidence=evidence,
-            )
+        name, confidence = _CRYPTO_BANDS[bisect_left(_CRYPTO_BOUNDS, abs(avg_change))]
+        if name == _CRYPTO_SIDEWAYS:
+            direction = _NEUTRAL
+        elif avg_change > 0:
+            direction = _BULLISH
         else:
-            # 横盘震荡
-            return create_signal(
-                name="crypto_sideways",
-                direction=SignalDirection.NEUTRAL.value,
-                score=avg_change / 0.1,
-                source_node=self.node_name,
-                run_id=run_id,
-                confidence=0.4,
-                evidence=evidence,
-            )
+            direction = _BEARISH
+
+        return make_signal(
+            name=name,
+            direction=direction,
+            score=max(min(avg_change / 0.1, 1.0), -1.0),
+            confidence=confidence,
+            evidence=evidence,
+        )
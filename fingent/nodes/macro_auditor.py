@@ -9,6 +9,7 @@ from typing import Any, Optional
 
 from fingent.core.timeutil import format_timestamp, now_utc
 from fingent.domain.signals import SignalDirection, SignalName, create_signal
+from fingent.graph.state import GraphState
 from fingent.nodes.base import BaseNode
 from fingent.providers.fred import FREDProvider
 
@@ -30,7 +31,7 @@ class MacroAuditorNode(BaseNode):
         super().__init__(*args, **kwargs)
         self.fred = fred_provider or FREDProvider()
 
-    def run(self, state: dict[str, Any]) -> dict[str, Any]:
+    def run(self, state: GraphState) -> dict[str, Any]:
         """
         Analyze macro indicators and produce signals.
 
@@ -38,6 +39,7 @@ class MacroAuditorNode(BaseNode):
             State update with macro_data and signals
         """
         run_id = self.get_run_id(state)
+        asof = self.get_asof(state)
         existing_signals = self.get_existing_signals(state)
         errors = []
         signals = []
@@ -47,7 +49,7 @@ class MacroAuditorNode(BaseNode):
 
         # Analyze and produce signals
         if macro_data:
-            signals = self._analyze_macro(macro_data, run_id)
+            signals = self._analyze_macro(macro_data, run_id, asof)
 
         # Merge signals
         all_signals = self.merge_signals(existing_signals, signals)
@@ -94,6 +96,7 @@ class MacroAuditorNode(BaseNode):
         self,
         macro_data: dict[str, Any],
         run_id: str,
+        asof: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         """Analyze macro data and produce signals."""
         signals = []
@@ -102,23 +105,23 @@ class MacroAuditorNode(BaseNode):
         yield_spread = macro_data.get("yield_spread")
 
         # === Fed Policy Stance ===
-        fed_signal = self._analyze_fed_stance(indicators, inflation, run_id)
+        fed_signal = self._analyze_fed_stance(indicators, inflation, run_id, asof)
         if fed_signal:
             signals.append(fed_signal)
 
         # === Inflation Trend ===
-        inflation_signal = self._analyze_inflation(inflation, run_id)
+        inflation_signal = self._analyze_inflation(inflation, run_id, asof)
         if inflation_signal:
             signals.append(inflation_signal)
 
         # === Yield Curve ===
         if yield_spread is not None:
-            yield_signal = self._analyze_yield_curve(yield_spread, run_id)
+            yield_signal = self._analyze_yield_curve(yield_spread, run_id, asof)
             if yield_signal:
                 signals.append(yield_signal)
 
         # === Labor Market ===
-        labor_signal = self._analyze_labor(indicators, run_id)
+        labor_signal = self._analyze_labor(indicators, run_id, asof)
         if labor_signal:
             signals.append(labor_signal)
 
@@ -129,6 +132,7 @@ class MacroAuditorNode(BaseNode):
         indicators: dict,
         inflation: dict,
         run_id: str,
+        asof: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
         """Analyze Fed policy stance."""
         hawkish_score = 0
@@ -174,6 +178,7 @@ class MacroAuditorNode(BaseNode):
                 score=min(hawkish_score * 0.3, 1.0),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.5 + min(abs(hawkish_score) * 0.1, 0.3),
                 evidence=evidence,
             )
@@ -184,6 +189,7 @@ class MacroAuditorNode(BaseNode):
                 score=max(hawkish_score * 0.3, -1.0),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.5 + min(abs(hawkish_score) * 0.1, 0.3),
                 evidence=evidence,
             )
@@ -195,6 +201,7 @@ class MacroAuditorNode(BaseNode):
                 score=hawkish_score * 0.2,
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.4,
                 evidence=evidence,
             )
@@ -203,6 +210,7 @@ class MacroAuditorNode(BaseNode):
         self,
         inflation: dict,
         run_id: str,
+        asof: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
         """Analyze inflation trends."""
         cpi_yoy = inflation.get("cpi_yoy")
@@ -227,6 +235,7 @@ class MacroAuditorNode(BaseNode):
                 score=min((cpi_yoy - 2.0) / 3.0, 1.0),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.8,
                 evidence=evidence,
             )
@@ -238,6 +247,7 @@ class MacroAuditorNode(BaseNode):
                 score=min(deviation / 2.0, 0.5),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.6,
                 evidence=evidence,
             )
@@ -249,6 +259,7 @@ class MacroAuditorNode(BaseNode):
                 score=max((2.0 - cpi_yoy) / 2.0, 0.3),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.8,
                 evidence=evidence,
             )
@@ -260,6 +271,7 @@ class MacroAuditorNode(BaseNode):
                 score=max(abs(deviation) / 1.0, 0.2),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.5,
                 evidence=evidence,
             )
@@ -271,6 +283,7 @@ class MacroAuditorNode(BaseNode):
                 score=deviation * 0.2,
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.6,
                 evidence=evidence,
             )
@@ -279,6 +292,7 @@ class MacroAuditorNode(BaseNode):
         self,
         yield_spread: float,
         run_id: str,
+        asof: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
         """Analyze yield curve for inversion signals."""
         evidence = {"yield_spread_2y10y": yield_spread}
@@ -291,6 +305,7 @@ class MacroAuditorNode(BaseNode):
                 score=min(abs(yield_spread) / 0.5, 1.0),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.9,
                 evidence=evidence,
             )
@@ -301,6 +316,7 @@ class MacroAuditorNode(BaseNode):
         self,
         indicators: dict,
         run_id: str,
+        asof: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
         """Analyze labor market conditions."""
         unrate = indicators.get("UNRATE", {})
@@ -323,6 +339,7 @@ class MacroAuditorNode(BaseNode):
                 score=max((4.0 - unemployment) / 2.0, 0.3),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.7,
                 evidence=evidence,
             )
@@ -334,6 +351,7 @@ class MacroAuditorNode(BaseNode):
                 score=0.3,
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.6,
                 evidence=evidence,
             )
@@ -345,6 +363,7 @@ class MacroAuditorNode(BaseNode):
                 score=min((unemployment - 4.0) / 3.0, 1.0),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.7,
                 evidence=evidence,
             )
@@ -356,6 +375,7 @@ class MacroAuditorNode(BaseNode):
                 score=0.3,
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.5,
                 evidence=evidence,
             )
@@ -367,6 +387,7 @@ class MacroAuditorNode(BaseNode):
                 score=0,
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.5,
                 evidence=evidence,
             )
@@ -9,6 +9,7 @@ from typing import Any, Optional
 
 from fingent.core.timeutil import format_timestamp, now_utc
 from fingent.domain.signals import SignalDirection, SignalName, create_signal
+from fingent.graph.state import GraphState
 from fingent.nodes.base import BaseNode
 from fingent.providers.alphavantage import AlphaVantageProvider
 from fingent.providers.finnhub import FinnhubProvider
@@ -59,7 +60,7 @@ class NewsImpactNode(BaseNode):
             return self.finnhub
         return None
 
-    def run(self, state: dict[str, Any]) -> dict[str, Any]:
+    def run(self, state: GraphState) -> dict[str, Any]:
         """
         Analyze news sentiment.
 
@@ -67,6 +68,7 @@ class NewsImpactNode(BaseNode):
             State update with news_data and signals
         """
         run_id = self.get_run_id(state)
+        asof = self.get_asof(state)
         existing_signals = self.get_existing_signals(state)
         errors = []
         signals = []
@@ -76,7 +78,7 @@ class NewsImpactNode(BaseNode):
 
         # Analyze and produce signals
         if news_data.get("articles"):
-            signals = self._analyze_sentiment(news_data, run_id)
+            signals = self._analyze_sentiment(news_data, run_id, asof)
 
         # Merge signals
         all_signals = self.merge_signals(existing_signals, signals)
@@ -279,6 +281,7 @@ class NewsImpactNode(BaseNode):
         self,
         news_data: dict[str, Any],
         run_id: str,
+        asof: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         """Analyze news sentiment and produce signals."""
         signals = []
@@ -298,6 +301,7 @@ class NewsImpactNode(BaseNode):
                     article_count=article_count,
                     source=source,
                     run_id=run_id,
+                    asof=asof,
                     confidence_boost=0.1 if "marketaux" in providers_used else 0,
                 )
                 if signal:
@@ -310,6 +314,7 @@ class NewsImpactNode(BaseNode):
                     score=0,
                     source_node=self.node_name,
                     run_id=run_id,
+                    timestamp=asof,
                     confidence=0.4,
                     evidence={
                         "source": source,
@@ -321,7 +326,7 @@ class NewsImpactNode(BaseNode):
 
         # If we have AlphaVantage data with sentiment scores
         elif source == "alphavantage" and summary:
-            signal = self._analyze_alphavantage_sentiment(summary, run_id)
+            signal = self._analyze_alphavantage_sentiment(summary, run_id, asof)
             if signal:
                 signals.append(signal)
 
@@ -334,6 +339,7 @@ class NewsImpactNode(BaseNode):
                 score=0,
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=0.3,  # Low confidence without sentiment data
                 evidence={
                     "source": "finnhub",
@@ -351,6 +357,7 @@ class NewsImpactNode(BaseNode):
         source: str,
         run_id: str,
         confidence_boost: float = 0,
+        asof: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
         """Analyze sentiment from any source with sentiment scores."""
         evidence = {
@@ -378,6 +385,7 @@ class NewsImpactNode(BaseNode):
                 score=min(avg_sentiment * 2, 1.0),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=confidence,
                 evidence=evidence,
             )
@@ -388,6 +396,7 @@ class NewsImpactNode(BaseNode):
                 score=max(avg_sentiment * 2, -1.0),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=confidence,
                 evidence=evidence,
             )
@@ -398,6 +407,7 @@ class NewsImpactNode(BaseNode):
                 score=avg_sentiment,
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=confidence * 0.8,
                 evidence=evidence,
             )
@@ -406,6 +416,7 @@ class NewsImpactNode(BaseNode):
         self,
         summary: dict[str, Any],
         run_id: str,
+        asof: Optional[str] = None,
     ) -> Optional[dict[str, Any]]:
         """Analyze AlphaVantage sentiment data."""
         avg_sentiment = summary.get("avg_sentiment", 0)
@@ -433,6 +444,7 @@ class NewsImpactNode(BaseNode):
                 score=min(avg_sentiment * 2, 1.0),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=confidence,
                 evidence=evidence,
             )
@@ -443,6 +455,7 @@ class NewsImpactNode(BaseNode):
                 score=max(avg_sentiment * 2, -1.0),
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=confidence,
                 evidence=evidence,
             )
@@ -453,6 +466,7 @@ class NewsImpactNode(BaseNode):
                 score=avg_sentiment,
                 source_node=self.node_name,
                 run_id=run_id,
+                timestamp=asof,
                 confidence=confidence * 0.8,  # Lower confidence for neutral
                 evidence=evidence,
             )
@@ -11,9 +11,10 @@ from typing import Any, Optional
 
 from fingent.core.config import load_yaml_config
 from fingent.core.timeutil import format_timestamp, now_utc
-from fingent.domain.alerts import AlertRuleEngine, AlertSeverity, create_alert
+from fingent.domain.alerts import AlertRuleEngine
 from fingent.domain.report import create_report
 from fingent.domain.signals import aggregate_signals
+from fingent.graph.state import GraphState
 from fingent.nodes.base import BaseNode
 from fingent.services.llm import generate_report_summary
 from fingent.services.market_direction import calculate_market_direction
@@ -42,7 +43,7 @@ class SynthesizeAlertNode(BaseNode):
         alert_rules = self.config.get("alert_rules", [])
         self.rule_engine = AlertRuleEngine(alert_rules)
 
-    def run(self, state: dict[str, Any]) -> dict[str, Any]:
+    def run(self, state: GraphState) -> dict[str, Any]:
         """
         Synthesize signals and generate alerts/report.
 
@@ -5,20 +5,35 @@ Each provider wraps an external API and returns domain models.
 All providers inherit from BaseProvider for consistent interface.
 """
 
+from importlib import import_module
+
 from fingent.providers.base import BaseProvider, ProviderStatus
-from fingent.providers.fred import FREDProvider
-from fingent.providers.finnhub import FinnhubProvider
-from fingent.providers.alphavantage import AlphaVantageProvider
-from fingent.providers.okx import OKXProvider
-from fingent.providers.polymarket import PolymarketProvider
-from fingent.providers.dbnomics import DBnomicsProvider
-from fingent.providers.polygon import PolygonProvider
+# Concrete providers are imported on first attribute access (PEP 562),
+# so importing one provider module does not load every API client.
+_LAZY_IMPORTS = {
+    "FREDProvider": "fingent.providers.fred",
+    "FinnhubProvider": "fingent.providers.finnhub",
+    "AlphaVantageProvider": "fingent.providers.alphavantage",
+    "OKXProvider": "fingent.providers.okx",
+    "PolymarketProvider": "fingent.providers.polymarket",
+    "DBnomicsProvider": "fingent.providers.dbnomics",
+    "PolygonProvider": "fingent.providers.polygon",
+    # News providers (for arbitrage trigger)
+    "MarketauxProvider": "fingent.providers.marketaux",
+    "FMPProvider": "fingent.providers.fmp",
+    "GNewsProvider": "fingent.providers.gnews",
+    "NewsRouter": "fingent.providers.news_router",
+    "get_news_router": "fingent.providers.news_router",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# News providers (for arbitrage trigger)
-from fingent.providers.marketaux import MarketauxProvider
-from fingent.providers.fmp import FMPProvider
-from fingent.providers.gnews import GNewsProvider
-from fingent.providers.news_router import NewsRouter, get_news_router
 
 __all__ = [
     "BaseProvider",
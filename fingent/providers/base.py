@@ -13,7 +13,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
 
-from fingent.core.cache import CacheManager, get_provider_cache
+from fingent.core.cache import CacheManager, get_kind_ttl, get_provider_cache
 from fingent.core.config import Settings, get_settings
 from fingent.core.errors import ProviderError, DataNotAvailableError, QuotaExceededError
 from fingent.core.http import HttpClient, get_http_client
@@ -106,10 +106,19 @@ class BaseProvider(ABC, LoggerMixin):
         full_key = f"{self.name}:{key}"
         return self.cache.get(full_key)
 
-    def _set_cached(self, key: str, value: Any) -> None:
-        """Set value in cache with provider prefix."""
+    def _set_cached(self, key: str, value: Any, kind: Optional[str] = None) -> None:
+        """
+        Set value in cache with provider prefix.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            kind: Data kind with its own TTL floor (usage_mode.cache_ttl.kinds),
+                e.g. "daily_bars"; None uses the provider TTL
+        """
         full_key = f"{self.name}:{key}"
-        self.cache.set(full_key, value)
+        ttl = get_kind_ttl(self.name, kind) if kind else None
+        self.cache.set(full_key, value, ttl)
 
     def _handle_error(
         self,
@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 from typing import Any, Optional
 
 import finnhub
+from requests.adapters import HTTPAdapter
 
 from fingent.core.errors import DataNotAvailableError, ProviderError
 from fingent.core.timeutil import format_timestamp, now_utc, days_ago
@@ -44,6 +45,13 @@ class FinnhubProvider(BaseProvider):
                 recoverable=False,
             )
         self._client = finnhub.Client(api_key=api_key)
+        # Keep connections alive across calls instead of reconnecting per request.
+        # _session is SDK-internal, so skip pooling if a release renames it
+        session = getattr(self._client, "_session", None)
+        if session is not None:
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        else:
+            self.logger.warning("Finnhub client has no _session; connection pooling disabled")
         self.logger.info("Finnhub provider initialized")
 
     @property
@@ -191,7 +199,8 @@ class FinnhubProvider(BaseProvider):
                 )
                 result.append(bar)
 
-            self._set_cached(cache_key, [b.to_dict() for b in result])
+            kind = "daily_bars" if resolution == "D" else None
+            self._set_cached(cache_key, [b.to_dict() for b in result], kind=kind)
             return result
 
         except Exception as e:
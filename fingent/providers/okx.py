@@ -199,7 +199,8 @@ class OKXProvider(BaseProvider):
                 )
                 result.append(bar)
 
-            self._set_cached(cache_key, [b.to_dict() for b in result])
+            kind = "daily_bars" if timeframe == "1d" else None
+            self._set_cached(cache_key, [b.to_dict() for b in result], kind=kind)
             return result
 
         except Exception as e:
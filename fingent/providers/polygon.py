@@ -299,7 +299,8 @@ class PolygonProvider(BaseProvider):
                     )
                 result.append(price_bar)
 
-            self._set_cached(cache_key, [b.to_dict() for b in result])
+            kind = "daily_bars" if timespan == "day" else None
+            self._set_cached(cache_key, [b.to_dict() for b in result], kind=kind)
             return result
 
         except Exception as e:
@@ -10,10 +10,13 @@ Supports:
 """
 
 import re
+import threading
 import time
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from cachetools import TTLCache
+
 from fingent.core.errors import DataNotAvailableError, ProviderError
 from fingent.core.timeutil import format_timestamp, now_utc
 from fingent.domain.models import (
@@ -58,9 +61,16 @@ class PolymarketProvider(OptionalProvider):
 
     BASE_URL = "https://gamma-api.polymarket.com"
 
+    # Arb market lists go stale quickly (volume filter), so they get
+    # their own short-lived cache instead of the provider-wide TTL
+    ARB_MARKETS_TTL = 60
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        self._arb_markets_cache: TTLCache = TTLCache(maxsize=256, ttl=self.ARB_MARKETS_TTL)
+        self._arb_markets_lock = threading.Lock()
+
         # Check if enabled in settings
         if not self.settings.polymarket_enabled:
             self._enabled = False
@@ -642,6 +652,18 @@ class PolymarketProvider(OptionalProvider):
         if not self.is_enabled:
             return {}
 
+        # Many news items in one batch map to the same keyword set
+        cache_key = (
+            tuple(sorted(keywords)),
+            min_volume,
+            min_markets_per_event,
+            tuple(sorted((k, tuple(v)) for k, v in synonym_map.items())) if synonym_map else (),
+        )
+        with self._arb_markets_lock:
+            cached = self._arb_markets_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
         # Search for markets with synonym expansion
         all_markets = self.search_markets_by_keyword(keywords, synonym_map=synonym_map)
 
@@ -654,8 +676,12 @@ class PolymarketProvider(OptionalProvider):
                 by_event[market.event_id].append(market)
 
         # Filter events with enough markets
-        return {
+        result = {
             event_id: markets
             for event_id, markets in by_event.items()
             if len(markets) >= min_markets_per_event
         }
+
+        with self._arb_markets_lock:
+            self._arb_markets_cache[cache_key] = result
+        return dict(result)
@@ -6,7 +6,6 @@ Supports:
 - S3 (cloud deployment, future)
 """
 
-import json
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +17,7 @@ from sqlalchemy.orm import sessionmaker
 
 from fingent.core.config import Settings, get_settings
 from fingent.core.logging import get_logger
+from fingent.core.serialization import from_json, to_json_text
 from fingent.core.timeutil import format_timestamp, now_utc
 
 logger = get_logger("persistence")
@@ -105,8 +105,8 @@ class SQLitePersistence(PersistenceService):
         snapshot = RunSnapshot(
             run_id=run_id,
             timestamp=datetime.utcnow(),
-            state_json=json.dumps(state, default=str),
-            report_json=json.dumps(state.get("report", {}), default=str),
+            state_json=to_json_text(state),
+            report_json=to_json_text(state.get("report", {})),
             alert_count=len(state.get("alerts", [])),
             signal_count=len(state.get("signals", [])),
             error_count=len(state.get("errors", [])),
@@ -142,7 +142,7 @@ class SQLitePersistence(PersistenceService):
         try:
             snapshot = session.query(RunSnapshot).filter_by(run_id=run_id).first()
             if snapshot:
-                return json.loads(snapshot.state_json)
+                return from_json(snapshot.state_json)
             return None
         finally:
             session.close()
@@ -157,7 +157,7 @@ class SQLitePersistence(PersistenceService):
                 .first()
             )
             if snapshot:
-                return json.loads(snapshot.state_json)
+                return from_json(snapshot.state_json)
             return None
         finally:
             session.close()
@@ -191,7 +191,7 @@ class SQLitePersistence(PersistenceService):
         try:
             snapshot = session.query(RunSnapshot).filter_by(run_id=run_id).first()
             if snapshot and snapshot.report_json:
-                return json.loads(snapshot.report_json)
+                return from_json(snapshot.report_json)
             return None
         finally:
             session.close()
@@ -8,6 +8,7 @@ For cloud deployment, use EventBridge/CloudWatch Events instead.
 from datetime import datetime
 from typing import Any, Callable, Optional
 
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
@@ -38,8 +39,19 @@ class SchedulerService:
     def scheduler(self) -> BackgroundScheduler:
         """Lazy-initialize scheduler."""
         if self._scheduler is None:
+            scheduler_config = self.config.get("scheduler", {})
+            # One bounded pool shared by all jobs; overlapping or missed
+            # runs collapse into one instead of piling up
             self._scheduler = BackgroundScheduler(
                 timezone=self.settings.timezone,
+                executors={
+                    "default": ThreadPoolExecutor(scheduler_config.get("max_workers", 4)),
+                },
+                job_defaults={
+                    "coalesce": scheduler_config.get("coalesce", True),
+                    "max_instances": scheduler_config.get("max_instances", 1),
+                    "misfire_grace_time": scheduler_config.get("misfire_grace_time", 60),
+                },
             )
         return self._scheduler
 
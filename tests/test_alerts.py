@@ -0,0 +1,54 @@
+"""Tests for rule-based alerts."""
+
+from dataclasses import asdict
+
+from fingent.domain.alerts import Alert, AlertRuleEngine
+
+
+class TestAlert:
+    """Tests for Alert."""
+
+    def test_to_dict_matches_asdict(self):
+        """Test that the explicit to_dict covers every field."""
+        alert = Alert(
+            id="alert_vix_spike_run1",
+            rule_name="vix_spike",
+            title="VIX spike",
+            message="vix = 32.0000 > 30",
+            condition={"metric": "vix", "operator": ">", "threshold": 30},
+            current_value=32.0,
+            threshold=30,
+        )
+
+        assert alert.to_dict() == asdict(alert)
+        assert Alert.from_dict(alert.to_dict()) == alert
+        assert not hasattr(alert, "__dict__")
+
+
+class TestAlertRuleEngine:
+    """Tests for AlertRuleEngine."""
+
+    def test_evaluate_matches_scalar_operators(self):
+        """Test vectorized evaluation against per-rule operator checks."""
+        rules = [
+            {"name": f"r{i}", "condition": {"metric": metric, "operator": op, "threshold": threshold}}
+            for i, (metric, op, threshold) in enumerate([
+                ("vix_level", ">", 25),
+                ("vix_level", "<=", 25),
+                ("btc_24h_change", "<", -0.08),
+                ("btc_24h_change", "!=", 0),
+                ("gold_24h_change", "==", 0.03),
+                ("missing", "!=", 1),
+                ("vix_level", "~", 1),
+                ("vix_level", ">", None),
+            ])
+        ]
+        metrics = {"vix_level": 30.0, "btc_24h_change": -0.1, "gold_24h_change": 0.03}
+
+        alerts = AlertRuleEngine(rules).evaluate(metrics, run_id="run1")
+
+        assert [a["rule_name"] for a in alerts] == ["r0", "r2", "r3", "r4"]
+        assert alerts[0]["id"] == "alert_r0_run1"
+        assert alerts[0]["current_value"] == 30.0
+        assert len({a["triggered_at"] for a in alerts}) == 1
+        assert AlertRuleEngine([]).evaluate(metrics) == []
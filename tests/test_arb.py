@@ -0,0 +1,377 @@
+"""Tests for Polymarket arbitrage engine."""
+
+import pickle
+import threading
+import time
+from datetime import datetime, timezone
+from functools import partial
+
+import numpy as np
+import pytest
+from unittest.mock import Mock
+
+from fingent.arb.book import MarketBook
+from fingent.arb.engine import ArbEngine
+from fingent.arb.risk import RiskManager
+from fingent.arb.strategy import TermStructureStrategy
+from fingent.domain.models import (
+    ArbOpportunity,
+    ArbSnapshot,
+    PolymarketMarket,
+    PolymarketQuote,
+    RiskFlag,
+)
+
+
+def make_quote(market_id: str, mid: float = 0.5) -> PolymarketQuote:
+    """Create a tight, liquid quote."""
+    return PolymarketQuote(
+        market_id=market_id,
+        timestamp="2026-01-01T00:00:00Z",
+        bid=mid - 0.005,
+        ask=mid + 0.005,
+        mid=mid,
+        spread=0.01,
+        spread_bps=0.01 / mid * 10000,
+        depth_bid=5000,
+        depth_ask=5000,
+        volume_24h=50000,
+    )
+
+
+class TestArbEngine:
+    """Tests for ArbEngine."""
+
+    @pytest.fixture
+    def config(self):
+        """Minimal arbitrage config."""
+        return {
+            "enabled": True,
+            "trigger_keywords": ["(Fed|FOMC)", "(gold|XAU)"],
+            "term_structure": {"delta_threshold": 0.05},
+            "risk": {"min_volume_24h": 1000, "min_time_to_settle_hours": 0},
+        }
+
+    @pytest.fixture
+    def provider(self):
+        """Mock Polymarket provider returning one quote per market."""
+        provider = Mock()
+        provider.is_enabled = True
+        provider.get_quotes_batch.side_effect = lambda markets: {
+            m.market_id: make_quote(m.market_id) for m in markets
+        }
+        return provider
+
+    @pytest.fixture
+    def event_markets(self):
+        """Several events with a short and a long tenor market each."""
+        return {
+            f"evt{i}": [
+                PolymarketMarket(market_id=f"m{i}s", event_id=f"evt{i}", question="s", tenor_days=7),
+                PolymarketMarket(market_id=f"m{i}l", event_id=f"evt{i}", question="l", tenor_days=90),
+            ]
+            for i in range(5)
+        }
+
+    def test_detect_opportunities_snapshots_all_events(self, config, provider, event_markets):
+        """Test that concurrent detection snapshots every market exactly once."""
+        engine = ArbEngine(provider=provider, config=config)
+
+        opportunities = engine.detect_opportunities(event_markets)
+
+        # Prices have not moved since snapshot, so nothing is detected
+        assert opportunities == []
+        assert len(engine.get_snapshots()) == 10
+        provider.get_quote.assert_not_called()
+
+    def test_run_scan_reuses_detection_quotes(self, config, provider, event_markets):
+        """Test that the risk filter reuses quotes fetched during detection."""
+        provider.get_markets_for_arb.return_value = event_markets
+        engine = ArbEngine(provider=provider, config=config)
+        engine.create_snapshots([m for markets in event_markets.values() for m in markets])
+        provider.get_quotes_batch.reset_mock()
+        provider.get_quotes_batch.side_effect = lambda markets: {
+            m.market_id: make_quote(m.market_id, 0.6 if m.tenor_days < 30 else 0.5)
+            for m in markets
+        }
+
+        confirmed = engine.run_scan(keywords=["fed"])
+
+        assert len(confirmed) == 5
+        assert all(o.status == "CONFIRMED" for o in confirmed)
+        assert provider.get_quotes_batch.call_count == len(event_markets)
+
+    def test_scan_finnhub_news_processes_items_concurrently(self, config, provider, event_markets):
+        """Test that parallel news processing confirms each event once."""
+        provider.get_markets_for_arb.return_value = event_markets
+        engine = ArbEngine(provider=provider, config=config)
+        engine.create_snapshots([m for markets in event_markets.values() for m in markets])
+        provider.get_quotes_batch.side_effect = lambda markets: {
+            m.market_id: make_quote(m.market_id, 0.6 if m.tenor_days < 30 else 0.5)
+            for m in markets
+        }
+        news = [
+            Mock(title=f"Fed headline {i}", summary="", url=f"https://x/{i}") for i in range(6)
+        ] + [Mock(title="Quiet day in equities", summary="", url="https://x/q")]
+        finnhub = Mock()
+        finnhub.get_market_news.return_value = news
+
+        confirmed = engine.scan_finnhub_news(finnhub_provider=finnhub)
+
+        # Cooldown lets each event through exactly once across all news items
+        assert sorted(o.event_id for o in confirmed) == sorted(event_markets)
+
+    def test_parallel_news_share_event_bound(self, config, provider, event_markets):
+        """Test that concurrent news scans never exceed max_concurrent_events quote calls."""
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def get_quotes_batch(markets):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.005)
+            with lock:
+                in_flight[0] -= 1
+            return {m.market_id: make_quote(m.market_id) for m in markets}
+
+        provider.get_markets_for_arb.return_value = event_markets
+        provider.get_quotes_batch.side_effect = get_quotes_batch
+        config.update(max_concurrent_events=3, max_parallel_news=4)
+        engine = ArbEngine(provider=provider, config=config)
+        news = [Mock(title=f"Fed headline {i}", summary="", url=f"https://x/{i}") for i in range(8)]
+        finnhub = Mock()
+        finnhub.get_market_news.return_value = news
+
+        engine.scan_finnhub_news(finnhub_provider=finnhub)
+
+        assert provider.get_quotes_batch.call_count >= 8 * len(event_markets)
+        assert peak[0] <= 3
+
+    def test_scan_finnhub_news_skips_seen_items(self, config, provider):
+        """Test that repeated news items are only processed once."""
+        engine = ArbEngine(provider=provider, config=config)
+        engine.process_news = Mock(return_value=[])
+        news = [
+            Mock(title="Fed holds", summary="", url="https://x/1"),
+            Mock(title="Fed holds again", summary="", url="https://x/1"),
+            Mock(title="Gold rallies", summary="", url=""),
+        ]
+        finnhub = Mock()
+        finnhub.get_market_news.return_value = news
+
+        engine.scan_finnhub_news(finnhub_provider=finnhub)
+        engine.scan_finnhub_news(finnhub_provider=finnhub)
+
+        assert engine.process_news.call_count == 2
+
+    def test_failed_news_item_is_retried_next_poll(self, config, provider):
+        """Test that an item whose processing raised is processed again on the next poll."""
+        engine = ArbEngine(provider=provider, config=config)
+        engine.process_news = Mock(side_effect=[RuntimeError("scan timed out"), [], []])
+        news = [Mock(title="Fed holds", summary="", url="https://x/1")]
+        finnhub = Mock()
+        finnhub.get_market_news.return_value = news
+
+        engine.scan_finnhub_news(finnhub_provider=finnhub)
+        engine.scan_finnhub_news(finnhub_provider=finnhub)
+        engine.scan_finnhub_news(finnhub_provider=finnhub)
+
+        assert engine.process_news.call_count == 2
+
+    def test_check_news_trigger_one_match_per_pattern(self, config, provider):
+        """Test that the combined trigger regex reports one match per pattern."""
+        engine = ArbEngine(provider=provider, config=config)
+
+        matched = engine.check_news_trigger("Gold rallies as FOMC holds", "Fed signals gold demand")
+
+        assert matched == ["FOMC", "Gold"]
+        assert engine.check_news_trigger("Quiet day in equities") == []
+
+    def test_check_news_trigger_reports_overlapping_keywords(self, config, provider):
+        """Test that a keyword inside another pattern's match is still reported."""
+        config["trigger_keywords"] = ["gold", "gold reserve", "central bank"]
+        engine = ArbEngine(provider=provider, config=config)
+        engine._keyword_automaton = None
+
+        matched = engine.check_news_trigger("Central bank gold reserve up")
+
+        assert matched == ["gold", "gold reserve", "Central bank"]
+
+    def test_check_news_triggers_matches_per_item(self, config, provider):
+        """Test that the batch trigger scan agrees with per-item checks."""
+        engine = ArbEngine(provider=provider, config=config)
+        news = [
+            Mock(title="Gold rallies as FOMC holds", summary="Fed signals gold demand"),
+            Mock(title="Quiet day in equities", summary=""),
+            Mock(title="XAU", summary="fed"),
+        ]
+
+        assert engine.check_news_triggers(news) == [
+            engine.check_news_trigger(item.title, item.summary) for item in news
+        ]
+        assert engine.check_news_triggers(news)[1] == []
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_check_news_triggers_reports_overlapping_keywords(self, config, provider, use_automaton):
+        """Test that batch and single checks agree on overlapping keywords."""
+        config["trigger_keywords"] = ["gold", "gold reserve", "central bank"]
+        engine = ArbEngine(provider=provider, config=config)
+        if not use_automaton:
+            engine._keyword_automaton = None
+        news = [
+            Mock(title="Central bank gold reserve up", summary=""),
+            Mock(title="Quiet day", summary="gold reserves steady"),
+            Mock(title="Nothing here", summary=""),
+        ]
+
+        results = engine.check_news_triggers(news)
+
+        assert results == [engine.check_news_trigger(item.title, item.summary) for item in news]
+        assert results[0] == ["gold", "gold reserve", "Central bank"]
+        assert results[2] == []
+
+    def test_clear_snapshots_expires_only_stale(self, config, provider, event_markets):
+        """Test that clear_snapshots removes only snapshots past the cutoff."""
+        engine = ArbEngine(provider=provider, config=config)
+        engine.create_snapshots(event_markets["evt0"])
+
+        assert engine.clear_snapshots(older_than_hours=6) == 0
+        assert engine.clear_snapshots(older_than_hours=-1) == 2
+        assert engine.get_snapshots() == {}
+
+
+class TestTermStructureStrategy:
+    """Tests for TermStructureStrategy."""
+
+    def test_evaluate_picks_most_divergent_pair(self):
+        """Test that an intermediate tenor can form a leg."""
+        strategy = TermStructureStrategy({"term_structure": {"delta_threshold": 0.05}})
+        markets = [
+            PolymarketMarket(market_id=f"m{d}", event_id="evt", question=str(d), tenor_days=d)
+            for d in (7, 30, 90)
+        ]
+        snapshots = {
+            m.market_id: ArbSnapshot(m.market_id, "news", "2026-01-01T00:00:00Z", p0=0.5)
+            for m in markets
+        }
+        quotes = {
+            "m7": make_quote("m7", 0.52),
+            "m30": make_quote("m30", 0.65),
+            "m90": make_quote("m90", 0.50),
+        }
+
+        opportunity = strategy.evaluate(
+            "evt", markets, quotes, snapshots, trigger_ts=datetime.now(timezone.utc)
+        )
+
+        assert opportunity is not None
+        assert [leg["market_id"] for leg in opportunity.legs] == ["m30", "m90"]
+        assert opportunity.delta_diff == pytest.approx(0.15)
+
+    def test_to_dict_returns_private_copy(self):
+        """Test that mutating a to_dict() result does not leak into later calls."""
+        opportunity = ArbOpportunity("o1", "t", "TERM_STRUCTURE", "evt", legs=[{"market_id": "m1"}])
+
+        first = opportunity.to_dict()
+        first["legs"].append({"market_id": "m2"})
+        first["status"] = "CONFIRMED"
+
+        assert opportunity.to_dict()["legs"] == [{"market_id": "m1"}]
+        assert opportunity.to_dict()["status"] == "CANDIDATE"
+
+    def test_opportunity_evidence_is_lazy(self):
+        """Test that evidence is only built when read."""
+        factory = Mock(return_value={"delta_short": 0.1})
+        opportunity = ArbOpportunity("o1", "t", "TERM_STRUCTURE", "evt", evidence_factory=factory)
+
+        factory.assert_not_called()
+        assert opportunity.to_dict()["evidence"] == {"delta_short": 0.1}
+        assert opportunity.evidence == {"delta_short": 0.1}
+        factory.assert_called_once()
+
+    def test_opportunity_evidence_survives_pickle(self):
+        """Test that an unmaterialized opportunity keeps its evidence through pickling."""
+        opportunity = ArbOpportunity("o1", "t", "TERM_STRUCTURE", "evt", evidence_factory=partial(dict, edge=0.1))
+
+        restored = pickle.loads(pickle.dumps(opportunity))
+
+        assert restored.evidence == {"edge": 0.1}
+        assert ArbOpportunity.from_dict(restored.to_dict()) == restored
+
+
+class TestRiskManager:
+    """Tests for RiskManager."""
+
+    def test_filter_short_circuits_on_cooldown(self):
+        """Test that an event in cooldown is filtered without leg checks."""
+        risk = RiskManager({"min_time_to_settle_hours": 0, "cooldown_seconds": 900})
+        legs = [{"market_id": "m1"}, {"market_id": "m2"}]
+        quotes = {"m1": make_quote("m1"), "m2": make_quote("m2")}
+
+        first = risk.filter(ArbOpportunity("o1", "t", "TERM_STRUCTURE", "evt", legs=legs), quotes)
+        second = risk.filter(ArbOpportunity("o2", "t", "TERM_STRUCTURE", "evt", legs=legs), {})
+
+        assert first.status == "CANDIDATE"
+        assert second.status == "FILTERED"
+        assert len(second.risk_flags) == 1
+        assert second.risk_flags[0].startswith("COOLDOWN:evt:")
+        assert second.risk_flags_bits == RiskFlag.COOLDOWN
+
+    def test_risk_flags_survive_pickle(self):
+        """Test that unformatted risk flags are kept through pickling."""
+        opportunity = ArbOpportunity("o1", "t", "TERM_STRUCTURE", "evt")
+        opportunity.set_risk_flags(RiskFlag.MISSING_QUOTE, [(RiskFlag.MISSING_QUOTE, "m1", None)])
+
+        restored = pickle.loads(pickle.dumps(opportunity))
+
+        assert restored.risk_flags == ["MISSING_QUOTE:m1"]
+        assert restored.to_dict()["risk_flags"] == ["MISSING_QUOTE:m1"]
+
+    def test_filter_formats_flags_on_demand(self):
+        """Test that flag bits are set and strings match the legacy format."""
+        risk = RiskManager({"min_time_to_settle_hours": 0, "max_spread_bps": 100})
+        wide = make_quote("m1", mid=0.1)
+        legs = [{"market_id": "m1"}, {"market_id": "m2"}]
+
+        opp = risk.filter(ArbOpportunity("o1", "t", "TERM_STRUCTURE", "evt", legs=legs), {"m1": wide})
+
+        assert opp.status == "FILTERED"
+        assert opp.risk_flags_bits == RiskFlag.WIDE_SPREAD | RiskFlag.MISSING_QUOTE
+        assert opp.to_dict()["risk_flags"] == ["WIDE_SPREAD:m1:1000bps", "MISSING_QUOTE:m2"]
+
+
+class TestMarketBook:
+    """Tests for MarketBook."""
+
+    def test_deltas_and_row_reuse(self):
+        """Test vectorized deltas and that removed rows are recycled."""
+        book = MarketBook(capacity=2)
+        snapshots = {
+            m: ArbSnapshot(m, "news", "2026-01-01T00:00:00Z", p0=0.5) for m in ("a", "b", "c")
+        }
+        book.update(snapshots, {"a": make_quote("a", 0.6), "b": make_quote("b", 0.45)})
+
+        deltas = book.deltas(["b", "a"])
+        assert deltas.dtype == "float32"
+        assert deltas.tolist() == pytest.approx([-0.05, 0.1], abs=1e-6)
+
+        book.remove(["a"])
+        book.update({"d": ArbSnapshot("d", "news", "2026-01-01T00:00:00Z", p0=0.2)}, {})
+        assert "a" not in book
+        assert len(book) == 3
+        assert len(book.market_ids) == 3
+
+    def test_quotes_without_snapshot_get_no_row(self):
+        """Test that unsnapshotted quotes allocate nothing and unknown ids read as NaN."""
+        book = MarketBook(capacity=2)
+        snapshot = ArbSnapshot("a", "news", "2026-01-01T00:00:00Z", p0=0.5)
+        book.update({"a": snapshot}, {"a": make_quote("a", 0.6), "x": make_quote("x")})
+
+        assert "x" not in book
+        assert len(book) == 1
+
+        book.remove(["a"])
+        deltas = book.deltas(["a", "x"])
+        assert np.isnan(deltas).all()
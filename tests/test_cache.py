@@ -0,0 +1,143 @@
+"""Tests for caching utilities."""
+
+from unittest.mock import patch
+
+from fingent.core.cache import (
+    CacheManager,
+    FastTTLCache,
+    _get_provider_ttl,
+    cached,
+    get_kind_ttl,
+    make_cache_key,
+)
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_key_is_stable_and_order_independent(self):
+        """Test that kwargs order does not change the key."""
+        assert make_cache_key("SPY", a=1, b=2) == make_cache_key("SPY", b=2, a=1)
+        assert make_cache_key("SPY") == make_cache_key("SPY")
+
+    def test_key_distinguishes_values(self):
+        """Test that different arguments give different keys."""
+        assert make_cache_key("SPY") != make_cache_key("QQQ")
+        assert make_cache_key(1) != make_cache_key("1")
+        assert make_cache_key("SPY", period=5) != make_cache_key("SPY", period=6)
+
+    def test_container_args_ignore_key_order(self):
+        """Test that equal dicts give the same key regardless of insertion order."""
+        first = make_cache_key(params={"symbols": ["SPY", "QQQ"], "limit": 5})
+        second = make_cache_key(params={"limit": 5, "symbols": ["SPY", "QQQ"]})
+
+        assert first == second
+        assert first != make_cache_key(params={"limit": 5, "symbols": ["QQQ", "SPY"]})
+
+
+class TestFastTTLCache:
+    """Tests for FastTTLCache."""
+
+    def test_expiry_and_lru_eviction(self):
+        """Test that entries expire after TTL and the least recently used is evicted."""
+        cache = FastTTLCache(maxsize=2, ttl=10)
+        with patch("fingent.core.cache.time.monotonic", return_value=100.0):
+            cache["a"] = 1
+            cache["b"] = 2
+            assert cache.get("a") == 1
+            cache["c"] = 3
+
+        with patch("fingent.core.cache.time.monotonic", return_value=105.0):
+            assert cache.get("b") is None
+            assert cache.get("a") == 1
+
+        with patch("fingent.core.cache.time.monotonic", return_value=111.0):
+            assert cache.get("a", "missing") == "missing"
+
+
+class TestCacheManager:
+    """Tests for CacheManager."""
+
+    def test_set_with_entry_ttl(self):
+        """Test that a per-entry TTL overrides the cache TTL."""
+        cache = CacheManager(ttl=60)
+        with patch("fingent.core.cache.time.monotonic", return_value=100.0):
+            cache.set("book", {"bids": []}, ttl=5)
+            cache.set("quote", 1)
+
+        with patch("fingent.core.cache.time.monotonic", return_value=106.0):
+            assert cache.get("book") is None
+            assert cache.get("quote") == 1
+
+    def test_kind_ttl_floors_provider_ttl(self):
+        """Test that a data-kind TTL only ever lengthens the provider TTL."""
+        config = {"usage_mode": {"cache_ttl": {
+            "providers": {"finnhub": 60, "polygon": 86400},
+            "kinds": {"daily_bars": 3600},
+        }}}
+        get_kind_ttl.cache_clear()
+        _get_provider_ttl.cache_clear()
+        try:
+            with patch("fingent.core.cache.load_yaml_config", return_value=config):
+                assert get_kind_ttl("finnhub", "daily_bars") == 3600
+                assert get_kind_ttl("polygon", "daily_bars") == 86400
+                assert get_kind_ttl("finnhub", "quote") == 60
+        finally:
+            get_kind_ttl.cache_clear()
+            _get_provider_ttl.cache_clear()
+
+
+class TestCached:
+    """Tests for the cached decorator."""
+
+    def test_cached_reuses_result(self):
+        """Test that repeated calls hit the cache."""
+        calls = []
+
+        @cached(cache=CacheManager(ttl=60))
+        def fetch(symbol: str, period: int = 1) -> dict:
+            calls.append(symbol)
+            return {"symbol": symbol, "period": period}
+
+        assert fetch("SPY", period=2) == fetch("SPY", period=2)
+        assert len(calls) == 1
+        assert fetch.cache.stats["hits"] == 1
+
+    def test_decorators_share_named_cache(self):
+        """Test that decorators with the same TTL share one cache without key clashes."""
+
+        @cached(ttl=123)
+        def first(x: int) -> int:
+            return x + 1
+
+        @cached(ttl=123)
+        def second(x: int) -> int:
+            return x + 2
+
+        assert first.cache is second.cache
+        assert (first(1), second(1)) == (2, 3)
+
+    def test_cached_handles_unhashable_args(self):
+        """Test that unhashable arguments fall back to a hashed string key."""
+        calls = []
+
+        @cached(cache=CacheManager(ttl=60))
+        def fetch(symbols: list[str]) -> list[str]:
+            calls.append(symbols)
+            return list(symbols)
+
+        assert fetch(["SPY", "QQQ"]) == fetch(["SPY", "QQQ"])
+        assert len(calls) == 1
+
+    def test_cached_stores_none(self):
+        """Test that a None result is cached instead of re-fetched."""
+        calls = []
+
+        @cached(cache=CacheManager(ttl=60))
+        def fetch(symbol: str):
+            calls.append(symbol)
+            return None
+
+        assert fetch("SPY") is None
+        assert fetch("SPY") is None
+        assert len(calls) == 1
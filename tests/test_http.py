@@ -0,0 +1,234 @@
+"""Tests for HTTP client."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from fingent.core.errors import ProviderError, RateLimitError
+from fingent.core.http import HttpClient, _parse_reset, aclose_all
+
+
+def make_client(handler, max_retries: int = 3) -> HttpClient:
+    """Create an HttpClient backed by a mock transport."""
+    client = HttpClient(base_url="https://api.test", max_retries=max_retries)
+    client._client = httpx.Client(base_url="https://api.test", transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestHttpClientRetry:
+    """Tests for HttpClient retry policy."""
+
+    def test_rate_limit_honors_retry_after(self):
+        """Test that a 429 is retried after the server's Retry-After."""
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"ok": True}),
+        ])
+        client = make_client(lambda request: next(responses))
+
+        with patch("tenacity.nap.time.sleep") as sleep:
+            assert client.get("/quote") == {"ok": True}
+
+        sleep.assert_called_once_with(2.0)
+
+    def test_network_errors_stop_at_max_retries(self):
+        """Test that network errors retry with backoff up to max_retries."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("boom", request=request)
+
+        client = make_client(handler, max_retries=2)
+
+        with patch("tenacity.nap.time.sleep") as sleep:
+            with pytest.raises(ProviderError):
+                client.get("/quote")
+
+        assert len(calls) == 2
+        assert 0 <= sleep.call_args[0][0] <= 10
+
+    def test_empty_retry_bucket_fails_fast(self):
+        """Test that retries stop without network I/O once the token bucket is empty."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("boom", request=request)
+
+        client = make_client(handler, max_retries=5)
+        client._retry_tokens["flaky"] = 1.5
+
+        with patch("tenacity.nap.time.sleep"):
+            with pytest.raises(ProviderError) as exc_info:
+                client.get("/quote", provider_name="flaky")
+
+        assert len(calls) == 2
+        assert exc_info.value.recoverable is False
+        assert client._retry_tokens["flaky"] == 0.5
+
+    def test_retry_bucket_drains_during_outage(self):
+        """Test that a sustained outage empties the bucket after a few failed calls."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("boom", request=request)
+
+        client = make_client(handler, max_retries=3)
+
+        with patch("tenacity.nap.time.sleep"):
+            for _ in range(10):
+                with pytest.raises(ProviderError):
+                    client.get("/quote", provider_name="down")
+
+        # 9 tokens cover 4.5 calls' retries; afterwards each call fails on its first attempt
+        assert len(calls) == 19
+        assert client._retry_tokens["down"] == 0.0
+
+    def test_non_json_body_is_wrapped(self):
+        """Test that JSON is decoded and other bodies come back as _raw text."""
+        bodies = iter([
+            httpx.Response(200, content=b'{"c": [1.5, 2]}'),
+            httpx.Response(200, text="not json"),
+        ])
+        client = make_client(lambda request: next(bodies))
+
+        assert client.get("/candles") == {"c": [1.5, 2]}
+        assert client.get("/candles") == {"_raw": "not json"}
+
+    def test_client_errors_are_not_retried(self):
+        """Test that 4xx responses fail immediately."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        client = make_client(handler)
+
+        with pytest.raises(ProviderError) as exc_info:
+            client.get("/missing")
+
+        assert not isinstance(exc_info.value, RateLimitError)
+        assert len(calls) == 1
+
+
+class TestAsyncClientPool:
+    """Tests for the shared async client pool."""
+
+    def test_async_client_shared_by_settings(self):
+        """Test that clients with equal settings share one pooled AsyncClient."""
+        first = HttpClient(base_url="https://pool.test", timeout=5, headers={"A": "1"})
+        second = HttpClient(base_url="https://pool.test", timeout=5, headers={"A": "1"})
+        other = HttpClient(base_url="https://pool.test", timeout=7, headers={"A": "1"})
+
+        assert first.async_client is second.async_client
+        assert other.async_client is not first.async_client
+
+        closed = first.async_client
+        asyncio.run(first.aclose())
+        fresh = HttpClient(base_url="https://pool.test", timeout=5, headers={"A": "1"})
+
+        assert closed.is_closed
+        assert fresh.async_client is not closed
+        asyncio.run(aclose_all())
+
+    def test_close_inside_running_loop(self):
+        """Test that sync close() is safe from within an event loop."""
+
+        async def close_both():
+            client = HttpClient(base_url="https://close.test")
+            client.client
+            pooled = client.async_client
+            client.close()
+            assert client._client is None and not pooled.is_closed
+
+            client._async_client = pooled
+            await client.aclose()
+            return pooled
+
+        assert asyncio.run(close_both()).is_closed
+        asyncio.run(aclose_all())
+
+
+class TestProactiveThrottle:
+    """Tests for header-based throttling."""
+
+    def test_low_remaining_pauses_next_request(self):
+        """Test that a nearly exhausted rate limit delays the next call."""
+        client = make_client(lambda request: httpx.Response(
+            200,
+            json={},
+            headers={"X-Ratelimit-Remaining": "1", "X-Ratelimit-Limit": "60", "X-Ratelimit-Reset": "3"},
+        ))
+
+        client.get("/quote", provider_name="finnhub")
+        with patch("fingent.core.http.time.sleep") as sleep:
+            client.get("/quote", provider_name="finnhub")
+            client.get("/quote", provider_name="other")
+
+        sleep.assert_called_once()
+        assert 2 < sleep.call_args[0][0] <= 3
+
+    def test_parse_reset_formats(self):
+        """Test delta, duration and unparseable reset values."""
+        assert _parse_reset("12") == 12.0
+        assert _parse_reset("1m30s") == 90.0
+        assert _parse_reset("250ms") == 0.25
+        assert _parse_reset("soon") is None
+
+
+class TestResponseCache:
+    """Tests for the GET response cache."""
+
+    def test_cache_control_max_age_is_honored(self):
+        """Test that max-age responses are reused and no-store ones are not."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            cache_control = "max-age=60" if request.url.path == "/macro" else "no-store"
+            return httpx.Response(200, json={"path": request.url.path}, headers={"Cache-Control": cache_control})
+
+        client = make_client(handler)
+        client.cache_ttl = 30
+
+        assert client.get("/macro", params={"a": 1}) == client.get("/macro", params={"a": 1})
+        client.get("/macro", params={"a": 2})
+        client.get("/quote")
+        client.get("/quote")
+
+        assert calls == ["/macro", "/macro", "/quote", "/quote"]
+
+    def test_cache_off_ignores_max_age(self):
+        """Test that HTTP_CACHE_TTL=0 disables caching even with max-age."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"price": 1}, headers={"Cache-Control": "max-age=60"})
+
+        client = make_client(handler)
+        client.cache_ttl = 0
+
+        client.get("/quote")
+        client.get("/quote")
+
+        assert calls == ["/quote", "/quote"]
+
+    def test_cached_body_is_copied(self):
+        """Test that mutating a returned body does not leak into the cache."""
+        client = make_client(lambda request: httpx.Response(
+            200, json={"prices": [1]}, headers={"Cache-Control": "max-age=60"}
+        ))
+        client.cache_ttl = 30
+
+        first = client.get("/macro")
+        first["prices"].append(2)
+        second = client.get("/macro")
+        second["prices"].append(3)
+
+        assert client.get("/macro") == {"prices": [1]}
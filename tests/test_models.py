@@ -0,0 +1,125 @@
+"""Tests for domain models."""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from fingent.core.serialization import from_json, to_json_text
+from fingent.domain.models import CrossAssetSnapshot, MarketData, NewsItem
+from fingent.domain.signals import (
+    Signal,
+    _score_signals,
+    _score_signals_vectorized,
+    aggregate_signals,
+)
+
+
+class TestJsonSerializable:
+    """Tests for the JsonSerializable mixin."""
+
+    def test_to_dict_matches_asdict(self):
+        """Test that to_dict agrees with asdict for flat and nested models."""
+        news = NewsItem("Fed holds", "", "https://x/1", "2026-01-01T00:00:00Z", "wire", tickers=["SPY"])
+        snapshot = CrossAssetSnapshot(
+            timestamp="2026-01-01T00:00:00Z",
+            assets={"SPY": MarketData("SPY", "S&P 500", "us_equity", 500.0, "2026-01-01T00:00:00Z")},
+            risk_on_score=0.4,
+        )
+
+        assert news.to_dict() == asdict(news)
+        assert snapshot.to_dict() == asdict(snapshot)
+        assert CrossAssetSnapshot.from_dict(snapshot.to_dict()) == snapshot
+        partial = {"symbol": "SPY", "name": "S&P 500", "asset_type": "us_equity",
+                   "price": 500.0, "timestamp": "2026-01-01T00:00:00Z"}
+        assert MarketData.from_dict(partial) == snapshot.assets["SPY"]
+
+    def test_snapshot_to_dict_skips_asdict(self):
+        """Test that snapshot and asset dicts are built without dataclasses.asdict."""
+        snapshot = CrossAssetSnapshot(
+            timestamp="2026-01-01T00:00:00Z",
+            assets={
+                s: MarketData(s, s, "us_equity", 1.0, "2026-01-01T00:00:00Z", change_24h=0.01)
+                for s in ("SPY", "GLD", "TLT")
+            },
+        )
+        expected = asdict(snapshot)
+
+        with patch("fingent.core.serialization.asdict", side_effect=AssertionError):
+            assert snapshot.to_dict() == expected
+            assert snapshot.assets["GLD"].to_dict() == expected["assets"]["GLD"]
+
+    def test_to_dict_keeps_python_values(self):
+        """Test that to_dict keeps int keys, tuples, NaN and big ints like asdict."""
+        evidence = {1: (0.1, 0.2), "big": 2**70, "gap": float("nan")}
+        signal = Signal(id="s1", name="risk_on", direction="bullish", score=0.5, evidence=evidence)
+
+        data = signal.to_dict()["evidence"]
+
+        assert data[1] == (0.1, 0.2)
+        assert data["big"] == 2**70
+        assert np.isnan(data["gap"])
+
+    def test_numpy_values_serialize(self):
+        """Test that numpy scalars and arrays in evidence become plain JSON."""
+        signal = Signal(
+            id="s1",
+            name="risk_on",
+            direction="bullish",
+            score=np.float32(0.5),
+            evidence={"n": np.int64(3), "series": np.array([1.0, 2.0])},
+        )
+
+        data = json.loads(signal.to_json())
+
+        assert data["score"] == 0.5
+        assert data["evidence"] == {"n": 3, "series": [1.0, 2.0]}
+        assert signal.to_dict()["evidence"]["n"] == 3
+
+    def test_to_json_text_round_trips_state(self):
+        """Test that state text keeps numpy/dataclass values and stringifies the rest."""
+        state = {
+            "run_id": "r1",
+            "signals": [{"id": "s1", "score": np.float64(0.5), "evidence": {"n": np.array([1, 2])}}],
+            "market_data": {"assets": {"SPY": MarketData("SPY", "S&P 500", "us_equity", 500.0, "t")}},
+            "report": {"path": Path("reports/r1.md")},
+        }
+
+        data = from_json(to_json_text(state))
+
+        assert data["signals"][0] == {"id": "s1", "score": 0.5, "evidence": {"n": [1, 2]}}
+        assert data["market_data"]["assets"]["SPY"]["price"] == 500.0
+        assert data["report"]["path"] == str(Path("reports/r1.md"))
+
+    def test_models_are_slotted(self):
+        """Test that plain models carry no per-instance __dict__."""
+        news = NewsItem("Fed holds", "", "https://x/1", "2026-01-01T00:00:00Z", "wire")
+
+        assert not hasattr(news, "__dict__")
+        with pytest.raises(AttributeError):
+            news.extra = 1
+
+
+class TestAggregateSignals:
+    """Tests for aggregate_signals."""
+
+    def test_vectorized_path_matches_scalar(self):
+        """Test that large batches aggregate the same as the scalar path."""
+        rng = np.random.default_rng(7)
+        signals = [
+            {"id": f"s{i}", "score": round(float(x), 1), "confidence": round(float(c), 1)}
+            for i, (x, c) in enumerate(zip(rng.uniform(-1, 1, 40), rng.uniform(0, 1, 40)))
+        ]
+
+        vectorized = _score_signals_vectorized(signals)
+        scalar = _score_signals(signals)
+
+        assert vectorized[0] == pytest.approx(scalar[0])
+        assert vectorized[1:] == scalar[1:]
+        assert aggregate_signals(signals)["key_signals"] == scalar[2]
+        assert scalar[2] == sorted(
+            scalar[1], key=lambda x: abs(x["score"]) * x["confidence"], reverse=True
+        )[:5]
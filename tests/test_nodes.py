@@ -1,11 +1,24 @@
 """Tests for LangGraph nodes."""
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, call, patch
 
 from fingent.nodes.base import BaseNode
 from fingent.nodes.bootstrap import BootstrapNode
-from fingent.graph.state import create_initial_state
+from fingent.nodes.cross_asset import CrossAssetNode
+from fingent.core.config import reload_config
+from fingent.graph.builder import (
+    WorkflowBuilder,
+    arun_workflow,
+    create_default_workflow,
+    run_workflow,
+)
+from fingent.graph.registry import NodeRegistry, get_default_registries
+from fingent.graph.state import create_initial_state, merge_state
 
 
 class TestBootstrapNode:
@@ -75,6 +88,53 @@ class TestBaseNode:
         assert result["errors"][0]["node"] == "failing"
         assert "Test error" in result["errors"][0]["error"]
 
+    def test_errors_share_run_timestamp(self):
+        """Test that errors recorded in one run reuse its start timestamp."""
+
+        class ErrorNode(BaseNode):
+            node_name = "errors"
+
+            def run(self, state):
+                return {"errors": [self.create_error("a"), self.create_error("b")]}
+
+        node = ErrorNode()
+        times = iter(["t1", "t2", "t3", "t4"])
+
+        with patch("fingent.nodes.base.format_timestamp", side_effect=lambda dt: next(times)):
+            errors = node.safe_run({})["errors"]
+            outside = node.create_error("c")
+
+        assert [e["timestamp"] for e in errors] == ["t1", "t1"]
+        assert outside["timestamp"] == "t2"
+
+    def test_overlapping_runs_keep_own_timestamp(self):
+        """Test that runs sharing one node instance do not clobber each other's timestamp."""
+        barrier = threading.Barrier(2)
+
+        class SlowNode(BaseNode):
+            node_name = "slow"
+
+            def run(self, state):
+                first = self.create_error("a")
+                barrier.wait(timeout=5)
+                return {"errors": [first, self.create_error("b")]}
+
+        node = SlowNode(settings=Mock(), config={"x": 1})
+        times = iter(f"t{i}" for i in range(10))
+        lock = threading.Lock()
+
+        def stamp(dt):
+            with lock:
+                return next(times)
+
+        with patch("fingent.nodes.base.format_timestamp", side_effect=stamp):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                runs = list(executor.map(node.safe_run, [{}, {}]))
+
+        stamps = [[e["timestamp"] for e in run["errors"]] for run in runs]
+        assert all(a == b for a, b in stamps)
+        assert stamps[0][0] != stamps[1][0]
+
     def test_merge_signals_deduplicates(self):
         """Test that merge_signals removes duplicates by ID."""
 
@@ -99,6 +159,127 @@ class TestBaseNode:
         assert result[1]["name"] == "test2"
 
 
+class TestWorkflowBuilder:
+    """Tests for WorkflowBuilder."""
+
+    def test_workflow_runs_sync_and_async(self):
+        """Test that built workflows support invoke() and ainvoke()."""
+        settings = Mock()
+        settings.timezone = "America/New_York"
+        registry = NodeRegistry(settings, config={"x": 1}, provider_registry=Mock())
+        registry.register("bootstrap", BootstrapNode)
+        builder = WorkflowBuilder(provider_registry=Mock(), node_registry=registry)
+        workflow = builder.add_node("bootstrap").set_entry_point("bootstrap").add_edge(
+            "bootstrap", "END"
+        ).build()
+
+        sync_state = run_workflow(workflow, create_initial_state())
+        async_state = asyncio.run(arun_workflow(workflow, create_initial_state()))
+
+        assert sync_state["run_id"].startswith("run_")
+        assert async_state["run_id"].startswith("run_")
+
+    def test_default_workflows_share_node_instances(self):
+        """Test that default workflow builds reuse nodes until the config is reloaded."""
+        created = []
+        create = NodeRegistry.create
+
+        def spy(registry, name, **kwargs):
+            node = create(registry, name, **kwargs)
+            created.append(node)
+            return node
+
+        get_default_registries.cache_clear()
+        try:
+            with patch.object(NodeRegistry, "create", spy):
+                create_default_workflow()
+                create_default_workflow()
+                reload_config()
+                create_default_workflow()
+        finally:
+            get_default_registries.cache_clear()
+
+        first, second, reloaded = created[:5], created[5:10], created[10:]
+        assert all(a is b for a, b in zip(first, second))
+        assert not any(a is b for a, b in zip(first, reloaded))
+
+
+class TestCrossAssetNode:
+    """Tests for CrossAssetNode."""
+
+    def test_fetch_market_data_keeps_symbol_order(self):
+        """Test that concurrent fetches land in symbol order with per-symbol errors."""
+        def make_provider(missing):
+            provider = Mock()
+            provider.name = "finnhub"
+
+            def get_quote(symbol):
+                if symbol in missing:
+                    raise RuntimeError(f"{symbol} unavailable")
+                return Mock(price=20.0, to_dict=Mock(return_value={"symbol": symbol}))
+
+            provider.get_quote.side_effect = get_quote
+            provider.calculate_price_changes.side_effect = lambda s: {"change_24h": 0.01}
+            return provider
+
+        # Same provider name twice: the fallback must still be tracked separately
+        primary = make_provider({"QQQ", "TLT"})
+        fallback = make_provider({"TLT"})
+        okx = Mock()
+        okx.get_tickers.return_value = {
+            s: Mock(to_dict=Mock(return_value={"symbol": s})) for s in ("BTC-USDT", "ETH-USDT")
+        }
+        okx.calculate_price_changes.side_effect = lambda s: {"change_7d": 0.02}
+        node = CrossAssetNode(
+            settings=Mock(), config={"x": 1}, finnhub_provider=primary,
+            polygon_provider=Mock(), okx_provider=okx,
+        )
+        node._get_quote_provider = Mock(side_effect=[primary, fallback])
+        errors = []
+
+        market_data = node._fetch_market_data(errors)
+
+        assert list(market_data["assets"]) == ["SPY", "QQQ", "GLD", "VIX", "BTC-USDT", "ETH-USDT"]
+        assert market_data["vix_level"] == 20.0
+        assert market_data["changes"]["BTC-USDT"] == {"change_7d": 0.02}
+        assert market_data["changes"]["QQQ"] == {"change_24h": 0.01}
+        assert "VIX" not in market_data["changes"]
+        assert [e["error"] for e in errors] == ["Equity fetch failed (TLT): TLT unavailable"]
+        fallback.get_quote.assert_has_calls([call("QQQ"), call("TLT")], any_order=True)
+        fallback.calculate_price_changes.assert_called_once_with("QQQ")
+        primary.get_quotes.assert_not_called()
+
+    @pytest.mark.parametrize("vix, name, score", [
+        (14.9, "vix_calm", 0.4),
+        (15, "vix_normal", 0),
+        (25, "vix_elevated", 0.5),
+        (40, "vix_spike", 1.0),
+    ])
+    def test_vix_bands(self, vix, name, score):
+        """Test that VIX band lower bounds are inclusive."""
+        node = CrossAssetNode(
+            settings=Mock(), config={"x": 1}, finnhub_provider=Mock(),
+            polygon_provider=Mock(), okx_provider=Mock(),
+        )
+
+        signal = node._analyze_vix(vix, node._signal_factory("run_1"))
+
+        assert (signal["name"], signal["score"]) == (name, score)
+
+    def test_risk_ladder_bounds(self):
+        """Test that a change exactly on a bound scores in the lower bucket."""
+        node = CrossAssetNode(
+            settings=Mock(), config={"x": 1}, finnhub_provider=Mock(),
+            polygon_provider=Mock(), okx_provider=Mock(),
+        )
+        signal = node._analyze_risk_sentiment(
+            0.015, -0.01, None, node._signal_factory("run_1")
+        )
+
+        # SPY +1 (not +1.5), BTC -0.3 (not -1)
+        assert signal["score"] == pytest.approx(0.7 / 3)
+
+
 class TestGraphState:
     """Tests for GraphState."""
 
@@ -110,3 +291,52 @@ class TestGraphState:
         assert state["signals"] == []
         assert state["alerts"] == []
         assert state["errors"] == []
+
+    def test_merge_state_dedups_by_id(self):
+        """Test that merges dedup by id across calls and keep state JSON-only."""
+        initial = create_initial_state()
+        first = merge_state(initial, {"signals": [{"id": "a"}, {"id": "b"}]})
+        state = merge_state(first, {"signals": ({"id": "b"}, {"id": "c"}), "run_id": "r1"})
+
+        assert [s["id"] for s in state["signals"]] == ["a", "b", "c"]
+        assert state is not first and first["run_id"] == ""
+        assert state["run_id"] == "r1"
+        assert not any(key.startswith("_") for key in state)
+
+    def test_merge_state_keeps_items_without_id(self):
+        """Test that id-less items are never deduplicated away."""
+        state = create_initial_state()
+        errors = [{"node": "a", "error": "x"}, {"node": "b", "error": "y"}]
+
+        state = merge_state(state, {"errors": errors[:1]})
+        state = merge_state(state, {"errors": errors[1:], "signals": [{"id": "s"}]})
+        state = merge_state(state, {"signals": [{"id": "s"}, "raw"]})
+
+        assert state["errors"] == errors
+        assert state["signals"] == [{"id": "s"}, "raw"]
+
+
+class TestNodeRegistry:
+    """Tests for NodeRegistry."""
+
+    def test_string_spec_is_imported_on_create(self):
+        """Test that a "module:Class" spec resolves on first create."""
+        settings = Mock()
+        settings.timezone = "America/New_York"
+        registry = NodeRegistry(settings, config={}, provider_registry=Mock())
+        registry.register("bootstrap", "fingent.nodes.bootstrap:BootstrapNode")
+
+        node = registry.create("bootstrap")
+
+        assert isinstance(node, BootstrapNode)
+        assert registry._nodes["bootstrap"] is BootstrapNode
+        assert registry.create("bootstrap") is node
+        assert registry.create("bootstrap", config={"x": 1}) is not node
+
+        registry.clear_instances()
+        assert registry.create("bootstrap") is not node
+
+        registry.freeze()
+        assert registry.create("bootstrap") is registry.create("bootstrap")
+        with pytest.raises(RuntimeError):
+            registry.register("other", BootstrapNode)
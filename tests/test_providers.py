@@ -4,7 +4,10 @@ import pytest
 from unittest.mock import Mock, patch
 
 from fingent.providers.base import BaseProvider, HealthCheckResult, ProviderStatus
+from fingent.providers.finnhub import FinnhubProvider
 from fingent.providers.fred import FREDProvider
+from fingent.providers.polymarket import PolymarketProvider
+from fingent.domain.models import PolymarketMarket
 
 
 class TestBaseProvider:
@@ -78,3 +81,48 @@ class TestFREDProvider:
         spread = long_rate - short_rate
 
         assert spread == -0.5  # Inverted curve
+
+
+class TestFinnhubProvider:
+    """Tests for FinnhubProvider."""
+
+    @pytest.mark.parametrize("has_session", [True, False])
+    @patch("fingent.providers.finnhub.finnhub.Client")
+    def test_initialize_pools_session_when_present(self, mock_client_class, has_session):
+        """Test that the keep-alive adapter is mounted only if the SDK exposes _session."""
+        client = Mock(spec=["quote"] + (["_session"] if has_session else []))
+        mock_client_class.return_value = client
+        provider = FinnhubProvider(settings=Mock(finnhub_api_key="key"), cache=Mock())
+
+        provider._initialize()
+
+        assert provider._client is client
+        if has_session:
+            client._session.mount.assert_called_once()
+
+
+class TestPolymarketProvider:
+    """Tests for PolymarketProvider."""
+
+    def test_get_markets_for_arb_cached(self):
+        """Test that repeated keyword sets reuse the market search."""
+        settings = Mock()
+        settings.polymarket_enabled = True
+        settings.http_timeout = 30
+        settings.cache_ttl = 3600
+        provider = PolymarketProvider(settings=settings)
+        provider._enabled = True
+        provider.search_markets_by_keyword = Mock(return_value=[
+            PolymarketMarket(market_id=f"m{d}", event_id="evt", question="q", volume=5000, tenor_days=d)
+            for d in (7, 90)
+        ])
+
+        first = provider.get_markets_for_arb(["fed", "rate"], min_volume=1000)
+        second = provider.get_markets_for_arb(["rate", "fed"], min_volume=1000)
+
+        assert first == second
+        assert len(first["evt"]) == 2
+        provider.search_markets_by_keyword.assert_called_once()
+
+        provider.get_markets_for_arb(["fed", "rate"], min_volume=10000)
+        assert provider.search_markets_by_keyword.call_count == 2
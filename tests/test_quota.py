@@ -0,0 +1,38 @@
+"""Tests for provider quota tracking."""
+
+from unittest.mock import patch
+
+from fingent.core.quota import QuotaManager
+
+
+def make_manager(**limits) -> QuotaManager:
+    """Create a QuotaManager with limits for a single provider."""
+    return QuotaManager({"usage_mode": {"enabled": True, "quotas": {"fred": limits}}})
+
+
+class TestQuotaManager:
+    """Tests for QuotaManager."""
+
+    def test_per_minute_window_resets(self):
+        """Test that usage is limited within a minute and restarts in the next."""
+        quota = make_manager(per_minute=2, per_day=10)
+
+        with patch("fingent.core.quota.time.time", return_value=120.0):
+            assert quota.check_and_consume("fred").allowed
+            assert quota.check_and_consume("fred").allowed
+            result = quota.check_and_consume("fred")
+            assert not result.allowed
+            assert result.reason == "per_minute quota exceeded"
+
+        with patch("fingent.core.quota.time.time", return_value=180.0):
+            assert quota.check_and_consume("fred").allowed
+            assert quota.get_usage("fred") == {"per_minute": 1, "per_day": 3}
+
+    def test_per_day_limit_and_unlisted_provider(self):
+        """Test the daily limit and that unlisted providers are unlimited."""
+        quota = make_manager(per_day=1)
+
+        with patch("fingent.core.quota.time.time", return_value=1000.0):
+            assert quota.check_and_consume("fred").allowed
+            assert not quota.check_and_consume("fred").allowed
+            assert quota.check_and_consume("finnhub").allowed
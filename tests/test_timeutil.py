@@ -0,0 +1,33 @@
+"""Tests for time utilities."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from fingent.core.timeutil import format_timestamp, is_market_hours
+
+
+class TestFormatTimestamp:
+    """Tests for format_timestamp."""
+
+    @pytest.mark.parametrize("fmt, strftime_fmt", [
+        ("iso", "%Y-%m-%dT%H:%M:%SZ"),
+        ("log", "%Y-%m-%d %H:%M:%S.%f"),
+        ("date", "%Y-%m-%d"),
+    ])
+    def test_fast_paths_match_strftime(self, fmt, strftime_fmt):
+        """Test that fast-path formats match their strftime equivalents."""
+        dt = datetime(2026, 3, 4, 5, 6, 7, 89, tzinfo=timezone.utc)
+
+        assert format_timestamp(dt, fmt) == dt.strftime(strftime_fmt)
+
+
+class TestMarketHours:
+    """Tests for is_market_hours."""
+
+    def test_market_hours_across_dst(self):
+        """Test the 9:30 ET open in both winter and summer."""
+        assert is_market_hours(datetime(2026, 1, 5, 14, 30, tzinfo=timezone.utc))
+        assert not is_market_hours(datetime(2026, 7, 6, 13, 0, tzinfo=timezone.utc))
+        assert is_market_hours(datetime(2026, 7, 6, 13, 30, tzinfo=timezone.utc))
+        assert not is_market_hours(datetime(2026, 7, 4, 15, 0, tzinfo=timezone.utc))